@@ -5,15 +5,22 @@ from __future__ import annotations
 import importlib
 from typing import Any
 
-__all__ = ["TemplateFiller", "SmartFiller", "PDFDiffTool", "DiffResult"]
+__all__ = [
+    "TemplateFiller",
+    "SmartFiller",
+    "get_template_filler",
+    "PDFDiffTool",
+    "DiffResult",
+    "get_diff_tool",
+]
 
 
 def __getattr__(name: str) -> Any:
     """Provide lazy access to submodules to avoid heavy imports at startup."""
-    if name in {"TemplateFiller", "SmartFiller"}:
+    if name in {"TemplateFiller", "SmartFiller", "get_template_filler"}:
         module = importlib.import_module(".template_filler", __name__)
         return getattr(module, name)
-    if name in {"PDFDiffTool", "DiffResult"}:
+    if name in {"PDFDiffTool", "DiffResult", "get_diff_tool"}:
         module = importlib.import_module(".pdf_diff_tool", __name__)
         return getattr(module, name)
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -9,8 +9,7 @@ import difflib
 import html
 import importlib
 import re
-
-import fitz
+import threading
 
 
 @dataclass(slots=True)
@@ -68,6 +67,9 @@ class PDFDiffTool:
                     )
                     all_text.append(text)
         else:
+            # PyMuPDF is only needed when pdfplumber is missing
+            import fitz
+
             with fitz.open(str(path)) as doc:
                 result["page_count"] = doc.page_count
                 metadata = doc.metadata or {}
@@ -119,25 +121,28 @@ class PDFDiffTool:
 
         modified_pairs: List[Tuple[str, str]] = []
         remaining_deleted: List[str] = []
-        used_added: set[int] = set()
+        # Indexes into added_lines that have not been paired yet, in order
+        unmatched: List[int] = list(range(len(added_lines)))
 
         for old_line in deleted_lines:
-            best_index: int | None = None
+            best_pos: int | None = None
             best_ratio = 0.0
-            for idx, new_line in enumerate(added_lines):
-                if idx in used_added:
+            for pos, idx in enumerate(unmatched):
+                pair_matcher = difflib.SequenceMatcher(None, old_line, added_lines[idx])
+                # Cheap upper bounds first; they can only rule a candidate out
+                floor = max(best_ratio, 0.6)
+                if pair_matcher.real_quick_ratio() < floor or pair_matcher.quick_ratio() < floor:
                     continue
-                ratio = difflib.SequenceMatcher(None, old_line, new_line).ratio()
+                ratio = pair_matcher.ratio()
                 if ratio > best_ratio:
                     best_ratio = ratio
-                    best_index = idx
-            if best_index is not None and best_ratio >= 0.6:
-                modified_pairs.append((old_line, added_lines[best_index]))
-                used_added.add(best_index)
+                    best_pos = pos
+            if best_pos is not None and best_ratio >= 0.6:
+                modified_pairs.append((old_line, added_lines[unmatched.pop(best_pos)]))
             else:
                 remaining_deleted.append(old_line)
 
-        remaining_added = [line for idx, line in enumerate(added_lines) if idx not in used_added]
+        remaining_added = [added_lines[idx] for idx in unmatched]
 
         key_changes = self._extract_key_changes(text1, text2)
         similarity = difflib.SequenceMatcher(None, text1, text2).ratio() * 100
@@ -242,3 +247,16 @@ class PDFDiffTool:
         path.write_text(html_content, encoding="utf-8")
         return path
 
+
+_shared_tool: PDFDiffTool | None = None
+_shared_tool_lock = threading.Lock()
+
+
+def get_diff_tool() -> PDFDiffTool:
+    """Return the process-wide :class:`PDFDiffTool`, creating it on first use."""
+    global _shared_tool
+    if _shared_tool is None:
+        with _shared_tool_lock:
+            if _shared_tool is None:
+                _shared_tool = PDFDiffTool()
+    return _shared_tool
@@ -8,11 +8,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 import json
 import re
+import threading
 import zipfile
 from xml.etree import ElementTree as ET
 
-import fitz
-
 _PLACEHOLDER_PATTERN = re.compile(r"{{\s*([^{}]+?)\s*}}")
 _W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 _XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
@@ -169,6 +168,9 @@ class TemplateFiller:
         if not path.is_file():
             raise FileNotFoundError(f"Template not found: {path}")
 
+        # PyMuPDF is only needed for PDF forms, not DOCX templates
+        import fitz
+
         doc = fitz.open(str(path))
         has_widgets = False
 
@@ -259,3 +261,20 @@ class SmartFiller:
 
         return None
 
+
+_shared_filler: TemplateFiller | None = None
+_shared_filler_lock = threading.Lock()
+
+
+def get_template_filler() -> TemplateFiller:
+    """Return the process-wide :class:`TemplateFiller`, creating it on first use.
+
+    Creating a filler makes its working directories and parses
+    ``clients.json``; sharing one instance does that once per process.
+    """
+    global _shared_filler
+    if _shared_filler is None:
+        with _shared_filler_lock:
+            if _shared_filler is None:
+                _shared_filler = TemplateFiller()
+    return _shared_filler
@@ -0,0 +1,30 @@
+"""Feature dialogs for the PDF Toolkit GUI."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Dialog class -> submodule; each submodule is imported on first access
+_LAZY = {
+    "MergeDialog": ".merge_dialog",
+    "SplitDialog": ".split_dialog",
+    "InfoDialog": ".info_dialog",
+    "DeleteDialog": ".delete_dialog",
+    "RotateDialog": ".rotate_dialog",
+    "WatermarkDialog": ".watermark_dialog",
+    "OptimizeDialog": ".optimize_dialog",
+    "OCRDialog": ".ocr_dialog",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """Provide lazy access to dialog classes to avoid heavy imports at startup."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
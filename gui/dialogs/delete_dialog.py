@@ -5,16 +5,13 @@ Delete pages dialog for removing specific pages from PDF.
 import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
-import fitz  # PyMuPDF
 
+from gui.widgets.input_file_frame import InputFileFrame
 from gui.widgets.progress_dialog import ProgressDialog
 from gui.workers.pdf_worker import PDFWorker
 from gui.utils.theme import COLORS, FONTS, SPACING
 from gui.utils.icons import get_icon
-from gui.utils.helpers import (
-    select_pdf_file, select_save_file,
-    show_success, show_error
-)
+from gui.utils.helpers import select_save_file, show_success, show_error
 
 
 class DeleteDialog(tk.Frame):
@@ -32,8 +29,6 @@ class DeleteDialog(tk.Frame):
         """
         super().__init__(parent, bg=COLORS["bg_secondary"])
         self.main_window = main_window
-        self.input_file = None
-        self.page_count = 0
 
         self._setup_ui()
 
@@ -60,58 +55,10 @@ class DeleteDialog(tk.Frame):
         desc_label.pack(pady=(0, SPACING["medium"]))
 
         # Input file selection
-        input_frame = tk.LabelFrame(
-            self,
-            text="Source File",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        input_frame.pack(fill=tk.X, pady=SPACING["medium"])
-
-        input_select_frame = tk.Frame(input_frame, bg=COLORS["bg_secondary"])
-        input_select_frame.pack(fill=tk.X)
-
-        self.input_entry = tk.Entry(
-            input_select_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"],
-            state="readonly"
-        )
-        self.input_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, SPACING["small"]))
-
-        browse_btn = tk.Button(
-            input_select_frame,
-            text=f"{get_icon('folder')} Select File",
-            command=self._select_input_file,
-            bg=COLORS["accent"],
-            fg="white",
-            font=FONTS["button"],
-            padx=15,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2"
-        )
-        browse_btn.pack(side=tk.LEFT)
-
-        # File info label
-        self.file_info_label = tk.Label(
-            input_frame,
-            text="No file selected",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"],
-            anchor=tk.W
+        self.source = InputFileFrame(
+            self, on_file_loaded=self._on_file_loaded, on_cleared=self._update_start_button
         )
-        self.file_info_label.pack(fill=tk.X, pady=(SPACING["small"], 0))
+        self.source.pack(fill=tk.X, pady=SPACING["medium"])
 
         # Pages to delete
         delete_frame = tk.LabelFrame(
@@ -258,42 +205,15 @@ class DeleteDialog(tk.Frame):
         )
         reset_btn.pack(side=tk.RIGHT, padx=SPACING["small"])
 
-    def _select_input_file(self) -> None:
-        """Select input PDF file."""
-        filepath = select_pdf_file()
-        if not filepath:
-            return
+    def _on_file_loaded(self, filepath: str, page_count: int) -> None:
+        """Fill in dialog defaults for a newly loaded source file."""
+        # Set default output
+        if not self.output_entry.get():
+            path = self.source.input_path
+            default_output = str(path.parent / f"{path.stem}_deleted.pdf")
+            self.output_entry.insert(0, default_output)
 
-        self.input_file = filepath
-        self.input_entry.config(state=tk.NORMAL)
-        self.input_entry.delete(0, tk.END)
-        self.input_entry.insert(0, filepath)
-        self.input_entry.config(state="readonly")
-
-        # Get page count
-        try:
-            doc = fitz.open(filepath)
-            self.page_count = doc.page_count
-            doc.close()
-
-            self.file_info_label.config(
-                text=f"{get_icon('success')} File loaded: {self.page_count} pages",
-                fg=COLORS["success"]
-            )
-
-            # Set default output
-            if not self.output_entry.get():
-                path = Path(filepath)
-                default_output = str(path.parent / f"{path.stem}_deleted.pdf")
-                self.output_entry.insert(0, default_output)
-
-            self._update_start_button()
-
-        except Exception as e:
-            show_error("Error", f"Cannot read PDF file:\n{str(e)}")
-            self.input_file = None
-            self.page_count = 0
-            self.file_info_label.config(text="File read failed", fg=COLORS["error"])
+        self._update_start_button()
 
     def _select_output_file(self) -> None:
         """Select output file."""
@@ -306,7 +226,7 @@ class DeleteDialog(tk.Frame):
 
     def _update_start_button(self) -> None:
         """Update start button state."""
-        has_input = self.input_file is not None
+        has_input = self.source.input_file is not None and self.source.page_count > 0
         has_pages = len(self.pages_entry.get().strip()) > 0
         has_output = len(self.output_entry.get().strip()) > 0
         self.start_btn.config(
@@ -315,7 +235,7 @@ class DeleteDialog(tk.Frame):
 
     def _start_delete(self) -> None:
         """Start delete operation."""
-        if not self.input_file:
+        if not self.source.input_file:
             show_error("Error", "Please select a PDF file")
             return
 
@@ -351,7 +271,7 @@ class DeleteDialog(tk.Frame):
         worker = PDFWorker(
             operation="delete",
             params={
-                "input_pdf": self.input_file,
+                "input_pdf": self.source.input_file,
                 "output_pdf": output,
                 "page_spec": pages_str
             },
@@ -362,13 +282,8 @@ class DeleteDialog(tk.Frame):
 
     def _reset(self) -> None:
         """Reset all fields."""
-        self.input_file = None
-        self.page_count = 0
-        self.input_entry.config(state=tk.NORMAL)
-        self.input_entry.delete(0, tk.END)
-        self.input_entry.config(state="readonly")
+        self.source.reset()
         self.pages_entry.delete(0, tk.END)
         self.output_entry.delete(0, tk.END)
-        self.file_info_label.config(text="No file selected", fg=COLORS["text_secondary"])
         self._update_start_button()
         self.main_window.show_message("Reset", "info")
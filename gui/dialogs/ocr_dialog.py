@@ -2,20 +2,31 @@
 OCR dialog for extracting text from scanned PDFs.
 """
 
+import os
+import queue
 import tkinter as tk
+from functools import partial
 from tkinter import ttk, filedialog
 from pathlib import Path
-import fitz  # PyMuPDF
+
+try:
+    import psutil
+except ImportError:  # optional: only used for the memory check
+    psutil = None
 
 from gui.widgets.progress_dialog import ProgressDialog
 from gui.workers.pdf_worker import PDFWorker
 from gui.utils.theme import COLORS, FONTS, SPACING
 from gui.utils.icons import get_icon
 from gui.utils.helpers import (
-    select_pdf_file, show_success, show_error, show_warning
+    select_pdf_file, show_success, show_error, show_warning, get_pdf_page_count,
+    run_in_background
 )
 
 
+_LABEL_BROWSE = f"{get_icon('folder')} Browse"
+
+
 class OCRDialog(tk.Frame):
     """
     Dialog for OCR text extraction from scanned PDFs.
@@ -37,6 +48,28 @@ class OCRDialog(tk.Frame):
         ("Italian", "ita"),
     ]
 
+    # Save dialog file type per output format
+    OUTPUT_FILETYPES = {
+        "docx": ("Word Document", "*.docx"),
+        "odt": ("LibreOffice Document", "*.odt"),
+        "txt": ("Text File", "*.txt"),
+    }
+
+    # Progress events are queued by the worker and applied on this Tk timer
+    PROGRESS_POLL_MS = 50
+    PROGRESS_BATCH = 64
+    MAX_PENDING_PROGRESS = 2000
+    # Backlog water marks: poll faster (with bigger batches) when events pile
+    # up, slower when the queue is nearly idle
+    PROGRESS_HIGH_WATER = 256
+    PROGRESS_LOW_WATER = 8
+    PROGRESS_FAST_MS = 20
+    PROGRESS_SLOW_MS = 100
+
+    # Supported render resolution range
+    MIN_DPI = 150
+    MAX_DPI = 600
+
     def __init__(self, parent, main_window):
         """
         Initialize OCR dialog.
@@ -49,6 +82,10 @@ class OCRDialog(tk.Frame):
         self.main_window = main_window
         self.input_file = None
         self.page_count = 0
+        self._progress_q = queue.SimpleQueue()
+        self._progress = None
+        self._worker = None
+        self._last_pct = -1
 
         self._setup_ui()
 
@@ -200,6 +237,41 @@ class OCRDialog(tk.Frame):
             fg=COLORS["text_secondary"]
         ).pack(side=tk.LEFT, padx=SPACING["small"])
 
+        # Parallel jobs
+        jobs_frame = tk.Frame(settings_frame, bg=COLORS["bg_secondary"])
+        jobs_frame.pack(fill=tk.X, pady=SPACING["small"])
+
+        tk.Label(
+            jobs_frame,
+            text="Parallel Jobs:",
+            font=FONTS["default"],
+            bg=COLORS["bg_secondary"],
+            fg=COLORS["text_primary"],
+            width=12,
+            anchor=tk.W
+        ).pack(side=tk.LEFT)
+
+        cpu_count = os.cpu_count() or 2
+        self.jobs_var = tk.IntVar(value=max(1, cpu_count // 2))
+        jobs_spin = tk.Spinbox(
+            jobs_frame,
+            from_=1,
+            to=cpu_count,
+            textvariable=self.jobs_var,
+            state="readonly",
+            font=FONTS["default"],
+            width=5
+        )
+        jobs_spin.pack(side=tk.LEFT, padx=SPACING["small"])
+
+        tk.Label(
+            jobs_frame,
+            text="(More = faster but uses more memory)",
+            font=("Arial", 9),
+            bg=COLORS["bg_secondary"],
+            fg=COLORS["text_secondary"]
+        ).pack(side=tk.LEFT, padx=SPACING["small"])
+
         # Output formats
         output_frame = tk.LabelFrame(
             self,
@@ -246,8 +318,8 @@ class OCRDialog(tk.Frame):
 
         docx_browse = tk.Button(
             docx_path_frame,
-            text=f"{get_icon('folder')} Browse",
-            command=lambda: self._select_output_file("docx"),
+            text=_LABEL_BROWSE,
+            command=partial(self._select_output_file, "docx"),
             bg=COLORS["border"],
             fg=COLORS["text_primary"],
             font=FONTS["button"],
@@ -293,8 +365,8 @@ class OCRDialog(tk.Frame):
 
         odt_browse = tk.Button(
             odt_path_frame,
-            text=f"{get_icon('folder')} Browse",
-            command=lambda: self._select_output_file("odt"),
+            text=_LABEL_BROWSE,
+            command=partial(self._select_output_file, "odt"),
             bg=COLORS["border"],
             fg=COLORS["text_primary"],
             font=FONTS["button"],
@@ -342,8 +414,8 @@ class OCRDialog(tk.Frame):
 
         txt_browse = tk.Button(
             txt_path_frame,
-            text=f"{get_icon('folder')} Browse",
-            command=lambda: self._select_output_file("txt"),
+            text=_LABEL_BROWSE,
+            command=partial(self._select_output_file, "txt"),
             bg=COLORS["border"],
             fg=COLORS["text_primary"],
             font=FONTS["button"],
@@ -417,42 +489,54 @@ class OCRDialog(tk.Frame):
         self.input_entry.insert(0, filepath)
         self.input_entry.config(state="readonly")
 
-        # Get page count
-        try:
-            doc = fitz.open(filepath)
-            self.page_count = doc.page_count
-            doc.close()
-            self.file_info_label.config(
-                text=f"{self.page_count} page(s) - Ready for OCR",
-                fg=COLORS["text_primary"]
-            )
-        except Exception as e:
-            self.file_info_label.config(
-                text=f"Error reading file: {e}",
-                fg="red"
-            )
-            self.input_file = None
+        # Read the page count off the Tk thread
+        self.page_count = 0
+        self.file_info_label.config(text="Reading file...", fg=COLORS["text_secondary"])
+        self._update_start_button()
+        run_in_background(
+            self,
+            get_pdf_page_count,
+            (filepath,),
+            on_done=partial(self._probe_done, filepath),
+            on_error=partial(self._probe_failed, filepath)
+        )
+
+    def _probe_done(self, filepath: str, page_count: int) -> None:
+        """Show the probed page count and fill in the default output path."""
+        if filepath != self.input_file:
+            # A newer selection superseded this probe
+            return
+
+        self.page_count = page_count
+        self.file_info_label.config(
+            text=f"{page_count} page(s) - Ready for OCR",
+            fg=COLORS["text_primary"]
+        )
 
         # Auto-populate output paths
-        if self.input_file:
-            base_path = Path(filepath).stem
-            parent_dir = Path(filepath).parent
+        path = Path(filepath)
+        if self.docx_var.get() and not self.docx_entry.get():
+            self.docx_entry.delete(0, tk.END)
+            self.docx_entry.insert(0, str(path.parent / f"{path.stem}_ocr.docx"))
 
-            if self.docx_var.get() and not self.docx_entry.get():
-                self.docx_entry.delete(0, tk.END)
-                self.docx_entry.insert(0, str(parent_dir / f"{base_path}_ocr.docx"))
+        self._update_start_button()
+
+    def _probe_failed(self, filepath: str, error: Exception) -> None:
+        """Report a file that could not be read."""
+        if filepath != self.input_file:
+            return
 
+        self.file_info_label.config(
+            text=f"Error reading file: {error}",
+            fg="red"
+        )
+        self.input_file = None
+        self.page_count = 0
         self._update_start_button()
 
     def _select_output_file(self, format_type: str) -> None:
         """Select output file for specific format."""
-        extensions = {
-            "docx": ("Word Document", "*.docx"),
-            "odt": ("LibreOffice Document", "*.odt"),
-            "txt": ("Text File", "*.txt")
-        }
-
-        filetypes = [extensions[format_type], ("All Files", "*.*")]
+        filetypes = [self.OUTPUT_FILETYPES[format_type], ("All Files", "*.*")]
 
         filepath = filedialog.asksaveasfilename(
             title=f"Save {format_type.upper()} Output",
@@ -494,7 +578,7 @@ class OCRDialog(tk.Frame):
 
     def _update_start_button(self) -> None:
         """Update start button state."""
-        has_input = self.input_file is not None
+        has_input = self.input_file is not None and self.page_count > 0
         has_output = False
 
         # Check if at least one format is selected with a path
@@ -528,11 +612,25 @@ class OCRDialog(tk.Frame):
             show_error("Error", "Please select at least one output format")
             return
 
+        dpi = max(self.MIN_DPI, min(self.MAX_DPI, int(self.dpi_var.get())))
+        jobs = max(1, int(self.jobs_var.get()))
+
+        needed = self._estimate_ocr_memory(dpi, jobs)
+        if psutil is not None and needed > psutil.virtual_memory().available * 0.6:
+            show_error(
+                "Not Enough Memory",
+                f"OCR at {dpi} DPI with {jobs} parallel job(s) may need about "
+                f"{needed / (1024 ** 3):.1f} GB of memory.\n\n"
+                "Please lower the DPI or the number of parallel jobs."
+            )
+            return
+
         # Collect output paths
         params = {
             "input_pdf": self.input_file,
             "language": self._get_language_code(),
-            "dpi": self.dpi_var.get()
+            "dpi": dpi,
+            "jobs": jobs
         }
 
         if self.docx_var.get():
@@ -554,16 +652,9 @@ class OCRDialog(tk.Frame):
         progress = ProgressDialog(self, title="OCR Processing")
         progress.update_status(f"Starting OCR on {self.page_count} page(s)...", "Initializing...")
         progress.set_progress(0)
-
-        # Progress callback for real-time updates
-        def on_progress(current, total, message):
-            """Update progress dialog with current page."""
-            percent = (current / total) * 100
-            progress.set_progress(percent)
-            progress.update_status(
-                f"OCR Processing: Page {current} of {total}",
-                f"Progress: {percent:.1f}% - This may take a while..."
-            )
+        self._progress = progress
+        self._progress_q = queue.SimpleQueue()
+        self._last_pct = -1
 
         # Start worker thread
         def on_complete(result):
@@ -587,14 +678,72 @@ class OCRDialog(tk.Frame):
             self.main_window.show_message("OCR failed", "error")
             show_error("Error", f"OCR extraction failed:\n{error}")
 
-        worker = PDFWorker(
+        self._worker = PDFWorker(
             operation="ocr",
             params=params,
             on_complete=on_complete,
             on_error=on_error,
-            on_progress=on_progress
+            on_progress=self._handle_progress
         )
-        worker.start()
+        self._worker.start()
+        self.after(self.PROGRESS_POLL_MS, self._drain_progress)
+
+    @staticmethod
+    def _estimate_ocr_memory(dpi: int, jobs: int) -> int:
+        """Rough peak bytes for OCR: 2 x jobs rendered A4 RGB pages, each held twice (PNG + decoded)."""
+        page_bytes = int(8.27 * dpi) * int(11.69 * dpi) * 3 * 2
+        return page_bytes * jobs * 2
+
+    def _handle_progress(self, current: int, total: int, message: str) -> None:
+        """Queue a progress event from the worker thread (no Tk calls here)."""
+        self._progress_q.put((current, total, message))
+
+    def _drain_progress(self) -> None:
+        """Apply queued progress events to the progress dialog in one batch."""
+        worker = self._worker
+        if worker is None or not worker.is_alive():
+            # Completion callbacks own the progress dialog from here on
+            return
+
+        # Only the newest event is shown, so a backlog past the cap is
+        # dropped in one pass instead of being kept around tick by tick.
+        pending = self._progress_q.qsize()
+        if pending > self.MAX_PENDING_PROGRESS:
+            limit = pending
+        elif pending > self.PROGRESS_HIGH_WATER:
+            limit = self.PROGRESS_BATCH * 4
+        else:
+            limit = self.PROGRESS_BATCH
+
+        latest = None
+        for _ in range(limit):
+            try:
+                latest = self._progress_q.get_nowait()
+            except queue.Empty:
+                break
+
+        progress = self._progress
+        if latest is not None and progress is not None and progress.winfo_exists():
+            current, total, _message = latest
+            percent = (current / total) * 100
+            # Redraw only when the whole-number percentage moves
+            int_pct = int(percent)
+            if int_pct != self._last_pct:
+                self._last_pct = int_pct
+                progress.update_progress(
+                    percent,
+                    f"OCR Processing: Page {current} of {total}",
+                    f"Progress: {percent:.1f}% - This may take a while..."
+                )
+
+        remaining = self._progress_q.qsize()
+        if remaining > self.PROGRESS_HIGH_WATER:
+            delay = self.PROGRESS_FAST_MS
+        elif remaining < self.PROGRESS_LOW_WATER:
+            delay = self.PROGRESS_SLOW_MS
+        else:
+            delay = self.PROGRESS_POLL_MS
+        self.after(delay, self._drain_progress)
 
     def _reset(self) -> None:
         """Reset all fields."""
@@ -611,6 +760,7 @@ class OCRDialog(tk.Frame):
         self.txt_var.set(False)
         self.language_var.set("eng")
         self.dpi_var.set(300)
+        self.jobs_var.set(max(1, (os.cpu_count() or 2) // 2))
         self.file_info_label.config(text="No file selected", fg=COLORS["text_secondary"])
         self._on_format_change()
         self._update_start_button()
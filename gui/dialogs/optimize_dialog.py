@@ -2,21 +2,49 @@
 Optimize dialog for compressing and optimizing PDF files.
 """
 
+import importlib.util
+import os
 import tkinter as tk
+from functools import partial
 from tkinter import ttk
 from pathlib import Path
-import fitz  # PyMuPDF
+from types import MappingProxyType
 
 from gui.widgets.progress_dialog import ProgressDialog
 from gui.workers.pdf_worker import PDFWorker
-from gui.utils.theme import COLORS, FONTS, SPACING
+from gui.utils.theme import (
+    COLORS, FONTS, SPACING, LABEL_STYLE, HINT_STYLE, CHOICE_STYLE, SECTION_STYLE,
+    ENTRY_STYLE, BROWSE_BUTTON_STYLE, SECTION_PACK, make_widget
+)
 from gui.utils.icons import get_icon
 from gui.utils.helpers import (
     select_pdf_file, select_save_file, format_file_size,
-    show_success, show_error
+    show_success, show_error, get_pdf_page_count, run_in_background, Debouncer
 )
 
 
+# Target size reduction and image DPI per quality level
+_QUALITY_SETTINGS = MappingProxyType({
+    "low": MappingProxyType({"target_reduction": 0.5, "dpi": 110}),
+    "medium": MappingProxyType({"target_reduction": 0.3, "dpi": 150}),
+    "high": MappingProxyType({"target_reduction": 0.15, "dpi": 220}),
+    "maximum": MappingProxyType({"target_reduction": 0.15, "dpi": 220}),
+})
+
+
+def _find_flate_recompressor():
+    """Return the lossless Flate re-encoder the "maximum" level can use, if installed."""
+    if importlib.util.find_spec("deflate") is not None:
+        return "libdeflate12"
+    if importlib.util.find_spec("zopfli") is not None:
+        return "zopfli"
+    return None
+
+
+# Only offered when libdeflate (deflate) or zopfli is installed
+_FLATE_RECOMPRESSOR = _find_flate_recompressor()
+
+
 class OptimizeDialog(tk.Frame):
     """
     Dialog for optimizing and compressing PDF files.
@@ -35,288 +63,197 @@ class OptimizeDialog(tk.Frame):
         self.input_file = None
         self.page_count = 0
         self.file_size = 0
+        # Settings/output sections are built on first file selection
+        self._settings_built = False
 
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Setup dialog UI."""
+        # Theme values used throughout this method
+        accent = COLORS["accent"]
+        bg = COLORS["bg_secondary"]
+        border = COLORS["border"]
+        fg = COLORS["text_primary"]
+        fg_muted = COLORS["text_secondary"]
+        font_button = FONTS["button"]
+        font_default = FONTS["default"]
+        pad_large = SPACING["large"]
+        pad_medium = SPACING["medium"]
+        pad_small = SPACING["small"]
+
         # Title
         title_label = tk.Label(
             self,
             text=f"{get_icon('optimize')} Optimize PDF",
             font=FONTS["title"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"]
+            bg=bg,
+            fg=fg
         )
-        title_label.pack(pady=(0, SPACING["large"]))
+        title_label.pack(pady=(0, pad_large))
 
         # Description
         desc_label = tk.Label(
             self,
             text="Compress and optimize PDF file to reduce size",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
+            font=font_default,
+            bg=bg,
+            fg=fg_muted
         )
-        desc_label.pack(pady=(0, SPACING["medium"]))
+        desc_label.pack(pady=(0, pad_medium))
 
         # Input file selection
-        input_frame = tk.LabelFrame(
-            self,
-            text="Source File",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        input_frame.pack(fill=tk.X, pady=SPACING["medium"])
+        input_frame = make_widget(tk.LabelFrame, self, SECTION_STYLE, text="Source File")
+        input_frame.pack(**SECTION_PACK)
 
-        input_select_frame = tk.Frame(input_frame, bg=COLORS["bg_secondary"])
+        input_select_frame = tk.Frame(input_frame, bg=bg)
         input_select_frame.pack(fill=tk.X)
 
-        self.input_entry = tk.Entry(
-            input_select_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"],
-            state="readonly"
+        self.input_entry = make_widget(tk.Entry, input_select_frame, ENTRY_STYLE, state="readonly")
+        self.input_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, pad_small))
+
+        browse_btn = make_widget(
+            tk.Button, input_select_frame, BROWSE_BUTTON_STYLE,
+            text=f"{get_icon('folder')} Select File", command=self._select_input_file,
+            bg=accent, fg="white"
+        )
+        browse_btn.pack(side=tk.LEFT)
+
+        # File info label
+        self.file_info_label = make_widget(
+            tk.Label, input_frame, HINT_STYLE,
+            text="No file selected", anchor=tk.W
         )
-        self.input_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, SPACING["small"]))
+        self.file_info_label.pack(fill=tk.X, pady=(pad_small, 0))
+
+        # Action buttons
+        self.button_frame = tk.Frame(self, bg=bg)
+        self.button_frame.pack(fill=tk.X, pady=pad_large)
 
-        browse_btn = tk.Button(
-            input_select_frame,
-            text=f"{get_icon('folder')} Select File",
-            command=self._select_input_file,
-            bg=COLORS["accent"],
+        # Start button
+        self.start_btn = tk.Button(
+            self.button_frame,
+            text=f"{get_icon('rocket')} Optimize PDF",
+            command=self._start_optimize,
+            bg=accent,
             fg="white",
-            font=FONTS["button"],
-            padx=15,
-            pady=5,
+            font=("Arial", 12, "bold"),
+            padx=30,
+            pady=12,
             relief=tk.FLAT,
-            cursor="hand2"
+            cursor="hand2",
+            state=tk.DISABLED
         )
-        browse_btn.pack(side=tk.LEFT)
+        self.start_btn.pack(side=tk.RIGHT, padx=pad_small)
 
-        # File info label
-        self.file_info_label = tk.Label(
-            input_frame,
-            text="No file selected",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"],
-            anchor=tk.W
+        # Reset button
+        reset_btn = tk.Button(
+            self.button_frame,
+            text=f"{get_icon('refresh')} Reset",
+            command=self._reset,
+            bg=border,
+            fg=fg,
+            font=font_button,
+            padx=20,
+            pady=10,
+            relief=tk.FLAT,
+            cursor="hand2"
         )
-        self.file_info_label.pack(fill=tk.X, pady=(SPACING["small"], 0))
+        reset_btn.pack(side=tk.RIGHT, padx=pad_small)
+
+    def _setup_settings_ui(self) -> None:
+        """Build the settings and output sections once a file has been selected."""
+        if self._settings_built:
+            return
+        self._settings_built = True
+
+        # Theme values used throughout this method
+        bg = COLORS["bg_secondary"]
+        border = COLORS["border"]
+        fg = COLORS["text_primary"]
+        pad_medium = SPACING["medium"]
+        pad_small = SPACING["small"]
 
         # Optimization settings
-        optimize_frame = tk.LabelFrame(
-            self,
-            text="Optimization Settings",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        optimize_frame.pack(fill=tk.X, pady=SPACING["medium"])
+        optimize_frame = make_widget(tk.LabelFrame, self, SECTION_STYLE, text="Optimization Settings")
+        optimize_frame.pack(fill=tk.X, pady=pad_medium, before=self.button_frame)
 
         # Quality level
-        quality_label = tk.Label(
-            optimize_frame,
-            text="Select optimization level:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            anchor=tk.W
-        )
-        quality_label.pack(fill=tk.X, pady=(0, SPACING["small"]))
+        make_widget(
+            tk.Label, optimize_frame, LABEL_STYLE,
+            text="Select optimization level:", anchor=tk.W
+        ).pack(fill=tk.X, pady=(0, pad_small))
 
         self.quality_var = tk.StringVar(value="medium")
 
         # Quality options
-        qualities = [
+        qualities = (
             ("low", "Low Quality", "Maximum compression (smallest file)"),
             ("medium", "Medium Quality", "Balanced compression and quality"),
-            ("high", "High Quality", "Minimal compression (best quality)")
-        ]
+            ("high", "High Quality", "Minimal compression (best quality)"),
+        )
+        if _FLATE_RECOMPRESSOR:
+            qualities += (
+                ("maximum", "Maximum (lossless)", "High quality plus slow re-deflate of all streams"),
+            )
 
         for value, label, desc in qualities:
-            rb_frame = tk.Frame(optimize_frame, bg=COLORS["bg_secondary"])
-            rb_frame.pack(fill=tk.X, pady=SPACING["small"])
-
-            rb = tk.Radiobutton(
-                rb_frame,
-                text=label,
-                variable=self.quality_var,
-                value=value,
-                font=FONTS["default"],
-                bg=COLORS["bg_secondary"],
-                fg=COLORS["text_primary"],
-                selectcolor="white",
-                activebackground=COLORS["bg_secondary"],
-                activeforeground=COLORS["text_primary"]
-            )
-            rb.pack(side=tk.LEFT)
-
-            desc_label = tk.Label(
-                rb_frame,
-                text=f" - {desc}",
-                font=("Arial", 9),
-                bg=COLORS["bg_secondary"],
-                fg=COLORS["text_secondary"]
-            )
-            desc_label.pack(side=tk.LEFT)
+            rb_frame = tk.Frame(optimize_frame, bg=bg)
+            rb_frame.pack(fill=tk.X, pady=pad_small)
+
+            make_widget(
+                tk.Radiobutton, rb_frame, CHOICE_STYLE,
+                text=label, variable=self.quality_var, value=value
+            ).pack(side=tk.LEFT)
+            make_widget(tk.Label, rb_frame, HINT_STYLE, text=f" - {desc}").pack(side=tk.LEFT)
 
         # Optimization options
-        ttk.Separator(optimize_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=SPACING["medium"])
-
-        options_label = tk.Label(
-            optimize_frame,
-            text="Additional options:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            anchor=tk.W
-        )
-        options_label.pack(fill=tk.X, pady=(0, SPACING["small"]))
+        ttk.Separator(optimize_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=pad_medium)
 
-        # Remove unused objects
-        self.remove_unused_var = tk.BooleanVar(value=True)
-        remove_check = tk.Checkbutton(
-            optimize_frame,
-            text="Remove unused objects",
-            variable=self.remove_unused_var,
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            selectcolor="white",
-            activebackground=COLORS["bg_secondary"],
-            activeforeground=COLORS["text_primary"]
-        )
-        remove_check.pack(anchor=tk.W, pady=SPACING["small"])
+        make_widget(
+            tk.Label, optimize_frame, LABEL_STYLE,
+            text="Additional options:", anchor=tk.W
+        ).pack(fill=tk.X, pady=(0, pad_small))
 
-        # Compress images
+        self.remove_unused_var = tk.BooleanVar(value=True)
         self.compress_images_var = tk.BooleanVar(value=True)
-        compress_check = tk.Checkbutton(
-            optimize_frame,
-            text="Compress images",
-            variable=self.compress_images_var,
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            selectcolor="white",
-            activebackground=COLORS["bg_secondary"],
-            activeforeground=COLORS["text_primary"]
-        )
-        compress_check.pack(anchor=tk.W, pady=SPACING["small"])
-
-        # Remove duplicate streams
         self.remove_duplicates_var = tk.BooleanVar(value=True)
-        duplicates_check = tk.Checkbutton(
-            optimize_frame,
-            text="Remove duplicate streams",
-            variable=self.remove_duplicates_var,
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            selectcolor="white",
-            activebackground=COLORS["bg_secondary"],
-            activeforeground=COLORS["text_primary"]
+        options = (
+            (self.remove_unused_var, "Remove unused objects"),
+            (self.compress_images_var, "Compress images"),
+            (self.remove_duplicates_var, "Remove duplicate streams"),
         )
-        duplicates_check.pack(anchor=tk.W, pady=SPACING["small"])
+
+        for var, label in options:
+            make_widget(
+                tk.Checkbutton, optimize_frame, CHOICE_STYLE,
+                text=label, variable=var
+            ).pack(anchor=tk.W, pady=pad_small)
 
         # Output file
-        output_frame = tk.LabelFrame(
-            self,
-            text="Output Settings",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        output_frame.pack(fill=tk.X, pady=SPACING["medium"])
+        output_frame = make_widget(tk.LabelFrame, self, SECTION_STYLE, text="Output Settings")
+        output_frame.pack(fill=tk.X, pady=pad_medium, before=self.button_frame)
 
-        output_select_frame = tk.Frame(output_frame, bg=COLORS["bg_secondary"])
+        output_select_frame = tk.Frame(output_frame, bg=bg)
         output_select_frame.pack(fill=tk.X)
 
-        tk.Label(
-            output_select_frame,
-            text="Output File:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            width=12,
-            anchor=tk.W
+        make_widget(
+            tk.Label, output_select_frame, LABEL_STYLE,
+            text="Output File:", width=12, anchor=tk.W
         ).pack(side=tk.LEFT)
 
-        self.output_entry = tk.Entry(
-            output_select_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"]
-        )
-        self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=SPACING["small"])
-
-        browse_output_btn = tk.Button(
-            output_select_frame,
-            text=f"{get_icon('folder')} Browse",
-            command=self._select_output_file,
-            bg=COLORS["border"],
-            fg=COLORS["text_primary"],
-            font=FONTS["button"],
-            padx=15,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2"
-        )
-        browse_output_btn.pack(side=tk.LEFT)
-
-        # Action buttons
-        button_frame = tk.Frame(self, bg=COLORS["bg_secondary"])
-        button_frame.pack(fill=tk.X, pady=SPACING["large"])
-
-        # Start button
-        self.start_btn = tk.Button(
-            button_frame,
-            text=f"{get_icon('rocket')} Optimize PDF",
-            command=self._start_optimize,
-            bg=COLORS["accent"],
-            fg="white",
-            font=("Arial", 12, "bold"),
-            padx=30,
-            pady=12,
-            relief=tk.FLAT,
-            cursor="hand2",
-            state=tk.DISABLED
+        self._output_var = tk.StringVar()
+        self._output_var.trace_add("write", Debouncer(self, self._update_start_button))
+        self.output_entry = make_widget(
+            tk.Entry, output_select_frame, ENTRY_STYLE, textvariable=self._output_var
         )
-        self.start_btn.pack(side=tk.RIGHT, padx=SPACING["small"])
+        self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=pad_small)
 
-        # Reset button
-        reset_btn = tk.Button(
-            button_frame,
-            text=f"{get_icon('refresh')} Reset",
-            command=self._reset,
-            bg=COLORS["border"],
-            fg=COLORS["text_primary"],
-            font=FONTS["button"],
-            padx=20,
-            pady=10,
-            relief=tk.FLAT,
-            cursor="hand2"
+        browse_output_btn = make_widget(
+            tk.Button, output_select_frame, BROWSE_BUTTON_STYLE,
+            text=f"{get_icon('folder')} Browse", command=self._select_output_file, bg=border, fg=fg
         )
-        reset_btn.pack(side=tk.RIGHT, padx=SPACING["small"])
+        browse_output_btn.pack(side=tk.LEFT)
 
     def _select_input_file(self) -> None:
         """Select input PDF file."""
@@ -330,33 +267,60 @@ class OptimizeDialog(tk.Frame):
         self.input_entry.insert(0, filepath)
         self.input_entry.config(state="readonly")
 
-        # Get page count and file size
-        try:
-            doc = fitz.open(filepath)
-            self.page_count = doc.page_count
-            doc.close()
+        # Read page count and file size off the Tk thread
+        self.page_count = 0
+        self.file_size = 0
+        self.file_info_label.config(text="Reading file...", fg=COLORS["text_secondary"])
+        self._update_start_button()
+        run_in_background(
+            self,
+            self._probe_file,
+            (filepath,),
+            on_done=self._probe_done,
+            on_error=partial(self._probe_failed, filepath)
+        )
 
-            path = Path(filepath)
-            self.file_size = path.stat().st_size
+    @staticmethod
+    def _probe_file(filepath: str) -> tuple:
+        """Return (filepath, page_count, file_size); runs in a worker thread."""
+        page_count = get_pdf_page_count(filepath)
+        file_size = os.stat(filepath).st_size
+        return filepath, page_count, file_size
+
+    def _probe_done(self, probe: tuple) -> None:
+        """Show the probed file info."""
+        filepath, page_count, file_size = probe
+        if filepath != self.input_file:
+            # A newer selection superseded this probe
+            return
 
-            self.file_info_label.config(
-                text=f"{get_icon('success')} File loaded: {self.page_count} pages, {format_file_size(self.file_size)}",
-                fg=COLORS["success"]
-            )
+        self.page_count = page_count
+        self.file_size = file_size
+        self._setup_settings_ui()
+        self.file_info_label.config(
+            text=f"{get_icon('success')} File loaded: {self.page_count} pages, {format_file_size(self.file_size)}",
+            fg=COLORS["success"]
+        )
 
-            # Set default output
-            if not self.output_entry.get():
-                default_output = str(path.parent / f"{path.stem}_optimized.pdf")
-                self.output_entry.insert(0, default_output)
+        # Set default output
+        if not self.output_entry.get():
+            path = Path(filepath)
+            default_output = str(path.parent / f"{path.stem}_optimized.pdf")
+            self.output_entry.insert(0, default_output)
 
-            self._update_start_button()
+        self._update_start_button()
+
+    def _probe_failed(self, filepath: str, error: Exception) -> None:
+        """Report a file that could not be read."""
+        if filepath != self.input_file:
+            return
 
-        except Exception as e:
-            show_error("Error", f"Cannot read PDF file:\n{str(e)}")
-            self.input_file = None
-            self.page_count = 0
-            self.file_size = 0
-            self.file_info_label.config(text="File read failed", fg=COLORS["error"])
+        show_error("Error", f"Cannot read PDF file:\n{str(error)}")
+        self.input_file = None
+        self.page_count = 0
+        self.file_size = 0
+        self.file_info_label.config(text="File read failed", fg=COLORS["error"])
+        self._update_start_button()
 
     def _select_output_file(self) -> None:
         """Select output file."""
@@ -369,8 +333,8 @@ class OptimizeDialog(tk.Frame):
 
     def _update_start_button(self) -> None:
         """Update start button state."""
-        has_input = self.input_file is not None
-        has_output = len(self.output_entry.get().strip()) > 0
+        has_input = self.input_file is not None and self.page_count > 0
+        has_output = self._settings_built and len(self.output_entry.get().strip()) > 0
         self.start_btn.config(
             state=tk.NORMAL if (has_input and has_output) else tk.DISABLED
         )
@@ -387,7 +351,7 @@ class OptimizeDialog(tk.Frame):
             return
 
         # Ensure .pdf extension
-        if not output.lower().endswith('.pdf'):
+        if os.path.splitext(output)[1].lower() != '.pdf':
             output += '.pdf'
 
         # Get optimization parameters
@@ -396,16 +360,15 @@ class OptimizeDialog(tk.Frame):
         compress_images = self.compress_images_var.get()
         remove_duplicates = self.remove_duplicates_var.get()
 
-        quality_settings = {
-            "low": {"target_reduction": 0.5, "dpi": 110},
-            "medium": {"target_reduction": 0.3, "dpi": 150},
-            "high": {"target_reduction": 0.15, "dpi": 220},
-        }
-        selected = quality_settings.get(quality, quality_settings["medium"])
+        selected = _QUALITY_SETTINGS.get(quality, _QUALITY_SETTINGS["medium"])
         target_reduction = selected["target_reduction"]
         dpi = selected["dpi"]
         aggressive = quality == "low"
         linearize = quality == "high"
+        recompress = _FLATE_RECOMPRESSOR if quality == "maximum" else None
+
+        # Size of the file being optimized, fixed for this run
+        original_size = self.file_size
 
         # Show progress dialog
         progress = ProgressDialog(self, title="Optimize PDF")
@@ -415,22 +378,28 @@ class OptimizeDialog(tk.Frame):
         def on_complete(result):
             progress.complete("Optimization complete!")
 
-            # Calculate size reduction
-            if Path(output).exists():
-                new_size = Path(output).stat().st_size
-                reduction = ((self.file_size - new_size) / self.file_size) * 100
+            # Calculate size reduction from the size the worker reports
+            new_size = result.get("output_size") if result else None
+            if new_size is None:
+                try:
+                    new_size = os.stat(output).st_size
+                except OSError:
+                    new_size = None
+
+            if new_size is not None and original_size > 0:
+                reduction = ((original_size - new_size) / original_size) * 100
+                reduction_text = f"{reduction:.1f}%"
 
                 self.main_window.show_message(
-                    f"PDF optimized - {reduction:.1f}% size reduction",
+                    f"PDF optimized - {reduction_text} size reduction",
                     "success"
                 )
-                show_success(
-                    "Success",
-                    f"PDF optimized successfully:\n{output}\n\n"
-                    f"Original: {format_file_size(self.file_size)}\n"
-                    f"Optimized: {format_file_size(new_size)}\n"
-                    f"Reduction: {reduction:.1f}%"
-                )
+                show_success("Success", "\n".join((
+                    f"PDF optimized successfully:\n{output}\n",
+                    f"Original: {format_file_size(original_size)}",
+                    f"Optimized: {format_file_size(new_size)}",
+                    f"Reduction: {reduction_text}",
+                )))
             else:
                 self.main_window.show_message("PDF optimized successfully", "success")
                 show_success("Success", f"PDF optimized successfully:\n{output}")
@@ -452,13 +421,27 @@ class OptimizeDialog(tk.Frame):
                 "remove_unused": remove_unused,
                 "compress_images": compress_images,
                 "remove_duplicates": remove_duplicates,
-                "target_reduction": target_reduction
+                "target_reduction": target_reduction,
+                "recompress": recompress,
+                "workers": os.cpu_count()
             },
             on_complete=on_complete,
-            on_error=on_error
+            on_error=on_error,
+            on_progress=partial(self._post_progress, progress)
         )
         worker.start()
 
+    def _post_progress(self, progress: ProgressDialog, current: int, total: int, message: str) -> None:
+        """Forward a (rate-limited) worker progress event to the Tk thread."""
+        self.after(0, self._apply_progress, progress, current, total, message)
+
+    def _apply_progress(self, progress: ProgressDialog, current: int, total: int, message: str) -> None:
+        """Show a progress event in the progress dialog."""
+        if not progress.winfo_exists():
+            return
+        percent = (current / total) * 100 if total else None
+        progress.update_progress(percent, message)
+
     def _reset(self) -> None:
         """Reset all fields."""
         self.input_file = None
@@ -467,11 +450,12 @@ class OptimizeDialog(tk.Frame):
         self.input_entry.config(state=tk.NORMAL)
         self.input_entry.delete(0, tk.END)
         self.input_entry.config(state="readonly")
-        self.output_entry.delete(0, tk.END)
-        self.quality_var.set("medium")
-        self.remove_unused_var.set(True)
-        self.compress_images_var.set(True)
-        self.remove_duplicates_var.set(True)
+        if self._settings_built:
+            self.output_entry.delete(0, tk.END)
+            self.quality_var.set("medium")
+            self.remove_unused_var.set(True)
+            self.compress_images_var.set(True)
+            self.remove_duplicates_var.set(True)
         self.file_info_label.config(text="No file selected", fg=COLORS["text_secondary"])
         self._update_start_button()
         self.main_window.show_message("Reset", "info")
@@ -5,15 +5,17 @@ Rotate pages dialog for changing page orientation.
 import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
-import fitz  # PyMuPDF
 
+from gui.widgets.input_file_frame import InputFileFrame
 from gui.widgets.progress_dialog import ProgressDialog
 from gui.workers.pdf_worker import PDFWorker
-from gui.utils.theme import COLORS, FONTS, SPACING
+from gui.utils.theme import (
+    COLORS, FONTS, SPACING, LABEL_STYLE, HINT_STYLE, CHOICE_STYLE, SECTION_STYLE,
+    ENTRY_STYLE, BROWSE_BUTTON_STYLE, SECTION_PACK, make_widget
+)
 from gui.utils.icons import get_icon
 from gui.utils.helpers import (
-    select_pdf_file, select_save_file,
-    show_success, show_error
+    select_save_file, show_success, show_error, is_page_spec, Debouncer
 )
 
 
@@ -32,276 +34,147 @@ class RotateDialog(tk.Frame):
         """
         super().__init__(parent, bg=COLORS["bg_secondary"])
         self.main_window = main_window
-        self.input_file = None
-        self.page_count = 0
+        # Mirrors of the radio selections, updated by their commands
+        self._specific_mode = False
+        self._current_angle = 90
+
+        # Validate once per typing burst rather than on every keystroke
+        self._schedule_update = Debouncer(self, self._update_start_button, delay_ms=120)
 
         self._setup_ui()
 
+        # Bound once; _update_start_button runs after most edits
+        self._output_get = self.output_entry.get
+        self._pages_get = self.pages_entry.get
+
     def _setup_ui(self) -> None:
         """Setup dialog UI."""
+        # Theme values used throughout this method
+        accent = COLORS["accent"]
+        bg = COLORS["bg_secondary"]
+        border = COLORS["border"]
+        fg = COLORS["text_primary"]
+        fg_muted = COLORS["text_secondary"]
+        font_button = FONTS["button"]
+        font_default = FONTS["default"]
+        pad_large = SPACING["large"]
+        pad_medium = SPACING["medium"]
+        pad_small = SPACING["small"]
+
         # Title
         title_label = tk.Label(
             self,
             text=f"{get_icon('rotate')} Rotate Pages",
             font=FONTS["title"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"]
+            bg=bg,
+            fg=fg
         )
-        title_label.pack(pady=(0, SPACING["large"]))
+        title_label.pack(pady=(0, pad_large))
 
         # Description
         desc_label = tk.Label(
             self,
             text="Rotate pages by 90, 180, or 270 degrees",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
+            font=font_default,
+            bg=bg,
+            fg=fg_muted
         )
-        desc_label.pack(pady=(0, SPACING["medium"]))
+        desc_label.pack(pady=(0, pad_medium))
 
         # Input file selection
-        input_frame = tk.LabelFrame(
-            self,
-            text="Source File",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
+        self.source = InputFileFrame(
+            self, on_file_loaded=self._on_file_loaded, on_cleared=self._update_start_button
         )
-        input_frame.pack(fill=tk.X, pady=SPACING["medium"])
-
-        input_select_frame = tk.Frame(input_frame, bg=COLORS["bg_secondary"])
-        input_select_frame.pack(fill=tk.X)
-
-        self.input_entry = tk.Entry(
-            input_select_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"],
-            state="readonly"
-        )
-        self.input_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, SPACING["small"]))
-
-        browse_btn = tk.Button(
-            input_select_frame,
-            text=f"{get_icon('folder')} Select File",
-            command=self._select_input_file,
-            bg=COLORS["accent"],
-            fg="white",
-            font=FONTS["button"],
-            padx=15,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2"
-        )
-        browse_btn.pack(side=tk.LEFT)
-
-        # File info label
-        self.file_info_label = tk.Label(
-            input_frame,
-            text="No file selected",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"],
-            anchor=tk.W
-        )
-        self.file_info_label.pack(fill=tk.X, pady=(SPACING["small"], 0))
+        self.source.pack(**SECTION_PACK)
 
         # Rotation settings
-        rotation_frame = tk.LabelFrame(
-            self,
-            text="Rotation Settings",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        rotation_frame.pack(fill=tk.X, pady=SPACING["medium"])
+        rotation_frame = make_widget(tk.LabelFrame, self, SECTION_STYLE, text="Rotation Settings")
+        rotation_frame.pack(**SECTION_PACK)
 
         # Page selection mode
-        mode_label = tk.Label(
-            rotation_frame,
-            text="Select pages to rotate:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            anchor=tk.W
-        )
-        mode_label.pack(fill=tk.X, pady=(0, SPACING["small"]))
+        mode_label = make_widget(tk.Label, rotation_frame, LABEL_STYLE, text="Select pages to rotate:", anchor=tk.W)
+        mode_label.pack(fill=tk.X, pady=(0, pad_small))
 
         self.page_mode = tk.StringVar(value="all")
 
         # All pages option
-        all_radio = tk.Radiobutton(
-            rotation_frame,
-            text="All pages",
-            variable=self.page_mode,
-            value="all",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            selectcolor="white",
-            activebackground=COLORS["bg_secondary"],
-            activeforeground=COLORS["text_primary"],
+        all_radio = make_widget(
+            tk.Radiobutton, rotation_frame, CHOICE_STYLE,
+            text="All pages", variable=self.page_mode, value="all",
             command=self._on_mode_change
         )
-        all_radio.pack(anchor=tk.W, pady=SPACING["small"])
+        all_radio.pack(anchor=tk.W, pady=pad_small)
 
         # Specific pages option
-        specific_radio = tk.Radiobutton(
-            rotation_frame,
-            text="Specific pages",
-            variable=self.page_mode,
-            value="specific",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            selectcolor="white",
-            activebackground=COLORS["bg_secondary"],
-            activeforeground=COLORS["text_primary"],
+        specific_radio = make_widget(
+            tk.Radiobutton, rotation_frame, CHOICE_STYLE,
+            text="Specific pages", variable=self.page_mode, value="specific",
             command=self._on_mode_change
         )
-        specific_radio.pack(anchor=tk.W, pady=SPACING["small"])
+        specific_radio.pack(anchor=tk.W, pady=pad_small)
 
         # Page range input
-        pages_input_frame = tk.Frame(rotation_frame, bg=COLORS["bg_secondary"])
-        pages_input_frame.pack(fill=tk.X, padx=(30, 0), pady=SPACING["small"])
-
-        tk.Label(
-            pages_input_frame,
-            text="Pages:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"]
-        ).pack(side=tk.LEFT)
+        pages_input_frame = tk.Frame(rotation_frame, bg=bg)
+        pages_input_frame.pack(fill=tk.X, padx=(30, 0), pady=pad_small)
 
-        self.pages_entry = tk.Entry(
-            pages_input_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"],
-            state=tk.DISABLED,
-            width=30
-        )
-        self.pages_entry.pack(side=tk.LEFT, padx=SPACING["small"])
-        self.pages_entry.bind("<KeyRelease>", lambda _e: self._update_start_button())
-
-        tk.Label(
-            pages_input_frame,
-            text="e.g., 1-3,5,7-9",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
-        ).pack(side=tk.LEFT)
+        make_widget(tk.Label, pages_input_frame, LABEL_STYLE, text="Pages:").pack(side=tk.LEFT)
+
+        self.pages_entry = make_widget(tk.Entry, pages_input_frame, ENTRY_STYLE, state=tk.DISABLED, width=30)
+        self.pages_entry.pack(side=tk.LEFT, padx=pad_small)
+        self.pages_entry.bind("<KeyRelease>", self._schedule_update)
+
+        make_widget(tk.Label, pages_input_frame, HINT_STYLE, text="e.g., 1-3,5,7-9").pack(side=tk.LEFT)
 
         # Rotation angle
-        ttk.Separator(rotation_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=SPACING["medium"])
-
-        angle_label = tk.Label(
-            rotation_frame,
-            text="Rotation angle:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            anchor=tk.W
-        )
-        angle_label.pack(fill=tk.X, pady=(0, SPACING["small"]))
+        ttk.Separator(rotation_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=pad_medium)
+
+        angle_label = make_widget(tk.Label, rotation_frame, LABEL_STYLE, text="Rotation angle:", anchor=tk.W)
+        angle_label.pack(fill=tk.X, pady=(0, pad_small))
 
         self.angle_var = tk.StringVar(value="90")
 
-        angle_options_frame = tk.Frame(rotation_frame, bg=COLORS["bg_secondary"])
-        angle_options_frame.pack(fill=tk.X, pady=SPACING["small"])
+        angle_options_frame = tk.Frame(rotation_frame, bg=bg)
+        angle_options_frame.pack(fill=tk.X, pady=pad_small)
 
         for angle in ["90", "180", "270"]:
-            rb = tk.Radiobutton(
-                angle_options_frame,
-                text=f"{angle} deg clockwise",
-                variable=self.angle_var,
-                value=angle,
-                font=FONTS["default"],
-                bg=COLORS["bg_secondary"],
-                fg=COLORS["text_primary"],
-                selectcolor="white",
-                activebackground=COLORS["bg_secondary"],
-                activeforeground=COLORS["text_primary"]
+            rb = make_widget(
+                tk.Radiobutton, angle_options_frame, CHOICE_STYLE,
+                text=f"{angle} deg clockwise", variable=self.angle_var, value=angle,
+                command=self._on_angle_change
             )
-            rb.pack(side=tk.LEFT, padx=(0, SPACING["large"]))
+            rb.pack(side=tk.LEFT, padx=(0, pad_large))
 
         # Output file
-        output_frame = tk.LabelFrame(
-            self,
-            text="Output Settings",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        output_frame.pack(fill=tk.X, pady=SPACING["medium"])
+        output_frame = make_widget(tk.LabelFrame, self, SECTION_STYLE, text="Output Settings")
+        output_frame.pack(**SECTION_PACK)
 
-        output_select_frame = tk.Frame(output_frame, bg=COLORS["bg_secondary"])
+        output_select_frame = tk.Frame(output_frame, bg=bg)
         output_select_frame.pack(fill=tk.X)
 
-        tk.Label(
-            output_select_frame,
-            text="Output File:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            width=12,
-            anchor=tk.W
+        make_widget(
+            tk.Label, output_select_frame, LABEL_STYLE, text="Output File:", width=12, anchor=tk.W
         ).pack(side=tk.LEFT)
 
-        self.output_entry = tk.Entry(
-            output_select_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"]
-        )
-        self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=SPACING["small"])
-        self.output_entry.bind("<KeyRelease>", lambda _e: self._update_start_button())
-
-        browse_output_btn = tk.Button(
-            output_select_frame,
-            text=f"{get_icon('folder')} Browse",
-            command=self._select_output_file,
-            bg=COLORS["border"],
-            fg=COLORS["text_primary"],
-            font=FONTS["button"],
-            padx=15,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2"
+        self.output_entry = make_widget(tk.Entry, output_select_frame, ENTRY_STYLE)
+        self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=pad_small)
+        self.output_entry.bind("<KeyRelease>", self._schedule_update)
+
+        browse_output_btn = make_widget(
+            tk.Button, output_select_frame, BROWSE_BUTTON_STYLE,
+            text=f"{get_icon('folder')} Browse", command=self._select_output_file, bg=border, fg=fg
         )
         browse_output_btn.pack(side=tk.LEFT)
 
         # Action buttons
-        button_frame = tk.Frame(self, bg=COLORS["bg_secondary"])
-        button_frame.pack(fill=tk.X, pady=SPACING["large"])
+        button_frame = tk.Frame(self, bg=bg)
+        button_frame.pack(fill=tk.X, pady=pad_large)
 
         # Start button
         self.start_btn = tk.Button(
             button_frame,
             text=f"{get_icon('rocket')} Rotate Pages",
             command=self._start_rotate,
-            bg=COLORS["accent"],
+            bg=accent,
             fg="white",
             font=("Arial", 12, "bold"),
             padx=30,
@@ -310,59 +183,32 @@ class RotateDialog(tk.Frame):
             cursor="hand2",
             state=tk.DISABLED
         )
-        self.start_btn.pack(side=tk.RIGHT, padx=SPACING["small"])
+        self.start_btn.pack(side=tk.RIGHT, padx=pad_small)
 
         # Reset button
         reset_btn = tk.Button(
             button_frame,
             text=f"{get_icon('refresh')} Reset",
             command=self._reset,
-            bg=COLORS["border"],
-            fg=COLORS["text_primary"],
-            font=FONTS["button"],
+            bg=border,
+            fg=fg,
+            font=font_button,
             padx=20,
             pady=10,
             relief=tk.FLAT,
             cursor="hand2"
         )
-        reset_btn.pack(side=tk.RIGHT, padx=SPACING["small"])
-
-    def _select_input_file(self) -> None:
-        """Select input PDF file."""
-        filepath = select_pdf_file()
-        if not filepath:
-            return
-
-        self.input_file = filepath
-        self.input_entry.config(state=tk.NORMAL)
-        self.input_entry.delete(0, tk.END)
-        self.input_entry.insert(0, filepath)
-        self.input_entry.config(state="readonly")
-
-        # Get page count
-        try:
-            doc = fitz.open(filepath)
-            self.page_count = doc.page_count
-            doc.close()
-
-            self.file_info_label.config(
-                text=f"{get_icon('success')} File loaded: {self.page_count} pages",
-                fg=COLORS["success"]
-            )
+        reset_btn.pack(side=tk.RIGHT, padx=pad_small)
 
-            # Set default output
-            if not self.output_entry.get():
-                path = Path(filepath)
-                default_output = str(path.parent / f"{path.stem}_rotated.pdf")
-                self.output_entry.insert(0, default_output)
+    def _on_file_loaded(self, filepath: str, page_count: int) -> None:
+        """Fill in dialog defaults for a newly loaded source file."""
+        # Set default output
+        if not self.output_entry.get():
+            path = self.source.input_path
+            default_output = str(path.parent / f"{path.stem}_rotated.pdf")
+            self.output_entry.insert(0, default_output)
 
-            self._update_start_button()
-
-        except Exception as e:
-            show_error("Error", f"Cannot read PDF file:\n{str(e)}")
-            self.input_file = None
-            self.page_count = 0
-            self.file_info_label.config(text="File read failed", fg=COLORS["error"])
+        self._update_start_button()
 
     def _select_output_file(self) -> None:
         """Select output file."""
@@ -375,8 +221,8 @@ class RotateDialog(tk.Frame):
 
     def _on_mode_change(self) -> None:
         """Handle page mode change."""
-        mode = self.page_mode.get()
-        if mode == "specific":
+        self._specific_mode = self.page_mode.get() == "specific"
+        if self._specific_mode:
             self.pages_entry.config(state=tk.NORMAL)
         else:
             self.pages_entry.config(state=tk.NORMAL)
@@ -384,20 +230,22 @@ class RotateDialog(tk.Frame):
             self.pages_entry.config(state=tk.DISABLED)
         self._update_start_button()
 
+    def _on_angle_change(self) -> None:
+        """Handle rotation angle change."""
+        self._current_angle = int(self.angle_var.get())
+
     def _update_start_button(self) -> None:
         """Update start button state."""
-        has_input = self.input_file is not None
-        has_output = len(self.output_entry.get().strip()) > 0
+        has_input = self.source.input_file is not None and self.source.page_count > 0
+        has_output = bool(self._output_get().strip())
         has_pages = True
-        if self.page_mode.get() == "specific":
-            has_pages = len(self.pages_entry.get().strip()) > 0
-        self.start_btn.config(
-            state=tk.NORMAL if (has_input and has_output and has_pages) else tk.DISABLED
-        )
+        if self._specific_mode:
+            has_pages = is_page_spec(self._pages_get())
+        self.start_btn["state"] = tk.NORMAL if (has_input and has_output and has_pages) else tk.DISABLED
 
     def _start_rotate(self) -> None:
         """Start rotate operation."""
-        if not self.input_file:
+        if not self.source.input_file:
             show_error("Error", "Please select a PDF file")
             return
 
@@ -408,14 +256,14 @@ class RotateDialog(tk.Frame):
 
         # Get pages
         page_spec = None
-        if self.page_mode.get() == "specific":
+        if self._specific_mode:
             page_spec = self.pages_entry.get().strip()
-            if not page_spec:
-                show_error("Error", "Please enter page numbers")
+            if not is_page_spec(page_spec):
+                show_error("Error", "Please enter page numbers, e.g. 1-3,5,7-9")
                 return
 
         # Get angle
-        angle = int(self.angle_var.get())
+        angle = self._current_angle
 
         # Ensure .pdf extension
         if not output.lower().endswith('.pdf'):
@@ -439,10 +287,11 @@ class RotateDialog(tk.Frame):
         worker = PDFWorker(
             operation="rotate",
             params={
-                "input_pdf": self.input_file,
+                "input_pdf": self.source.input_file,
                 "output_pdf": output,
                 "angle": angle,
-                "page_spec": page_spec
+                "page_spec": page_spec,
+                "all_pages": page_spec is None
             },
             on_complete=on_complete,
             on_error=on_error
@@ -451,17 +300,14 @@ class RotateDialog(tk.Frame):
 
     def _reset(self) -> None:
         """Reset all fields."""
-        self.input_file = None
-        self.page_count = 0
-        self.input_entry.config(state=tk.NORMAL)
-        self.input_entry.delete(0, tk.END)
-        self.input_entry.config(state="readonly")
+        self.source.reset()
         self.pages_entry.config(state=tk.NORMAL)
         self.pages_entry.delete(0, tk.END)
         self.output_entry.delete(0, tk.END)
         self.page_mode.set("all")
         self.angle_var.set("90")
+        self._specific_mode = False
+        self._current_angle = 90
         self.pages_entry.config(state=tk.DISABLED)
-        self.file_info_label.config(text="No file selected", fg=COLORS["text_secondary"])
         self._update_start_button()
         self.main_window.show_message("Reset", "info")
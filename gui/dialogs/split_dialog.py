@@ -2,21 +2,83 @@
 Split PDF dialog for dividing PDF into multiple files.
 """
 
+import os
+import re
 import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
-import fitz  # PyMuPDF
 
+from gui.widgets.input_file_frame import InputFileFrame
 from gui.widgets.progress_dialog import ProgressDialog
 from gui.workers.pdf_worker import PDFWorker
-from gui.utils.theme import COLORS, FONTS, SPACING
+from gui.utils.theme import (
+    COLORS, FONTS, SPACING, LABEL_STYLE, HINT_STYLE, CHOICE_STYLE, SECTION_STYLE,
+    ENTRY_STYLE, BROWSE_BUTTON_STYLE, SECTION_PACK, make_widget
+)
 from gui.utils.icons import get_icon
 from gui.utils.helpers import (
-    select_pdf_file, select_directory,
-    show_success, show_error, show_warning
+    select_directory, show_success, show_error, show_warning
 )
 
 
+# One "N", "N-M", "N-" or "-M" item of a page range list plus its separator
+_RANGE_RE = re.compile(r"\s*(\d*)(-?)(\d*)\s*(,|\Z)")
+
+
+def _parse_page_ranges(spec: str, page_count: int) -> list:
+    """
+    Parse a page range list such as "1-3,5,7-" against the document size.
+
+    The list is read in one left-to-right pass: each match consumes an
+    item and the comma after it.
+
+    Args:
+        spec: Page ranges typed by the user (1-based)
+        page_count: Number of pages in the document
+
+    Returns:
+        Sorted 0-based inclusive (start, end) tuples; overlapping and
+        adjacent ranges are merged
+
+    Raises:
+        ValueError: If an item is malformed or outside the document
+    """
+    intervals = []
+    pos = 0
+    while True:
+        match = _RANGE_RE.match(spec, pos)
+        if match is None:
+            token = spec[pos:].split(",", 1)[0].strip()
+            raise ValueError(f"Invalid page range: '{token}'")
+
+        first, dash, last, separator = match.groups()
+        token = match.group(0).rstrip(",").strip()
+        if not (first or last):
+            raise ValueError(f"Invalid page range: '{token}'")
+
+        if not dash:
+            start = end = int(first)
+        else:
+            start = int(first) if first else 1
+            end = int(last) if last else page_count
+        if not 1 <= start <= end <= page_count:
+            raise ValueError(f"Page range '{token}' is outside 1-{page_count}")
+        intervals.append((start - 1, end - 1))
+
+        if not separator:
+            break
+        pos = match.end()
+
+    intervals.sort()
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
 class SplitDialog(tk.Frame):
     """
     Dialog for splitting PDF into multiple files.
@@ -32,230 +94,102 @@ class SplitDialog(tk.Frame):
         """
         super().__init__(parent, bg=COLORS["bg_secondary"])
         self.main_window = main_window
-        self.input_file = None
-        self.page_count = 0
 
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Setup dialog UI."""
+        # Theme values used throughout this method
+        accent = COLORS["accent"]
+        bg = COLORS["bg_secondary"]
+        border = COLORS["border"]
+        fg = COLORS["text_primary"]
+        pad_large = SPACING["large"]
+        pad_medium = SPACING["medium"]
+        pad_small = SPACING["small"]
+
         # Title
-        title_label = tk.Label(
-            self,
-            text=f"{get_icon('split')} Split PDF",
-            font=FONTS["title"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"]
+        title_label = make_widget(
+            tk.Label, self, LABEL_STYLE, text=f"{get_icon('split')} Split PDF", font=FONTS["title"]
         )
-        title_label.pack(pady=(0, SPACING["large"]))
+        title_label.pack(pady=(0, pad_large))
 
         # Description
-        desc_label = tk.Label(
-            self,
-            text="Select PDF file and set split mode",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
+        desc_label = make_widget(
+            tk.Label, self, LABEL_STYLE,
+            text="Select PDF file and set split mode", fg=COLORS["text_secondary"]
         )
-        desc_label.pack(pady=(0, SPACING["medium"]))
+        desc_label.pack(pady=(0, pad_medium))
 
         # Input file selection
-        input_frame = tk.LabelFrame(
-            self,
-            text="Source File",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
+        self.source = InputFileFrame(
+            self, on_file_loaded=self._on_file_loaded, on_cleared=self._update_start_button
         )
-        input_frame.pack(fill=tk.X, pady=SPACING["medium"])
-
-        input_select_frame = tk.Frame(input_frame, bg=COLORS["bg_secondary"])
-        input_select_frame.pack(fill=tk.X)
-
-        self.input_entry = tk.Entry(
-            input_select_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"],
-            state="readonly"
-        )
-        self.input_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, SPACING["small"]))
-
-        browse_btn = tk.Button(
-            input_select_frame,
-            text=f"{get_icon('folder')} Select File",
-            command=self._select_input_file,
-            bg=COLORS["accent"],
-            fg="white",
-            font=FONTS["button"],
-            padx=15,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2"
-        )
-        browse_btn.pack(side=tk.LEFT)
-
-        # File info label
-        self.file_info_label = tk.Label(
-            input_frame,
-            text="No file selected",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"],
-            anchor=tk.W
-        )
-        self.file_info_label.pack(fill=tk.X, pady=(SPACING["small"], 0))
+        self.source.pack(**SECTION_PACK)
 
         # Split mode selection
-        mode_frame = tk.LabelFrame(
-            self,
-            text="Split Mode",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        mode_frame.pack(fill=tk.X, pady=SPACING["medium"])
+        mode_frame = make_widget(tk.LabelFrame, self, SECTION_STYLE, text="Split Mode")
+        mode_frame.pack(**SECTION_PACK)
 
         self.split_mode = tk.StringVar(value="all")
 
         # Mode: Split all pages
-        all_radio = tk.Radiobutton(
-            mode_frame,
+        all_radio = make_widget(
+            tk.Radiobutton, mode_frame, CHOICE_STYLE,
             text="Split into single page files (one PDF per page)",
-            variable=self.split_mode,
-            value="all",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            selectcolor="white",
-            activebackground=COLORS["bg_secondary"],
-            activeforeground=COLORS["text_primary"],
-            command=self._on_mode_change
+            variable=self.split_mode, value="all", command=self._on_mode_change
         )
-        all_radio.pack(anchor=tk.W, pady=SPACING["small"])
+        all_radio.pack(anchor=tk.W, pady=pad_small)
 
         # Mode: Split by range
-        range_radio = tk.Radiobutton(
-            mode_frame,
-            text="Split by page range",
-            variable=self.split_mode,
-            value="range",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            selectcolor="white",
-            activebackground=COLORS["bg_secondary"],
-            activeforeground=COLORS["text_primary"],
+        range_radio = make_widget(
+            tk.Radiobutton, mode_frame, CHOICE_STYLE,
+            text="Split by page range", variable=self.split_mode, value="range",
             command=self._on_mode_change
         )
-        range_radio.pack(anchor=tk.W, pady=SPACING["small"])
+        range_radio.pack(anchor=tk.W, pady=pad_small)
 
         # Range input (initially disabled)
-        range_input_frame = tk.Frame(mode_frame, bg=COLORS["bg_secondary"])
-        range_input_frame.pack(fill=tk.X, padx=(30, 0), pady=SPACING["small"])
-
-        tk.Label(
-            range_input_frame,
-            text="Page Range:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"]
-        ).pack(side=tk.LEFT)
+        range_input_frame = tk.Frame(mode_frame, bg=bg)
+        range_input_frame.pack(fill=tk.X, padx=(30, 0), pady=pad_small)
 
-        self.range_entry = tk.Entry(
-            range_input_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"],
-            state=tk.DISABLED,
-            width=30
-        )
-        self.range_entry.pack(side=tk.LEFT, padx=SPACING["small"])
-
-        tk.Label(
-            range_input_frame,
-            text="e.g., 1-3,5,7-9",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
-        ).pack(side=tk.LEFT)
+        make_widget(tk.Label, range_input_frame, LABEL_STYLE, text="Page Range:").pack(side=tk.LEFT)
+
+        self.range_entry = make_widget(tk.Entry, range_input_frame, ENTRY_STYLE, state=tk.DISABLED, width=30)
+        self.range_entry.pack(side=tk.LEFT, padx=pad_small)
+
+        make_widget(tk.Label, range_input_frame, HINT_STYLE, text="e.g., 1-3,5,7-9").pack(side=tk.LEFT)
 
         # Output directory
-        output_frame = tk.LabelFrame(
-            self,
-            text="Output Settings",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        output_frame.pack(fill=tk.X, pady=SPACING["medium"])
+        output_frame = make_widget(tk.LabelFrame, self, SECTION_STYLE, text="Output Settings")
+        output_frame.pack(**SECTION_PACK)
 
-        output_select_frame = tk.Frame(output_frame, bg=COLORS["bg_secondary"])
+        output_select_frame = tk.Frame(output_frame, bg=bg)
         output_select_frame.pack(fill=tk.X)
 
-        tk.Label(
-            output_select_frame,
-            text="Output Folder:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            width=12,
-            anchor=tk.W
+        make_widget(
+            tk.Label, output_select_frame, LABEL_STYLE, text="Output Folder:", width=12, anchor=tk.W
         ).pack(side=tk.LEFT)
 
-        self.output_entry = tk.Entry(
-            output_select_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"]
-        )
-        self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=SPACING["small"])
-
-        browse_output_btn = tk.Button(
-            output_select_frame,
-            text=f"{get_icon('folder')} Browse",
-            command=self._select_output_dir,
-            bg=COLORS["border"],
-            fg=COLORS["text_primary"],
-            font=FONTS["button"],
-            padx=15,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2"
+        self.output_entry = make_widget(tk.Entry, output_select_frame, ENTRY_STYLE)
+        self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=pad_small)
+
+        browse_output_btn = make_widget(
+            tk.Button, output_select_frame, BROWSE_BUTTON_STYLE,
+            text=f"{get_icon('folder')} Browse", command=self._select_output_dir, bg=border, fg=fg
         )
         browse_output_btn.pack(side=tk.LEFT)
 
         # Action buttons
-        button_frame = tk.Frame(self, bg=COLORS["bg_secondary"])
-        button_frame.pack(fill=tk.X, pady=SPACING["large"])
+        button_frame = tk.Frame(self, bg=bg)
+        button_frame.pack(fill=tk.X, pady=pad_large)
 
         # Start button
         self.start_btn = tk.Button(
             button_frame,
             text=f"{get_icon('rocket')} Start Split",
             command=self._start_split,
-            bg=COLORS["accent"],
+            bg=accent,
             fg="white",
             font=("Arial", 12, "bold"),
             padx=30,
@@ -264,58 +198,24 @@ class SplitDialog(tk.Frame):
             cursor="hand2",
             state=tk.DISABLED
         )
-        self.start_btn.pack(side=tk.RIGHT, padx=SPACING["small"])
+        self.start_btn.pack(side=tk.RIGHT, padx=pad_small)
 
         # Reset button
-        reset_btn = tk.Button(
-            button_frame,
-            text=f"{get_icon('refresh')} Reset",
-            command=self._reset,
-            bg=COLORS["border"],
-            fg=COLORS["text_primary"],
-            font=FONTS["button"],
-            padx=20,
-            pady=10,
-            relief=tk.FLAT,
-            cursor="hand2"
+        reset_btn = make_widget(
+            tk.Button, button_frame, BROWSE_BUTTON_STYLE,
+            text=f"{get_icon('refresh')} Reset", command=self._reset,
+            bg=border, fg=fg, padx=20, pady=10
         )
-        reset_btn.pack(side=tk.RIGHT, padx=SPACING["small"])
-
-    def _select_input_file(self) -> None:
-        """Select input PDF file."""
-        filepath = select_pdf_file()
-        if not filepath:
-            return
-
-        self.input_file = filepath
-        self.input_entry.config(state=tk.NORMAL)
-        self.input_entry.delete(0, tk.END)
-        self.input_entry.insert(0, filepath)
-        self.input_entry.config(state="readonly")
-
-        # Get page count
-        try:
-            doc = fitz.open(filepath)
-            self.page_count = doc.page_count
-            doc.close()
+        reset_btn.pack(side=tk.RIGHT, padx=pad_small)
 
-            self.file_info_label.config(
-                text=f"{get_icon('success')} File loaded: {self.page_count} pages",
-                fg=COLORS["success"]
-            )
-
-            # Set default output directory
-            if not self.output_entry.get():
-                default_dir = str(Path(filepath).parent / "split_output")
-                self.output_entry.insert(0, default_dir)
-
-            self._update_start_button()
+    def _on_file_loaded(self, filepath: str, page_count: int) -> None:
+        """Fill in dialog defaults for a newly loaded source file."""
+        # Set default output directory
+        if not self.output_entry.get():
+            default_dir = str(self.source.input_path.parent / "split_output")
+            self.output_entry.insert(0, default_dir)
 
-        except Exception as e:
-            show_error("Error", f"Cannot read PDF file:\n{str(e)}")
-            self.input_file = None
-            self.page_count = 0
-            self.file_info_label.config(text="File read failed", fg=COLORS["error"])
+        self._update_start_button()
 
     def _select_output_dir(self) -> None:
         """Select output directory."""
@@ -335,7 +235,7 @@ class SplitDialog(tk.Frame):
 
     def _update_start_button(self) -> None:
         """Update start button state."""
-        has_input = self.input_file is not None
+        has_input = self.source.input_file is not None and self.source.page_count > 0
         has_output = len(self.output_entry.get().strip()) > 0
         self.start_btn.config(
             state=tk.NORMAL if (has_input and has_output) else tk.DISABLED
@@ -343,7 +243,7 @@ class SplitDialog(tk.Frame):
 
     def _start_split(self) -> None:
         """Start split operation."""
-        if not self.input_file:
+        if not self.source.input_file:
             show_error("Error", "Please select a PDF file to split")
             return
 
@@ -352,13 +252,32 @@ class SplitDialog(tk.Frame):
             show_error("Error", "Please specify output folder")
             return
 
-        # Get page spec based on mode
-        page_spec = None
+        # Parse ranges here so bad input is reported before a worker starts
+        page_ranges = None
         if self.split_mode.get() == "range":
             page_spec = self.range_entry.get().strip()
             if not page_spec:
                 show_error("Error", "Please enter page range")
                 return
+            try:
+                page_ranges = _parse_page_ranges(page_spec, self.source.page_count)
+            except ValueError as e:
+                show_error("Error", str(e))
+                return
+
+        # Create the destination only once the input is valid, so bad ranges
+        # leave nothing behind; the worker can then assume it exists
+        out = Path(output_dir)
+        try:
+            out.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            show_error("Error", f"Cannot create output folder:\n{e}")
+            return
+        output_dir = str(out)
+
+        # One process per core, but never more processes than output files
+        file_count = len(page_ranges) if page_ranges is not None else self.source.page_count
+        workers = min(os.cpu_count() or 1, max(1, file_count))
 
         # Show progress dialog
         progress = ProgressDialog(self, title="Split PDF")
@@ -378,9 +297,10 @@ class SplitDialog(tk.Frame):
         worker = PDFWorker(
             operation="split",
             params={
-                "input_pdf": self.input_file,
+                "input_pdf": self.source.input_file,
                 "output_dir": output_dir,
-                "page_spec": page_spec
+                "page_ranges": page_ranges,
+                "workers": workers
             },
             on_complete=on_complete,
             on_error=on_error
@@ -389,15 +309,10 @@ class SplitDialog(tk.Frame):
 
     def _reset(self) -> None:
         """Reset all fields."""
-        self.input_file = None
-        self.page_count = 0
-        self.input_entry.config(state=tk.NORMAL)
-        self.input_entry.delete(0, tk.END)
-        self.input_entry.config(state="readonly")
+        self.source.reset()
         self.output_entry.delete(0, tk.END)
         self.range_entry.delete(0, tk.END)
         self.split_mode.set("all")
         self.range_entry.config(state=tk.DISABLED)
-        self.file_info_label.config(text="No file selected", fg=COLORS["text_secondary"])
         self._update_start_button()
         self.main_window.show_message("Reset", "info")
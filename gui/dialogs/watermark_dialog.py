@@ -5,18 +5,25 @@ Watermark dialog for adding text watermarks to PDF.
 import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
-import fitz  # PyMuPDF
+from typing import Optional, Tuple
 
+from gui.widgets.input_file_frame import InputFileFrame
 from gui.widgets.progress_dialog import ProgressDialog
 from gui.workers.pdf_worker import PDFWorker
-from gui.utils.theme import COLORS, FONTS, SPACING
+from gui.utils.theme import (
+    COLORS, FONTS, SPACING, LABEL_STYLE, HINT_STYLE, SECTION_STYLE, ENTRY_STYLE,
+    BROWSE_BUTTON_STYLE, SECTION_PACK, make_widget
+)
 from gui.utils.icons import get_icon
 from gui.utils.helpers import (
-    select_pdf_file, select_save_file,
-    show_success, show_error
+    select_save_file, show_success, show_error, Debouncer
 )
 
 
+# Fixed-width labels in front of the watermark fields
+_FIELD_LABEL_STYLE = {**LABEL_STYLE, "width": 15, "anchor": tk.W}
+
+
 class WatermarkDialog(tk.Frame):
     """
     Dialog for adding watermarks to PDF.
@@ -32,178 +39,77 @@ class WatermarkDialog(tk.Frame):
         """
         super().__init__(parent, bg=COLORS["bg_secondary"])
         self.main_window = main_window
-        self.input_file = None
-        self.page_count = 0
+        # Mirrors of the opacity slider and angle box, updated by their callbacks
+        self._current_opacity = 0.3
+        self._current_angle = 0
 
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Setup dialog UI."""
+        # Theme values used throughout this method
+        accent = COLORS["accent"]
+        bg = COLORS["bg_secondary"]
+        border = COLORS["border"]
+        fg = COLORS["text_primary"]
+        pad_large = SPACING["large"]
+        pad_medium = SPACING["medium"]
+        pad_small = SPACING["small"]
+
         # Title
-        title_label = tk.Label(
-            self,
-            text=f"{get_icon('watermark')} Add Watermark",
-            font=FONTS["title"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"]
+        title_label = make_widget(
+            tk.Label, self, LABEL_STYLE,
+            text=f"{get_icon('watermark')} Add Watermark", font=FONTS["title"]
         )
-        title_label.pack(pady=(0, SPACING["large"]))
+        title_label.pack(pady=(0, pad_large))
 
         # Description
-        desc_label = tk.Label(
-            self,
-            text="Add text watermark to PDF pages",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
+        desc_label = make_widget(
+            tk.Label, self, LABEL_STYLE,
+            text="Add text watermark to PDF pages", fg=COLORS["text_secondary"]
         )
-        desc_label.pack(pady=(0, SPACING["medium"]))
+        desc_label.pack(pady=(0, pad_medium))
 
         # Input file selection
-        input_frame = tk.LabelFrame(
-            self,
-            text="Source File",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        input_frame.pack(fill=tk.X, pady=SPACING["medium"])
-
-        input_select_frame = tk.Frame(input_frame, bg=COLORS["bg_secondary"])
-        input_select_frame.pack(fill=tk.X)
-
-        self.input_entry = tk.Entry(
-            input_select_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"],
-            state="readonly"
-        )
-        self.input_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, SPACING["small"]))
-
-        browse_btn = tk.Button(
-            input_select_frame,
-            text=f"{get_icon('folder')} Select File",
-            command=self._select_input_file,
-            bg=COLORS["accent"],
-            fg="white",
-            font=FONTS["button"],
-            padx=15,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2"
+        self.source = InputFileFrame(
+            self, on_file_loaded=self._on_file_loaded, on_cleared=self._update_start_button
         )
-        browse_btn.pack(side=tk.LEFT)
-
-        # File info label
-        self.file_info_label = tk.Label(
-            input_frame,
-            text="No file selected",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"],
-            anchor=tk.W
-        )
-        self.file_info_label.pack(fill=tk.X, pady=(SPACING["small"], 0))
+        self.source.pack(**SECTION_PACK)
 
         # Watermark settings
-        watermark_frame = tk.LabelFrame(
-            self,
-            text="Watermark Settings",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        watermark_frame.pack(fill=tk.X, pady=SPACING["medium"])
+        watermark_frame = make_widget(tk.LabelFrame, self, SECTION_STYLE, text="Watermark Settings")
+        watermark_frame.pack(**SECTION_PACK)
 
         # Watermark text
-        text_frame = tk.Frame(watermark_frame, bg=COLORS["bg_secondary"])
-        text_frame.pack(fill=tk.X, pady=SPACING["small"])
+        text_frame = tk.Frame(watermark_frame, bg=bg)
+        text_frame.pack(fill=tk.X, pady=pad_small)
 
-        tk.Label(
-            text_frame,
-            text="Watermark Text:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            width=15,
-            anchor=tk.W
-        ).pack(side=tk.LEFT)
+        make_widget(tk.Label, text_frame, _FIELD_LABEL_STYLE, text="Watermark Text:").pack(side=tk.LEFT)
 
-        self.text_entry = tk.Entry(
-            text_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"]
-        )
+        self.text_entry = make_widget(tk.Entry, text_frame, ENTRY_STYLE)
         self.text_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.text_entry.insert(0, "CONFIDENTIAL")
 
         # Font size
-        size_frame = tk.Frame(watermark_frame, bg=COLORS["bg_secondary"])
-        size_frame.pack(fill=tk.X, pady=SPACING["small"])
+        size_frame = tk.Frame(watermark_frame, bg=bg)
+        size_frame.pack(fill=tk.X, pady=pad_small)
 
-        tk.Label(
-            size_frame,
-            text="Font Size:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            width=15,
-            anchor=tk.W
-        ).pack(side=tk.LEFT)
+        make_widget(tk.Label, size_frame, _FIELD_LABEL_STYLE, text="Font Size:").pack(side=tk.LEFT)
 
         self.size_var = tk.IntVar(value=50)
-        size_spinbox = tk.Spinbox(
-            size_frame,
-            from_=10,
-            to=200,
-            textvariable=self.size_var,
-            font=FONTS["default"],
-            width=10,
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"]
+        size_spinbox = make_widget(
+            tk.Spinbox, size_frame, ENTRY_STYLE,
+            from_=10, to=200, textvariable=self.size_var, width=10
         )
-        size_spinbox.pack(side=tk.LEFT, padx=(0, SPACING["small"]))
-
-        tk.Label(
-            size_frame,
-            text="px",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
-        ).pack(side=tk.LEFT)
+        size_spinbox.pack(side=tk.LEFT, padx=(0, pad_small))
+
+        make_widget(tk.Label, size_frame, HINT_STYLE, text="px").pack(side=tk.LEFT)
 
         # Opacity
-        opacity_frame = tk.Frame(watermark_frame, bg=COLORS["bg_secondary"])
-        opacity_frame.pack(fill=tk.X, pady=SPACING["small"])
+        opacity_frame = tk.Frame(watermark_frame, bg=bg)
+        opacity_frame.pack(fill=tk.X, pady=pad_small)
 
-        tk.Label(
-            opacity_frame,
-            text="Opacity:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            width=15,
-            anchor=tk.W
-        ).pack(side=tk.LEFT)
+        make_widget(tk.Label, opacity_frame, _FIELD_LABEL_STYLE, text="Opacity:").pack(side=tk.LEFT)
 
         self.opacity_var = tk.DoubleVar(value=0.3)
         opacity_scale = tk.Scale(
@@ -212,43 +118,29 @@ class WatermarkDialog(tk.Frame):
             to=1.0,
             resolution=0.1,
             variable=self.opacity_var,
+            command=self._on_opacity_change,
             orient=tk.HORIZONTAL,
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
+            bg=bg,
+            fg=fg,
             highlightthickness=0,
-            font=("Arial", 9),
+            font=HINT_STYLE["font"],
             length=200
         )
-        opacity_scale.pack(side=tk.LEFT, padx=(0, SPACING["small"]))
+        opacity_scale.pack(side=tk.LEFT, padx=(0, pad_small))
 
-        self.opacity_label = tk.Label(
-            opacity_frame,
-            text="30%",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"],
-            width=5
-        )
+        self.opacity_label = make_widget(tk.Label, opacity_frame, HINT_STYLE, text="30%", width=5)
         self.opacity_label.pack(side=tk.LEFT)
 
-        # Update opacity label
-        def update_opacity_label(*args):
+        # Update opacity label once the slider settles instead of on every step
+        def update_opacity_label():
             self.opacity_label.config(text=f"{int(self.opacity_var.get() * 100)}%")
-        self.opacity_var.trace("w", update_opacity_label)
+        self.opacity_var.trace_add("write", Debouncer(self, update_opacity_label, delay_ms=30))
 
         # Angle
-        angle_frame = tk.Frame(watermark_frame, bg=COLORS["bg_secondary"])
-        angle_frame.pack(fill=tk.X, pady=SPACING["small"])
+        angle_frame = tk.Frame(watermark_frame, bg=bg)
+        angle_frame.pack(fill=tk.X, pady=pad_small)
 
-        tk.Label(
-            angle_frame,
-            text="Rotation Angle:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            width=15,
-            anchor=tk.W
-        ).pack(side=tk.LEFT)
+        make_widget(tk.Label, angle_frame, _FIELD_LABEL_STYLE, text="Rotation Angle:").pack(side=tk.LEFT)
 
         self.angle_var = tk.StringVar(value="0")
         angle_options = ["0", "90", "180", "270"]
@@ -260,78 +152,41 @@ class WatermarkDialog(tk.Frame):
             font=FONTS["default"],
             width=10
         )
-        angle_combo.pack(side=tk.LEFT, padx=(0, SPACING["small"]))
+        angle_combo.bind("<<ComboboxSelected>>", self._on_angle_change)
+        angle_combo.pack(side=tk.LEFT, padx=(0, pad_small))
 
-        tk.Label(
-            angle_frame,
-            text="degrees",
-            font=("Arial", 9),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
-        ).pack(side=tk.LEFT)
+        make_widget(tk.Label, angle_frame, HINT_STYLE, text="degrees").pack(side=tk.LEFT)
 
         # Output file
-        output_frame = tk.LabelFrame(
-            self,
-            text="Output Settings",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            padx=SPACING["medium"],
-            pady=SPACING["medium"]
-        )
-        output_frame.pack(fill=tk.X, pady=SPACING["medium"])
+        output_frame = make_widget(tk.LabelFrame, self, SECTION_STYLE, text="Output Settings")
+        output_frame.pack(**SECTION_PACK)
 
-        output_select_frame = tk.Frame(output_frame, bg=COLORS["bg_secondary"])
+        output_select_frame = tk.Frame(output_frame, bg=bg)
         output_select_frame.pack(fill=tk.X)
 
-        tk.Label(
-            output_select_frame,
-            text="Output File:",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            width=12,
-            anchor=tk.W
+        make_widget(
+            tk.Label, output_select_frame, LABEL_STYLE, text="Output File:", width=12, anchor=tk.W
         ).pack(side=tk.LEFT)
 
-        self.output_entry = tk.Entry(
-            output_select_frame,
-            font=FONTS["default"],
-            bg="white",
-            fg=COLORS["text_primary"],
-            relief=tk.FLAT,
-            borderwidth=1,
-            highlightthickness=1,
-            highlightbackground=COLORS["border"],
-            highlightcolor=COLORS["accent"]
-        )
-        self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=SPACING["small"])
-
-        browse_output_btn = tk.Button(
-            output_select_frame,
-            text=f"{get_icon('folder')} Browse",
-            command=self._select_output_file,
-            bg=COLORS["border"],
-            fg=COLORS["text_primary"],
-            font=FONTS["button"],
-            padx=15,
-            pady=5,
-            relief=tk.FLAT,
-            cursor="hand2"
+        self.output_entry = make_widget(tk.Entry, output_select_frame, ENTRY_STYLE)
+        self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=pad_small)
+
+        browse_output_btn = make_widget(
+            tk.Button, output_select_frame, BROWSE_BUTTON_STYLE,
+            text=f"{get_icon('folder')} Browse", command=self._select_output_file, bg=border, fg=fg
         )
         browse_output_btn.pack(side=tk.LEFT)
 
         # Action buttons
-        button_frame = tk.Frame(self, bg=COLORS["bg_secondary"])
-        button_frame.pack(fill=tk.X, pady=SPACING["large"])
+        button_frame = tk.Frame(self, bg=bg)
+        button_frame.pack(fill=tk.X, pady=pad_large)
 
         # Start button
         self.start_btn = tk.Button(
             button_frame,
             text=f"{get_icon('rocket')} Add Watermark",
             command=self._start_watermark,
-            bg=COLORS["accent"],
+            bg=accent,
             fg="white",
             font=("Arial", 12, "bold"),
             padx=30,
@@ -340,59 +195,25 @@ class WatermarkDialog(tk.Frame):
             cursor="hand2",
             state=tk.DISABLED
         )
-        self.start_btn.pack(side=tk.RIGHT, padx=SPACING["small"])
+        self.start_btn.pack(side=tk.RIGHT, padx=pad_small)
 
         # Reset button
-        reset_btn = tk.Button(
-            button_frame,
-            text=f"{get_icon('refresh')} Reset",
-            command=self._reset,
-            bg=COLORS["border"],
-            fg=COLORS["text_primary"],
-            font=FONTS["button"],
-            padx=20,
-            pady=10,
-            relief=tk.FLAT,
-            cursor="hand2"
+        reset_btn = make_widget(
+            tk.Button, button_frame, BROWSE_BUTTON_STYLE,
+            text=f"{get_icon('refresh')} Reset", command=self._reset,
+            bg=border, fg=fg, padx=20, pady=10
         )
-        reset_btn.pack(side=tk.RIGHT, padx=SPACING["small"])
-
-    def _select_input_file(self) -> None:
-        """Select input PDF file."""
-        filepath = select_pdf_file()
-        if not filepath:
-            return
+        reset_btn.pack(side=tk.RIGHT, padx=pad_small)
 
-        self.input_file = filepath
-        self.input_entry.config(state=tk.NORMAL)
-        self.input_entry.delete(0, tk.END)
-        self.input_entry.insert(0, filepath)
-        self.input_entry.config(state="readonly")
+    def _on_file_loaded(self, filepath: str, page_count: int) -> None:
+        """Fill in dialog defaults for a newly loaded source file."""
+        # Set default output
+        if not self.output_entry.get():
+            path = self.source.input_path
+            default_output = str(path.parent / f"{path.stem}_watermarked.pdf")
+            self.output_entry.insert(0, default_output)
 
-        # Get page count
-        try:
-            doc = fitz.open(filepath)
-            self.page_count = doc.page_count
-            doc.close()
-
-            self.file_info_label.config(
-                text=f"{get_icon('success')} File loaded: {self.page_count} pages",
-                fg=COLORS["success"]
-            )
-
-            # Set default output
-            if not self.output_entry.get():
-                path = Path(filepath)
-                default_output = str(path.parent / f"{path.stem}_watermarked.pdf")
-                self.output_entry.insert(0, default_output)
-
-            self._update_start_button()
-
-        except Exception as e:
-            show_error("Error", f"Cannot read PDF file:\n{str(e)}")
-            self.input_file = None
-            self.page_count = 0
-            self.file_info_label.config(text="File read failed", fg=COLORS["error"])
+        self._update_start_button()
 
     def _select_output_file(self) -> None:
         """Select output file."""
@@ -405,16 +226,43 @@ class WatermarkDialog(tk.Frame):
 
     def _update_start_button(self) -> None:
         """Update start button state."""
-        has_input = self.input_file is not None
+        has_input = self.source.input_file is not None and self.source.page_count > 0
         has_text = len(self.text_entry.get().strip()) > 0
         has_output = len(self.output_entry.get().strip()) > 0
         self.start_btn.config(
             state=tk.NORMAL if (has_input and has_text and has_output) else tk.DISABLED
         )
 
+    def _on_opacity_change(self, value: str) -> None:
+        """Handle opacity slider movement."""
+        self._current_opacity = float(value)
+
+    def _on_angle_change(self, event=None) -> None:
+        """Handle rotation angle selection."""
+        self._current_angle = int(self.angle_var.get())
+
+    def _validate_params(self) -> Optional[Tuple[int, float, int]]:
+        """
+        Read and range-check the typed font size and collect the other settings.
+
+        Returns:
+            (font_size, opacity, angle), or None after reporting bad input
+        """
+        try:
+            font_size = int(self.size_var.get())
+        except (tk.TclError, ValueError):
+            show_error("Error", "Font size must be a whole number")
+            return None
+        if not 10 <= font_size <= 200:
+            show_error("Error", "Font size must be between 10 and 200")
+            return None
+
+        # The slider and the read-only angle box only produce valid values
+        return font_size, self._current_opacity, self._current_angle
+
     def _start_watermark(self) -> None:
         """Start watermark operation."""
-        if not self.input_file:
+        if not self.source.input_file:
             show_error("Error", "Please select a PDF file")
             return
 
@@ -428,14 +276,15 @@ class WatermarkDialog(tk.Frame):
             show_error("Error", "Please specify output file")
             return
 
-        # Ensure .pdf extension
-        if not output.lower().endswith('.pdf'):
-            output += '.pdf'
+        # Ensure .pdf extension (append rather than replace, so "report.v2" keeps its name)
+        out = Path(output)
+        if out.suffix.lower() != ".pdf":
+            output = str(out.with_name(out.name + ".pdf"))
 
-        # Get parameters
-        font_size = self.size_var.get()
-        opacity = self.opacity_var.get()
-        angle = int(self.angle_var.get())
+        params = self._validate_params()
+        if params is None:
+            return
+        font_size, opacity, angle = params
 
         # Show progress dialog
         progress = ProgressDialog(self, title="Add Watermark")
@@ -455,12 +304,14 @@ class WatermarkDialog(tk.Frame):
         worker = PDFWorker(
             operation="watermark",
             params={
-                "input_pdf": self.input_file,
+                "input_pdf": self.source.input_file,
                 "output_pdf": output,
                 "text": text,
-                "font_size": font_size,
-                "opacity": opacity,
-                "angle": angle
+                "size": font_size,
+                "alpha": opacity,
+                "angle": angle,
+                # Lay the text out once per page size instead of on every page
+                "mode": "xobject"
             },
             on_complete=on_complete,
             on_error=on_error
@@ -469,17 +320,14 @@ class WatermarkDialog(tk.Frame):
 
     def _reset(self) -> None:
         """Reset all fields."""
-        self.input_file = None
-        self.page_count = 0
-        self.input_entry.config(state=tk.NORMAL)
-        self.input_entry.delete(0, tk.END)
-        self.input_entry.config(state="readonly")
+        self.source.reset()
         self.text_entry.delete(0, tk.END)
         self.text_entry.insert(0, "CONFIDENTIAL")
         self.size_var.set(50)
         self.opacity_var.set(0.3)
         self.angle_var.set("0")
+        self._current_opacity = 0.3
+        self._current_angle = 0
         self.output_entry.delete(0, tk.END)
-        self.file_info_label.config(text="No file selected", fg=COLORS["text_secondary"])
         self._update_start_button()
         self.main_window.show_message("Reset", "info")
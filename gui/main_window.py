@@ -2,23 +2,110 @@
 Main window for PDF Toolkit GUI.
 """
 
+import gc
+import importlib
+import threading
 import tkinter as tk
-from tkinter import ttk
 from gui.sidebar import Sidebar
 from gui.utils.theme import COLORS, FONTS, WINDOW, SPACING
 from gui.utils.icons import get_icon
 
 
+_ICON_READY = get_icon("ready")
+
+# Status bar icon and color per message type
+_STATUS_ICONS = {
+    "info": get_icon("info_status"),
+    "success": get_icon("success"),
+    "warning": get_icon("warning"),
+    "error": get_icon("error"),
+}
+
+_STATUS_COLORS = {
+    "info": COLORS["text_secondary"],
+    "success": COLORS["success"],
+    "warning": COLORS["warning"],
+    "error": COLORS["error"],
+}
+
+# Status bar text shown for each feature, built once
+_FEATURE_STATUS = {
+    feature: f"{_ICON_READY} Current: {name}"
+    for feature, name in (
+        ("merge", "Merge PDF"),
+        ("split", "Split PDF"),
+        ("delete", "Delete Pages"),
+        ("rotate", "Rotate Pages"),
+        ("watermark", "Add Watermark"),
+        ("optimize", "Optimize PDF"),
+        ("info", "PDF Info"),
+        ("template_fill", "Template Fill"),
+        ("pdf_diff", "PDF Diff"),
+    )
+}
+
+
+# Label options for the welcome and coming-soon screens
+_WELCOME_ICON_KW = {"font": ("Arial", 48, "bold"), "bg": COLORS["bg_secondary"]}
+_WELCOME_TITLE_KW = {
+    "font": ("Arial", 24, "bold"),
+    "bg": COLORS["bg_secondary"],
+    "fg": COLORS["text_primary"],
+}
+_WELCOME_FEATURE_KW = {
+    "font": ("Arial", 10),
+    "bg": COLORS["bg_secondary"],
+    "fg": COLORS["text_secondary"],
+    "anchor": tk.W,
+}
+_SOON_ICON_KW = {**_WELCOME_ICON_KW, "font": ("Arial", 36, "bold")}
+_SOON_TITLE_KW = {**_WELCOME_TITLE_KW, "font": ("Arial", 20, "bold")}
+_DESC_KW = {
+    "font": FONTS["default"],
+    "bg": COLORS["bg_secondary"],
+    "fg": COLORS["text_secondary"],
+}
+
+_WELCOME_FEATURES = tuple(
+    f"- {name} - {desc}"
+    for name, desc in (
+        ("Merge", "Combine multiple PDF files"),
+        ("Split", "Split PDF into multiple files"),
+        ("Template Fill", "Fill DOCX/PDF templates with data"),
+        ("PDF Diff", "Compare two PDF versions"),
+        ("Info", "View detailed PDF information"),
+    )
+)
+
+# Dialog class for each feature as (module, class name), imported on first use
+_DIALOG_SPECS = {
+    "merge": ("gui.dialogs.merge_dialog", "MergeDialog"),
+    "split": ("gui.dialogs.split_dialog", "SplitDialog"),
+    "info": ("gui.dialogs.info_dialog", "InfoDialog"),
+    "template_fill": ("gui.template_filler_dialog", "TemplateFillerDialog"),
+    "pdf_diff": ("gui.pdf_diff_dialog", "PDFDiffDialog"),
+    "delete": ("gui.dialogs.delete_dialog", "DeleteDialog"),
+    "rotate": ("gui.dialogs.rotate_dialog", "RotateDialog"),
+    "watermark": ("gui.dialogs.watermark_dialog", "WatermarkDialog"),
+    "optimize": ("gui.dialogs.optimize_dialog", "OptimizeDialog"),
+    "ocr": ("gui.dialogs.ocr_dialog", "OCRDialog"),
+}
+
+
 class MainWindow(tk.Tk):
     """
     Main application window for PDF Toolkit.
     """
 
+    # Dialog classes already imported, keyed by feature
+    _DIALOG_CACHE: dict = {}
+
     def __init__(self):
         super().__init__()
 
         # Configure safe fonts (avoid emoji fonts that cause X11 errors)
         self._configure_safe_fonts()
+        self._hold_theme_fonts()
 
         # Window configuration
         self.title("PDF Toolkit")
@@ -29,11 +116,20 @@ class MainWindow(tk.Tk):
         # Application state
         self.current_mode = None
         self.current_dialog = None
+        # Dialogs already built, keyed by feature; hidden rather than destroyed
+        self._dialog_instances: dict = {}
+        self._prewarmed = False
 
         # Setup UI
         self._setup_ui()
         self._center_window()
 
+        # The startup widget tree lives as long as the window; move it to the
+        # permanent generation so later collections skip it. Dialogs built
+        # afterwards are tracked normally.
+        gc.collect()
+        gc.freeze()
+
     def _configure_safe_fonts(self) -> None:
         """Configure Tkinter to use safe fonts that avoid emoji rendering issues."""
         try:
@@ -65,6 +161,18 @@ class MainWindow(tk.Tk):
             # If font configuration fails, continue anyway
             pass
 
+    def _hold_theme_fonts(self) -> None:
+        """
+        Keep every theme font in use by a hidden label.
+
+        Tk frees a font once no widget uses it, so switching features would
+        otherwise drop and re-resolve the dialog fonts each time. The holder
+        frame is never mapped and costs no layout.
+        """
+        self._font_holder = tk.Frame(self)
+        for font in (*FONTS.values(), ("Arial", 9), ("Arial", 12, "bold")):
+            tk.Label(self._font_holder, font=font)
+
     def _setup_ui(self) -> None:
         """Setup main window UI."""
         # Main container
@@ -98,7 +206,7 @@ class MainWindow(tk.Tk):
         # Status bar
         self.statusbar = tk.Label(
             self,
-            text=f"{get_icon('ready')} Ready | Select a feature from the left sidebar",
+            text=f"{_ICON_READY} Ready | Select a feature from the left sidebar",
             bd=1,
             relief=tk.SUNKEN,
             anchor=tk.W,
@@ -113,6 +221,26 @@ class MainWindow(tk.Tk):
         # Show welcome screen
         self._show_welcome()
 
+        # Import the dialog modules once the first frame is on screen
+        self.after(50, self._prewarm)
+
+    def _prewarm(self) -> None:
+        """Start importing the dialog modules in the background (once)."""
+        if self._prewarmed:
+            return
+        self._prewarmed = True
+        threading.Thread(target=self._prewarm_worker, daemon=True).start()
+
+    @classmethod
+    def _prewarm_worker(cls) -> None:
+        """Resolve every dialog class so the first feature click finds it cached."""
+        for feature in _DIALOG_SPECS:
+            try:
+                cls._resolve_dialog(feature)
+            except Exception:
+                # A missing optional dependency is reported when the feature is opened
+                pass
+
     def _show_welcome(self) -> None:
         """Show welcome screen in workspace."""
         self._clear_workspace()
@@ -120,57 +248,18 @@ class MainWindow(tk.Tk):
         welcome_frame = tk.Frame(self.workspace, bg=COLORS["bg_secondary"])
         welcome_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
 
-        # Icon
-        icon_label = tk.Label(
-            welcome_frame,
-            text="[PDF]",
-            font=("Arial", 48, "bold"),
-            bg=COLORS["bg_secondary"]
-        )
-        icon_label.pack(pady=(0, 20))
-
-        # Title
-        title_label = tk.Label(
-            welcome_frame,
-            text="PDF Toolkit",
-            font=("Arial", 24, "bold"),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"]
-        )
-        title_label.pack(pady=10)
-
-        # Description
-        desc_label = tk.Label(
-            welcome_frame,
-            text="Select a feature from the left sidebar to start",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
-        )
-        desc_label.pack(pady=5)
+        tk.Label(welcome_frame, text="[PDF]", **_WELCOME_ICON_KW).pack(pady=(0, 20))
+        tk.Label(welcome_frame, text="PDF Toolkit", **_WELCOME_TITLE_KW).pack(pady=10)
+        tk.Label(
+            welcome_frame, text="Select a feature from the left sidebar to start", **_DESC_KW
+        ).pack(pady=5)
 
         # Features list
         features_frame = tk.Frame(welcome_frame, bg=COLORS["bg_secondary"])
         features_frame.pack(pady=20)
 
-        features = [
-            ("Merge", "Combine multiple PDF files"),
-            ("Split", "Split PDF into multiple files"),
-            ("Template Fill", "Fill DOCX/PDF templates with data"),
-            ("PDF Diff", "Compare two PDF versions"),
-            ("Info", "View detailed PDF information"),
-        ]
-
-        for name, desc in features:
-            feature_label = tk.Label(
-                features_frame,
-                text=f"- {name} - {desc}",
-                font=("Arial", 10),
-                bg=COLORS["bg_secondary"],
-                fg=COLORS["text_secondary"],
-                anchor=tk.W
-            )
-            feature_label.pack(anchor=tk.W, pady=2)
+        for text in _WELCOME_FEATURES:
+            tk.Label(features_frame, text=text, **_WELCOME_FEATURE_KW).pack(anchor=tk.W, pady=2)
 
     def _on_feature_select(self, feature: str) -> None:
         """
@@ -192,95 +281,65 @@ class MainWindow(tk.Tk):
         """
         self._clear_workspace()
 
-        # Import and display appropriate dialog
-        if feature == "merge":
-            from gui.dialogs.merge_dialog import MergeDialog
-            self.current_dialog = MergeDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-        elif feature == "split":
-            from gui.dialogs.split_dialog import SplitDialog
-            self.current_dialog = SplitDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        dialog = self._dialog_instances.get(feature)
+        if dialog is None:
+            dialog_cls = self._resolve_dialog(feature)
+            if dialog_cls is None:
+                return
+            dialog = self._dialog_instances[feature] = dialog_cls(self.workspace, self)
 
-        elif feature == "info":
-            from gui.dialogs.info_dialog import InfoDialog
-            self.current_dialog = InfoDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        self.current_dialog = dialog
+        dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
-        elif feature == "template_fill":
-            from gui.template_filler_dialog import TemplateFillerDialog
-
-            self.current_dialog = TemplateFillerDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-        elif feature == "pdf_diff":
-            from gui.pdf_diff_dialog import PDFDiffDialog
-
-            self.current_dialog = PDFDiffDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-        elif feature == "delete":
-            from gui.dialogs.delete_dialog import DeleteDialog
-            self.current_dialog = DeleteDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-        elif feature == "rotate":
-            from gui.dialogs.rotate_dialog import RotateDialog
-            self.current_dialog = RotateDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-        elif feature == "watermark":
-            from gui.dialogs.watermark_dialog import WatermarkDialog
-            self.current_dialog = WatermarkDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+    @classmethod
+    def _resolve_dialog(cls, feature: str):
+        """
+        Return the dialog class for a feature, importing its module on first use.
 
-        elif feature == "optimize":
-            from gui.dialogs.optimize_dialog import OptimizeDialog
-            self.current_dialog = OptimizeDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        Args:
+            feature: Feature identifier
 
-        elif feature == "ocr":
-            from gui.dialogs.ocr_dialog import OCRDialog
-            self.current_dialog = OCRDialog(self.workspace, self)
-            self.current_dialog.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        Returns:
+            Dialog class, or None for an unknown feature
+        """
+        dialog_cls = cls._DIALOG_CACHE.get(feature)
+        if dialog_cls is None:
+            spec = _DIALOG_SPECS.get(feature)
+            if spec is None:
+                return None
+            module_name, class_name = spec
+            dialog_cls = getattr(importlib.import_module(module_name), class_name)
+            cls._DIALOG_CACHE[feature] = dialog_cls
+        return dialog_cls
 
     def _show_coming_soon(self, feature: str) -> None:
         """Show coming soon message for unimplemented features."""
         coming_soon_frame = tk.Frame(self.workspace, bg=COLORS["bg_secondary"])
         coming_soon_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
 
-        icon_label = tk.Label(
-            coming_soon_frame,
-            text="[WIP]",
-            font=("Arial", 36, "bold"),
-            bg=COLORS["bg_secondary"]
-        )
-        icon_label.pack(pady=(0, 20))
-
-        title_label = tk.Label(
-            coming_soon_frame,
-            text="Coming Soon",
-            font=("Arial", 20, "bold"),
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"]
-        )
-        title_label.pack(pady=10)
-
-        desc_label = tk.Label(
-            coming_soon_frame,
-            text=f"'{feature}' feature will be available soon",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"]
-        )
-        desc_label.pack(pady=5)
+        tk.Label(coming_soon_frame, text="[WIP]", **_SOON_ICON_KW).pack(pady=(0, 20))
+        tk.Label(coming_soon_frame, text="Coming Soon", **_SOON_TITLE_KW).pack(pady=10)
+        tk.Label(
+            coming_soon_frame, text=f"'{feature}' feature will be available soon", **_DESC_KW
+        ).pack(pady=5)
 
     def _clear_workspace(self) -> None:
-        """Clear all widgets from workspace."""
-        for widget in self.workspace.winfo_children():
-            widget.destroy()
-        self.current_dialog = None
+        """Hide the current dialog and destroy transient workspace widgets."""
+        if self.current_dialog is not None:
+            # Kept so switching back restores the dialog and its state
+            self.current_dialog.pack_forget()
+            self.current_dialog = None
+
+        # tkinter mirrors the child list in .children, so no Tcl query is needed;
+        # when every child is a kept dialog there is nothing to destroy
+        children = self.workspace.children
+        if len(children) == len(self._dialog_instances):
+            return
+
+        kept = self._dialog_instances.values()
+        for widget in list(children.values()):
+            if widget not in kept:
+                widget.destroy()
 
     def _update_statusbar(self, feature: str) -> None:
         """
@@ -289,22 +348,10 @@ class MainWindow(tk.Tk):
         Args:
             feature: Feature identifier
         """
-        feature_names = {
-            "merge": "Merge PDF",
-            "split": "Split PDF",
-            "delete": "Delete Pages",
-            "rotate": "Rotate Pages",
-            "watermark": "Add Watermark",
-            "optimize": "Optimize PDF",
-            "info": "PDF Info",
-            "template_fill": "Template Fill",
-            "pdf_diff": "PDF Diff",
-        }
-
-        name = feature_names.get(feature, feature)
-        self.statusbar.config(
-            text=f"{get_icon('ready')} Current: {name}"
-        )
+        text = _FEATURE_STATUS.get(feature)
+        if text is None:
+            text = f"{_ICON_READY} Current: {feature}"
+        self.statusbar.config(text=text)
 
     def _center_window(self) -> None:
         """Center window on screen."""
@@ -323,22 +370,8 @@ class MainWindow(tk.Tk):
             message: Message text
             msg_type: Message type (info, success, warning, error)
         """
-        icons = {
-            "info": get_icon("info_status"),
-            "success": get_icon("success"),
-            "warning": get_icon("warning"),
-            "error": get_icon("error"),
-        }
-
-        colors = {
-            "info": COLORS["text_secondary"],
-            "success": COLORS["success"],
-            "warning": COLORS["warning"],
-            "error": COLORS["error"],
-        }
-
-        icon = icons.get(msg_type, get_icon("info_status"))
-        color = colors.get(msg_type, COLORS["text_secondary"])
+        icon = _STATUS_ICONS.get(msg_type, _STATUS_ICONS["info"])
+        color = _STATUS_COLORS.get(msg_type, _STATUS_COLORS["info"])
 
         self.statusbar.config(
             text=f"{icon} {message}",
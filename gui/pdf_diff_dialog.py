@@ -2,13 +2,80 @@
 
 from __future__ import annotations
 
+import io
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
+import threading
 import tkinter as tk
 from tkinter import filedialog, ttk
-from gui.utils.theme import COLORS, FONTS, SPACING
+from gui.utils.theme import COLORS, FONTS, SPACING, LABEL_STYLE
 from gui.utils.icons import get_icon
 from gui.utils import helpers
 
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+# Line matching is pure-Python difflib work; a persistent worker process
+# keeps it from holding the GIL while the Tk thread repaints.
+_DIFF_POOL: ProcessPoolExecutor | None = None
+_DIFF_POOL_LOCK = threading.Lock()
+
+# Label options shared by the widgets in _setup_ui
+_TITLE_KW = {**LABEL_STYLE, "font": FONTS["title"]}
+_DESC_KW = {**LABEL_STYLE, "fg": COLORS["text_secondary"]}
+_HEADING_KW = {**LABEL_STYLE, "font": FONTS["heading"]}
+_FIELD_LABEL_KW = {**LABEL_STYLE, "width": 12, "anchor": tk.W}
+
+# First block of the summary; the trailing newline leaves a blank line after it
+_SUMMARY_HEADER = (
+    "Similarity: {:.2f}%\n"
+    "Added lines: {}\n"
+    "Deleted lines: {}\n"
+    "Modified pairs: {}\n"
+)
+
+# Added/deleted lines shown in the summary before it is truncated
+_SUMMARY_SAMPLE_LINES = 10
+
+# Extracted PDF text often carries tabs, no-break spaces and soft hyphens;
+# normalise them for the summary in a single translate() pass
+_SUMMARY_CHARS = str.maketrans({"\t": " ", "\xa0": " ", "\xad": None})
+
+
+def _compare_task(old_path: str, new_path: str):
+    """Compare two PDFs inside the worker process."""
+    from core.pdf_diff_tool import get_diff_tool
+
+    return get_diff_tool().compare_pdfs(old_path, new_path)
+
+
+def _get_diff_pool() -> ProcessPoolExecutor:
+    """Return the shared comparison process pool, creating it once."""
+    global _DIFF_POOL
+    with _DIFF_POOL_LOCK:
+        if _DIFF_POOL is None:
+            # Imported here so opening the dialog does not load multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing
+
+            # spawn: forking a process that runs Tk threads is not safe
+            _DIFF_POOL = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _DIFF_POOL
+
+
+def _discard_diff_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker died so the next comparison starts a fresh one."""
+    global _DIFF_POOL
+    with _DIFF_POOL_LOCK:
+        if _DIFF_POOL is pool:
+            _DIFF_POOL = None
+    pool.shutdown(wait=False)
+
 
 class PDFDiffDialog(tk.Frame):
     """Interactive UI for comparing PDF documents."""
@@ -16,43 +83,27 @@ class PDFDiffDialog(tk.Frame):
     def __init__(self, parent, main_window) -> None:
         super().__init__(parent, bg=COLORS["bg_secondary"])
         self.main_window = main_window
-        self.old_path_var = tk.StringVar()
-        self.new_path_var = tk.StringVar()
         self._tool = None
         self._last_result = None
+        self._export_inflight = False
+        self._diff_inflight = False
 
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Create dialog widgets."""
-        title = tk.Label(
-            self,
-            text=f"{get_icon('info')} PDF Diff",
-            font=FONTS["title"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        )
+        title = tk.Label(self, text=f"{get_icon('info')} PDF Diff", **_TITLE_KW)
         title.pack(anchor=tk.W, pady=(0, SPACING["medium"]))
 
         description = tk.Label(
-            self,
-            text="Compare two PDF versions and review key changes.",
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"],
+            self, text="Compare two PDF versions and review key changes.", **_DESC_KW
         )
         description.pack(anchor=tk.W, pady=(0, SPACING["medium"]))
 
-        self._build_file_selector(
-            label="Old PDF:",
-            textvariable=self.old_path_var,
-            command=lambda: self._browse_pdf(self.old_path_var),
-        )
-        self._build_file_selector(
-            label="New PDF:",
-            textvariable=self.new_path_var,
-            command=lambda: self._browse_pdf(self.new_path_var),
-        )
+        # Paths are only read when a comparison starts, so the entries are
+        # queried directly instead of being mirrored into StringVars
+        self.old_entry = self._build_file_selector(label="Old PDF:")
+        self.new_entry = self._build_file_selector(label="New PDF:")
 
         ttk.Separator(self, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=SPACING["medium"])
 
@@ -72,7 +123,7 @@ class PDFDiffDialog(tk.Frame):
         )
         self.export_btn.pack(side=tk.RIGHT)
 
-        run_btn = tk.Button(
+        self.run_btn = tk.Button(
             button_frame,
             text=f"{get_icon('rocket')} Run Comparison",
             command=self._run_diff,
@@ -84,15 +135,9 @@ class PDFDiffDialog(tk.Frame):
             relief=tk.FLAT,
             cursor="hand2",
         )
-        run_btn.pack(side=tk.RIGHT, padx=(0, SPACING["small"]))
+        self.run_btn.pack(side=tk.RIGHT, padx=(0, SPACING["small"]))
 
-        summary_label = tk.Label(
-            self,
-            text="Summary:",
-            font=FONTS["heading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        )
+        summary_label = tk.Label(self, text="Summary:", **_HEADING_KW)
         summary_label.pack(anchor=tk.W)
 
         summary_frame = tk.Frame(self, bg=COLORS["bg_secondary"])
@@ -114,24 +159,15 @@ class PDFDiffDialog(tk.Frame):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.summary_text.configure(yscrollcommand=scrollbar.set)
 
-    def _build_file_selector(self, label: str, textvariable: tk.StringVar, command) -> None:
-        """Create file selection row."""
+    def _build_file_selector(self, label: str) -> tk.Entry:
+        """Create file selection row and return its entry."""
         frame = tk.Frame(self, bg=COLORS["bg_secondary"])
         frame.pack(fill=tk.X, pady=SPACING["small"])
 
-        tk.Label(
-            frame,
-            text=label,
-            font=FONTS["default"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-            width=12,
-            anchor=tk.W,
-        ).pack(side=tk.LEFT)
+        tk.Label(frame, text=label, **_FIELD_LABEL_KW).pack(side=tk.LEFT)
 
         entry = tk.Entry(
             frame,
-            textvariable=textvariable,
             font=FONTS["default"],
             bg="white",
             fg=COLORS["text_primary"],
@@ -142,7 +178,7 @@ class PDFDiffDialog(tk.Frame):
         browse_btn = tk.Button(
             frame,
             text=f"{get_icon('folder')} Browse",
-            command=command,
+            command=lambda: self._browse_pdf(entry),
             bg=COLORS["border"],
             fg=COLORS["text_primary"],
             font=FONTS["button"],
@@ -150,73 +186,116 @@ class PDFDiffDialog(tk.Frame):
             cursor="hand2",
         )
         browse_btn.pack(side=tk.LEFT)
+        return entry
 
-    def _browse_pdf(self, var: tk.StringVar) -> None:
-        """Prompt for a PDF file and update *var*."""
+    def _browse_pdf(self, entry: tk.Entry) -> None:
+        """Prompt for a PDF file and put its path in *entry*."""
         filepath = filedialog.askopenfilename(
             title="Select PDF",
             filetypes=[("PDF Files", "*.pdf"), ("All Files", "*.*")],
         )
         if filepath:
-            var.set(filepath)
+            entry.delete(0, tk.END)
+            entry.insert(0, filepath)
 
     def _run_diff(self) -> None:
-        """Execute PDF comparison and render summary."""
-        old_path = self.old_path_var.get().strip()
-        new_path = self.new_path_var.get().strip()
+        """Start the PDF comparison; the summary is rendered when it finishes."""
+        if self._diff_inflight:
+            return
+
+        old_path = self.old_entry.get().strip()
+        new_path = self.new_entry.get().strip()
 
         if not old_path or not new_path:
             helpers.show_warning("Files Required", "Please select both old and new PDF files.")
             return
 
+        # Text extraction and line matching are slow on long documents;
+        # run them off the Tk thread so the window keeps repainting
+        self._diff_inflight = True
+        self.run_btn.config(state=tk.DISABLED)
+        self.main_window.show_message("Comparing PDFs...", "info")
+
+        helpers.run_in_background(
+            self,
+            self._compare,
+            args=(Path(old_path), Path(new_path)),
+            on_done=self._on_diff_done,
+            on_error=self._on_diff_failed,
+        )
+
+    def _compare(self, old_path: Path, new_path: Path):
+        """Run the comparison in the worker process and wait for it (background thread)."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        pool = _get_diff_pool()
         try:
-            tool = self._ensure_tool()
-            result = tool.compare_pdfs(Path(old_path), Path(new_path))
-        except Exception as exc:  # pragma: no cover - runtime errors shown to user
-            helpers.show_error("Comparison Failed", str(exc))
-            self.main_window.show_message("PDF diff failed.", "error")
-            return
+            return pool.submit(_compare_task, str(old_path), str(new_path)).result()
+        except BrokenProcessPool:
+            _discard_diff_pool(pool)
+            raise RuntimeError(
+                "The comparison worker process stopped unexpectedly. Please try again."
+            ) from None
+
+    def _on_diff_done(self, result) -> None:
+        """Render a finished comparison on the Tk thread."""
+        self._diff_inflight = False
+        self.run_btn.config(state=tk.NORMAL)
 
         self._last_result = result
         self._render_summary(result)
         self.export_btn.config(state=tk.NORMAL)
         self.main_window.show_message("PDF comparison complete.", "success")
 
+    def _on_diff_failed(self, exc: Exception) -> None:
+        """Report a failed comparison on the Tk thread."""
+        self._diff_inflight = False
+        self.run_btn.config(state=tk.NORMAL)
+
+        helpers.show_error("Comparison Failed", str(exc))
+        self.main_window.show_message("PDF diff failed.", "error")
+
     def _render_summary(self, result) -> None:
         """Display diff summary in the text widget."""
-        lines = [
-            f"Similarity: {result.similarity:.2f}%",
-            f"Added lines: {len(result.added)}",
-            f"Deleted lines: {len(result.deleted)}",
-            f"Modified pairs: {len(result.modified)}",
-            "",
-        ]
+        # Written straight into one buffer and handed to Tk in a single
+        # insert; per-line inserts would each be a Tcl round trip
+        out = io.StringIO()
+        write = out.write
+        write(_SUMMARY_HEADER.format(
+            result.similarity, len(result.added), len(result.deleted), len(result.modified)
+        ))
 
         if result.key_changes:
-            lines.append("Key changes:")
+            write("\nKey changes:")
             for key, values in result.key_changes.items():
-                lines.append(f"- {key.title()}:")
+                write(f"\n- {key.title()}:")
                 for entry in values:
-                    lines.append(f"    • {entry}")
+                    write(f"\n    • {entry}")
         else:
-            lines.append("No notable key changes detected.")
-
-        if result.added:
-            lines.extend(["", "Added lines:"] + [f"+ {line}" for line in result.added[:10]])
-            if len(result.added) > 10:
-                lines.append("... (truncated)")
-        if result.deleted:
-            lines.extend(["", "Deleted lines:"] + [f"- {line}" for line in result.deleted[:10]])
-            if len(result.deleted) > 10:
-                lines.append("... (truncated)")
+            write("\nNo notable key changes detected.")
+
+        for title, prefix, lines in (
+            ("Added lines:", "+", result.added),
+            ("Deleted lines:", "-", result.deleted),
+        ):
+            if not lines:
+                continue
+            write(f"\n\n{title}")
+            for line in islice(lines, _SUMMARY_SAMPLE_LINES):
+                write(f"\n{prefix} {line}")
+            if len(lines) > _SUMMARY_SAMPLE_LINES:
+                write("\n... (truncated)")
 
         self.summary_text.config(state=tk.NORMAL)
         self.summary_text.delete("1.0", tk.END)
-        self.summary_text.insert("1.0", "\n".join(lines))
+        self.summary_text.insert("1.0", out.getvalue().translate(_SUMMARY_CHARS))
         self.summary_text.config(state=tk.DISABLED)
 
     def _export_report(self) -> None:
         """Save an HTML report using the latest diff result."""
+        if self._export_inflight:
+            return
+
         if not self._last_result:
             helpers.show_warning("No Results", "Run a comparison before exporting a report.")
             return
@@ -229,11 +308,36 @@ class PDFDiffDialog(tk.Frame):
         if not filepath:
             return
 
+        # Report generation can take a while for large diffs; keep Tk responsive
+        self._export_inflight = True
+        self.export_btn.config(state=tk.DISABLED)
+        self.main_window.show_message("Generating HTML report...", "info")
+
+        result = self._last_result
+        threading.Thread(
+            target=self._export_report_worker,
+            args=(result, Path(filepath)),
+            daemon=True,
+        ).start()
+
+    def _export_report_worker(self, result, filepath: Path) -> None:
+        """Generate the HTML report off the Tk thread and post the outcome back."""
         try:
             tool = self._ensure_tool()
-            output = tool.generate_html_report(self._last_result, Path(filepath))
+            output = tool.generate_html_report(result, filepath)
         except Exception as exc:  # pragma: no cover - runtime errors shown to user
-            helpers.show_error("Export Failed", str(exc))
+            self.after(0, self._on_export_done, None, str(exc))
+            return
+        self.after(0, self._on_export_done, output, None)
+
+    def _on_export_done(self, output, error: str | None) -> None:
+        """Re-enable export and report the result on the Tk thread."""
+        self._export_inflight = False
+        self.export_btn.config(state=tk.NORMAL)
+
+        if error is not None:
+            helpers.show_error("Export Failed", error)
+            self.main_window.show_message("HTML report export failed.", "error")
             return
 
         helpers.show_success("Report Saved", f"Report saved to {output}")
@@ -242,8 +346,8 @@ class PDFDiffDialog(tk.Frame):
     def _ensure_tool(self):
         """Initialise the PDF diff tool when required."""
         if self._tool is None:
-            from core.pdf_diff_tool import PDFDiffTool
+            from core.pdf_diff_tool import get_diff_tool
 
-            self._tool = PDFDiffTool()
+            self._tool = get_diff_tool()
         return self._tool
 
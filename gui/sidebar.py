@@ -3,18 +3,40 @@ Sidebar navigation component for PDF Toolkit GUI.
 """
 
 import tkinter as tk
+from functools import partial
 from typing import Callable
 from gui.utils.theme import COLORS, FONTS, WINDOW
 from gui.utils.icons import get_icon
 
 
+# Feature button options per state, applied with one configure call each
+_ACTIVE_BTN_KW = {"bg": COLORS["button_hover"], "relief": tk.FLAT, "state": tk.DISABLED}
+_INACTIVE_BTN_KW = {"bg": COLORS["bg_sidebar"], "relief": tk.FLAT, "state": tk.NORMAL}
+_HOVER_BG = {"bg": COLORS["button_hover"]}
+_NORMAL_BG = {"bg": COLORS["bg_sidebar"]}
+
+_HELP_TEXT = (
+    "PDF Toolkit v0.2.0\n\n"
+    "Select a feature from the left sidebar:\n"
+    "- Merge - Combine multiple PDFs\n"
+    "- Split - Split PDF pages\n"
+    "- Info - View PDF information\n"
+    "- Delete - Remove specific pages\n"
+    "- Rotate - Rotate pages\n"
+    "- Watermark - Add watermarks\n"
+    "- Optimize - Compress file size\n"
+    "- Author: Taki HOR\n\n"
+    "GitHub: https://github.com/your-repo/pdf_toolkit"
+)
+
+
 class Sidebar(tk.Frame):
     """
     Sidebar with navigation buttons for different PDF operations.
     """
 
     # Feature buttons configuration
-    FEATURES = [
+    FEATURES = (
         ("merge", "Merge", "Merge multiple PDF files"),
         ("split", "Split", "Split PDF into multiple files"),
         ("info", "Info", "View PDF information"),
@@ -26,7 +48,13 @@ class Sidebar(tk.Frame):
         ("rotate", "Rotate", "Rotate page orientation"),
         ("watermark", "Watermark", "Add text watermark"),
         ("optimize", "Optimize", "Compress and optimize PDF"),
-    ]
+    )
+
+    # FEATURES with the button text (icon + name) composed once
+    _FEATURES_RESOLVED = tuple(
+        None if item is None else (item[0], f"{get_icon(item[0], '')} {item[1]}", item[2])
+        for item in FEATURES
+    )
 
     def __init__(self, parent, on_feature_select: Callable[[str], None]):
         """
@@ -72,14 +100,14 @@ class Sidebar(tk.Frame):
         version_label.pack()
 
         # Feature buttons
-        for item in self.FEATURES:
+        for item in self._FEATURES_RESOLVED:
             if item is None:
                 # Separator
                 separator = tk.Frame(self, height=1, bg=COLORS["border"])
                 separator.pack(fill=tk.X, padx=10, pady=10)
             else:
-                feature_id, name, tooltip = item
-                self._create_feature_button(feature_id, name, tooltip)
+                feature_id, text, tooltip = item
+                self._create_feature_button(feature_id, text, tooltip)
 
         # Spacer to push bottom content down
         tk.Frame(self, bg=COLORS["bg_sidebar"]).pack(fill=tk.BOTH, expand=True)
@@ -101,24 +129,22 @@ class Sidebar(tk.Frame):
         )
         help_btn.pack(fill=tk.X, side=tk.BOTTOM, pady=(0, 10))
 
-    def _create_feature_button(self, feature_id: str, name: str, tooltip: str) -> None:
+    def _create_feature_button(self, feature_id: str, text: str, tooltip: str) -> None:
         """
         Create a feature button.
 
         Args:
             feature_id: Feature identifier
-            name: Display name
+            text: Button text (icon and display name)
             tooltip: Tooltip text
         """
-        # Get icon
-        icon = get_icon(feature_id, "")
-
         btn = tk.Button(
             self,
-            text=f"{icon} {name}",
-            command=lambda: self._on_button_click(feature_id),
+            text=text,
+            command=partial(self._on_button_click, feature_id),
             bg=COLORS["bg_sidebar"],
             fg=COLORS["text_sidebar"],
+            disabledforeground=COLORS["text_sidebar"],
             font=FONTS["sidebar"],
             relief=tk.FLAT,
             anchor=tk.W,
@@ -132,9 +158,10 @@ class Sidebar(tk.Frame):
         # Store button reference
         self.buttons[feature_id] = btn
 
-        # Hover effects
-        btn.bind("<Enter>", lambda e: self._on_hover(feature_id, True))
-        btn.bind("<Leave>", lambda e: self._on_hover(feature_id, False))
+        # Hover effects; the shared handlers find the feature on the widget
+        btn.feature_id = feature_id
+        btn.bind("<Enter>", self._on_enter)
+        btn.bind("<Leave>", self._on_leave)
 
         # Store tooltip (for future implementation)
         btn.tooltip = tooltip
@@ -165,20 +192,22 @@ class Sidebar(tk.Frame):
         """
         # Reset previous active button
         if self.active_feature and self.active_feature in self.buttons:
-            self.buttons[self.active_feature].config(
-                bg=COLORS["bg_sidebar"],
-                relief=tk.FLAT
-            )
+            self.buttons[self.active_feature].config(**_INACTIVE_BTN_KW)
 
-        # Set new active button
+        # Set new active button; disabled so Tk drops repeat clicks on it
         if feature_id in self.buttons:
-            self.buttons[feature_id].config(
-                bg=COLORS["button_hover"],
-                relief=tk.FLAT
-            )
+            self.buttons[feature_id].config(**_ACTIVE_BTN_KW)
 
         self.active_feature = feature_id
 
+    def _on_enter(self, event: tk.Event) -> None:
+        """Highlight a feature button under the pointer."""
+        self._on_hover(event.widget.feature_id, True)
+
+    def _on_leave(self, event: tk.Event) -> None:
+        """Restore a feature button the pointer left."""
+        self._on_hover(event.widget.feature_id, False)
+
     def _on_hover(self, feature_id: str, entering: bool) -> None:
         """
         Handle button hover.
@@ -196,26 +225,10 @@ class Sidebar(tk.Frame):
         if feature_id == self.active_feature:
             return
 
-        if entering:
-            btn.config(bg=COLORS["button_hover"])
-        else:
-            btn.config(bg=COLORS["bg_sidebar"])
+        btn.config(**(_HOVER_BG if entering else _NORMAL_BG))
 
     def _show_help(self) -> None:
         """Show help dialog."""
         # TODO: Implement help dialog
         from gui.utils.helpers import show_info
-        show_info(
-            "Help",
-            "PDF Toolkit v0.2.0\n\n"
-            "Select a feature from the left sidebar:\n"
-            "- Merge - Combine multiple PDFs\n"
-            "- Split - Split PDF pages\n"
-            "- Info - View PDF information\n"
-            "- Delete - Remove specific pages\n"
-            "- Rotate - Rotate pages\n"
-            "- Watermark - Add watermarks\n"
-            "- Optimize - Compress file size\n"
-            "- Author: Taki HOR\n\n"
-            "GitHub: https://github.com/your-repo/pdf_toolkit"
-        )
+        show_info("Help", _HELP_TEXT)
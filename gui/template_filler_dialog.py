@@ -10,6 +10,25 @@ from gui.utils.theme import COLORS, FONTS, SPACING
 from gui.utils.icons import get_icon
 from gui.utils import helpers
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional, faster JSON for large placeholder sets
+    orjson = None
+
+
+def _json_dumps_pretty(data) -> str:
+    """Serialise data as JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _json_loads(text: str):
+    """Parse JSON text; errors subclass json.JSONDecodeError on both paths."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class TemplateFillerDialog(tk.Frame):
     """Interactive UI for filling DOCX/PDF templates."""
@@ -202,7 +221,7 @@ class TemplateFillerDialog(tk.Frame):
             for field in placeholders
         }
         self.data_text.delete("1.0", tk.END)
-        self.data_text.insert("1.0", json.dumps(sample_data, indent=2))
+        self.data_text.insert("1.0", _json_dumps_pretty(sample_data))
         self.main_window.show_message("Placeholders detected and sample data generated.")
 
     def _reset(self) -> None:
@@ -225,7 +244,7 @@ class TemplateFillerDialog(tk.Frame):
             return
 
         try:
-            data = json.loads(raw_data)
+            data = _json_loads(raw_data)
         except json.JSONDecodeError as exc:
             helpers.show_error("Invalid JSON", f"Could not parse the provided data: {exc}")
             return
@@ -252,8 +271,8 @@ class TemplateFillerDialog(tk.Frame):
     def _ensure_filler(self):
         """Create TemplateFiller on demand."""
         if self._filler is None:
-            from core.template_filler import TemplateFiller
+            from core.template_filler import get_template_filler
 
-            self._filler = TemplateFiller()
+            self._filler = get_template_filler()
         return self._filler
 
@@ -2,10 +2,63 @@
 Helper utilities for PDF Toolkit GUI.
 """
 
+import functools
+import mmap
+import os
+import queue
+import re
+import threading
 import tkinter as tk
 from tkinter import messagebox, filedialog
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
+
+
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+_ROOT_RE = re.compile(rb"/Root\s+(\d+)\s+(\d+)\s+R")
+_PAGES_RE = re.compile(rb"/Pages\s+(\d+)\s+(\d+)\s+R")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+_XREF_SUBSECTION_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s*?\r?\n")
+
+# "1,3,5-7,10-" style page specs: single pages or ranges open at either end
+_PAGE_SPEC_RE = re.compile(r"^\s*(\d+(-\d*)?|-\d+)(\s*,\s*(\d+(-\d*)?|-\d+))*\s*$")
+
+# PDF libraries are only imported when a page count cannot be read from the
+# header; pypdfium2 is optional and preferred for that lighter query
+_fitz = None
+_pdfium = None
+_pdfium_checked = False
+
+# Daemon threads shared by run_in_background; waiting ones are reused
+_BACKGROUND_MAX_THREADS = 4
+_background_jobs: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+_background_lock = threading.Lock()
+_background_threads = 0
+_background_idle = 0
+# Jobs queued but not yet taken by a thread
+_background_pending = 0
+
+
+def _load_fitz():
+    """Import PyMuPDF on first use and keep the module."""
+    global _fitz
+    if _fitz is None:
+        import fitz  # PyMuPDF
+        _fitz = fitz
+    return _fitz
+
+
+def _load_pdfium():
+    """Import pypdfium2 on first use; None if it is not installed."""
+    global _pdfium, _pdfium_checked
+    if not _pdfium_checked:
+        try:
+            import pypdfium2
+        except ImportError:
+            pypdfium2 = None
+        _pdfium = pypdfium2
+        _pdfium_checked = True
+    return _pdfium
 
 
 def show_error(title: str, message: str) -> None:
@@ -150,6 +203,22 @@ def get_file_info(filepath: str) -> dict:
     }
 
 
+def is_page_spec(spec: str) -> bool:
+    """
+    Check the syntax of a page specification such as "1-3,5,7-".
+
+    Page bounds are not checked; the PDF operation validates those
+    against the document.
+
+    Args:
+        spec: Page specification typed by the user
+
+    Returns:
+        True if the specification is well formed
+    """
+    return _PAGE_SPEC_RE.match(spec) is not None
+
+
 def center_window(window: tk.Toplevel, width: Optional[int] = None, height: Optional[int] = None) -> None:
     """
     Center a window on the screen.
@@ -172,3 +241,234 @@ def center_window(window: tk.Toplevel, width: Optional[int] = None, height: Opti
     y = (screen_height - height) // 2
 
     window.geometry(f"{width}x{height}+{x}+{y}")
+
+
+def _xref_offset(mm: mmap.mmap, xref_pos: int, obj_num: int) -> Optional[int]:
+    """Look up *obj_num* in the classic xref table at *xref_pos* (None if absent)."""
+    pos = xref_pos + 4  # skip "xref"
+    while True:
+        match = _XREF_SUBSECTION_RE.match(mm, pos)
+        if not match:
+            return None
+        first, count = int(match.group(1)), int(match.group(2))
+        pos = match.end()
+        if first <= obj_num < first + count:
+            # Entries are fixed 20-byte records: "nnnnnnnnnn ggggg n\r\n"
+            entry = mm[pos + (obj_num - first) * 20:pos + (obj_num - first) * 20 + 18]
+            if entry[17:18] != b"n":
+                return None
+            return int(entry[:10])
+        pos += count * 20
+
+
+def _read_object(mm: mmap.mmap, offset: int, obj_num: int) -> Optional[bytes]:
+    """Return the body of object *obj_num* stored at *offset*."""
+    head = mm[offset:offset + 64]
+    if not re.match(rb"\s*%d\s+\d+\s+obj" % obj_num, head):
+        return None
+    end = mm.find(b"endobj", offset)
+    if end == -1:
+        return None
+    return mm[offset:end]
+
+
+def _scan_page_count(filepath: str) -> Optional[int]:
+    """
+    Read the page count from the PDF trailer, Root and Pages objects only.
+
+    Only the newest classic xref table is consulted; xref streams and
+    anything unexpected return None so the caller can fall back.
+    """
+    with open(filepath, "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            matches = _STARTXREF_RE.findall(mm[-1024:])
+            if not matches:
+                return None
+            xref_pos = int(matches[-1])
+            if mm[xref_pos:xref_pos + 4] != b"xref":
+                return None
+
+            trailer_pos = mm.find(b"trailer", xref_pos)
+            if trailer_pos == -1:
+                return None
+            root = _ROOT_RE.search(mm[trailer_pos:trailer_pos + 1024])
+            if not root:
+                return None
+
+            root_num = int(root.group(1))
+            root_offset = _xref_offset(mm, xref_pos, root_num)
+            root_body = _read_object(mm, root_offset, root_num) if root_offset is not None else None
+            pages = _PAGES_RE.search(root_body) if root_body else None
+            if not pages:
+                return None
+
+            pages_num = int(pages.group(1))
+            pages_offset = _xref_offset(mm, xref_pos, pages_num)
+            pages_body = _read_object(mm, pages_offset, pages_num) if pages_offset is not None else None
+            count = _COUNT_RE.search(pages_body) if pages_body else None
+            return int(count.group(1)) if count else None
+
+
+# Sized for a large multi-file selection in the file list
+@functools.lru_cache(maxsize=1024)
+def _cached_page_count(filepath: str, mtime_ns: int, size: int) -> int:
+    """Page count for one version of a file; the stat fields are cache keys."""
+    try:
+        count = _scan_page_count(filepath)
+    except (OSError, ValueError):
+        count = None
+    if count is not None:
+        return count
+
+    pdfium = _load_pdfium()
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(filepath)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    with _load_fitz().open(filepath, filetype="pdf") as doc:
+        return doc.page_count
+
+
+def get_pdf_page_count(filepath: str) -> int:
+    """
+    Get the number of pages in a PDF without loading the whole document.
+
+    The trailer, catalog and page tree root are read straight from a
+    memory map. When that scan cannot find /Count the document is opened
+    with pypdfium2 if installed, otherwise PyMuPDF.
+    Results are cached per (path, mtime, size), so re-selecting an
+    unchanged file does not open it again.
+
+    Args:
+        filepath: Path to PDF file
+
+    Returns:
+        Page count
+
+    Raises:
+        Exception: If the file cannot be read as a PDF
+    """
+    st = os.stat(filepath)
+    return _cached_page_count(filepath, st.st_mtime_ns, st.st_size)
+
+
+def _background_loop() -> None:
+    """Run queued background jobs forever (daemon thread)."""
+    global _background_idle, _background_pending
+    while True:
+        job = _background_jobs.get()
+        with _background_lock:
+            _background_idle -= 1
+            _background_pending -= 1
+        job()
+        with _background_lock:
+            _background_idle += 1
+
+
+def _submit_background(job: Callable[[], None]) -> None:
+    """Queue *job*, starting another background thread if no waiting one is free for it."""
+    global _background_threads, _background_idle, _background_pending
+    with _background_lock:
+        # Each queued job needs its own waiting thread; jobs submitted back
+        # to back must not both count on the same idle one
+        _background_pending += 1
+        if _background_pending > _background_idle and _background_threads < _BACKGROUND_MAX_THREADS:
+            # A new thread counts as idle until it takes its first job
+            _background_threads += 1
+            _background_idle += 1
+            threading.Thread(
+                target=_background_loop,
+                name=f"gui-background-{_background_threads}",
+                daemon=True,
+            ).start()
+    _background_jobs.put(job)
+
+
+def run_in_background(
+    widget: tk.Misc,
+    func: Callable[..., Any],
+    args: tuple = (),
+    on_done: Optional[Callable[[Any], None]] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+) -> None:
+    """
+    Run *func* on a shared background thread and deliver its outcome on the Tk thread.
+
+    The threads are daemons and are reused across calls, so repeated
+    probes and comparisons do not each pay for a new thread.
+
+    Args:
+        widget: Widget whose after() is used to post back to the Tk thread
+        func: Callable to run in the background (must not touch Tk)
+        args: Positional arguments for func
+        on_done: Called with the return value on the Tk thread
+        on_error: Called with the raised exception on the Tk thread
+    """
+    def _post(callback, value) -> None:
+        if callback is None:
+            return
+        try:
+            widget.after(0, callback, value)
+        except (RuntimeError, tk.TclError):
+            # Widget destroyed or main loop gone; nothing left to update
+            pass
+
+    def _job() -> None:
+        try:
+            result = func(*args)
+        except Exception as exc:
+            _post(on_error, exc)
+            return
+        _post(on_done, result)
+
+    _submit_background(_job)
+
+
+class Debouncer:
+    """
+    Coalesce bursts of calls (e.g. keystrokes, variable traces) into one callback.
+
+    With delay_ms=0 the callback runs once per Tk idle cycle; otherwise it
+    runs delay_ms after the last call. Extra call arguments are ignored so
+    an instance can be used directly as a trace or event handler.
+    """
+
+    def __init__(self, widget: tk.Misc, callback: Callable[[], None], delay_ms: int = 0):
+        """
+        Initialize debouncer.
+
+        Args:
+            widget: Widget used to schedule the callback
+            callback: Function to run
+            delay_ms: Quiet period before running (0 = next idle cycle)
+        """
+        self.widget = widget
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self._pending = None
+
+    def __call__(self, *_args) -> None:
+        """Schedule the callback, replacing a pending delayed run."""
+        if self._pending is not None:
+            if not self.delay_ms:
+                return
+            self.widget.after_cancel(self._pending)
+
+        if self.delay_ms:
+            self._pending = self.widget.after(self.delay_ms, self._fire)
+        else:
+            self._pending = self.widget.after_idle(self._fire)
+
+    def cancel(self) -> None:
+        """Drop a pending run, if any."""
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+
+    def _fire(self) -> None:
+        """Run the callback."""
+        self._pending = None
+        self.callback()
@@ -44,3 +44,58 @@ WINDOW = {
     "min_height": 600,
     "sidebar_width": 200,
 }
+
+# Widget option presets for content on the secondary (white) background
+LABEL_STYLE = {
+    "font": FONTS["default"],
+    "bg": COLORS["bg_secondary"],
+    "fg": COLORS["text_primary"],
+}
+
+HINT_STYLE = {
+    "font": ("Arial", 9),
+    "bg": COLORS["bg_secondary"],
+    "fg": COLORS["text_secondary"],
+}
+
+CHOICE_STYLE = {
+    **LABEL_STYLE,
+    "selectcolor": "white",
+    "activebackground": COLORS["bg_secondary"],
+    "activeforeground": COLORS["text_primary"],
+}
+
+SECTION_STYLE = {
+    "font": FONTS["heading"],
+    "bg": COLORS["bg_secondary"],
+    "fg": COLORS["text_primary"],
+    "padx": SPACING["medium"],
+    "pady": SPACING["medium"],
+}
+
+ENTRY_STYLE = {
+    "font": FONTS["default"],
+    "bg": "white",
+    "fg": COLORS["text_primary"],
+    "relief": "flat",
+    "borderwidth": 1,
+    "highlightthickness": 1,
+    "highlightbackground": COLORS["border"],
+    "highlightcolor": COLORS["accent"],
+}
+
+BROWSE_BUTTON_STYLE = {
+    "font": FONTS["button"],
+    "padx": 15,
+    "pady": 5,
+    "relief": "flat",
+    "cursor": "hand2",
+}
+
+# pack() arguments for a full-width section of a dialog
+SECTION_PACK = {"fill": "x", "pady": SPACING["medium"]}
+
+
+def make_widget(widget_cls, parent, preset: dict, **overrides):
+    """Create a widget from one of the presets above plus per-widget overrides."""
+    return widget_cls(parent, **{**preset, **overrides})
@@ -4,13 +4,20 @@ File list widget with drag and drop support.
 
 import tkinter as tk
 from tkinter import ttk
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Callable
-import fitz  # PyMuPDF
+from typing import Dict, List, Optional, Callable
 
 from gui.utils.theme import COLORS, FONTS, SPACING
 from gui.utils.icons import get_icon
-from gui.utils.helpers import select_pdf_files, get_file_info
+from gui.utils.helpers import (
+    select_pdf_files, get_file_info, get_pdf_page_count, run_in_background
+)
+
+
+# Row text pieces, reused when a page count arrives
+_ICON_FILE = get_icon('file')
+_PAGES_PENDING = " (\u2026 pages)"
 
 
 class FileListWidget(tk.Frame):
@@ -40,6 +47,9 @@ class FileListWidget(tk.Frame):
         self.allow_multiple = allow_multiple
         self.show_page_count = show_page_count
         self.files: List[Path] = []
+        # Row of each path in self.files, for constant-time duplicate
+        # checks and for patching a row when its page count arrives
+        self._row_index: Dict[Path, int] = {}
 
         self._setup_ui()
 
@@ -144,9 +154,7 @@ class FileListWidget(tk.Frame):
 
     def _add_files(self) -> None:
         """Open file dialog to add PDF files."""
-        files = select_pdf_files()
-        for file in files:
-            self.add_file(file)
+        self._add_files_bulk(select_pdf_files())
 
     def _remove_selected(self) -> None:
         """Remove selected files from list."""
@@ -154,10 +162,20 @@ class FileListWidget(tk.Frame):
         if not selection:
             return
 
-        # Remove in reverse order to maintain indices
-        for index in reversed(selection):
-            self.listbox.delete(index)
-            del self.files[index]
+        # Delete each contiguous run of rows with one call, last run first
+        # so earlier indices stay valid
+        runs = []
+        for index in selection:
+            if runs and runs[-1][1] == index - 1:
+                runs[-1][1] = index
+            else:
+                runs.append([index, index])
+        for first, last in reversed(runs):
+            self.listbox.delete(first, last)
+
+        removed = set(selection)
+        self.files = [f for i, f in enumerate(self.files) if i not in removed]
+        self._row_index = {f: i for i, f in enumerate(self.files)}
 
         self._update_info()
         self._notify_change()
@@ -172,44 +190,85 @@ class FileListWidget(tk.Frame):
         Returns:
             True if file was added, False if already in list or invalid
         """
-        path = Path(filepath)
+        return self._add_files_bulk([filepath]) == 1
+
+    def _add_files_bulk(self, filepaths: List[str]) -> int:
+        """
+        Add several files with one listbox insert and one change notification.
+
+        Args:
+            filepaths: Paths to PDF files
+
+        Returns:
+            Number of files added
+        """
+        new_paths: List[Path] = []
+        for filepath in filepaths:
+            path = Path(filepath)
+
+            # Validate
+            if not path.suffix.lower() == '.pdf':
+                continue
 
-        # Validate
-        if not path.exists():
-            return False
+            if path in self._row_index:
+                continue
 
-        if not path.suffix.lower() == '.pdf':
-            return False
+            if not path.exists():
+                continue
 
-        if path in self.files:
-            return False
+            self._row_index[path] = len(self.files) + len(new_paths)
+            new_paths.append(path)
 
-        # Add to list
-        self.files.append(path)
+        if not new_paths:
+            return 0
 
-        # Get page count if needed
-        page_info = ""
+        # Add to list; Tk's insert takes any number of rows in one call
+        self.files.extend(new_paths)
+        suffix = _PAGES_PENDING if self.show_page_count else ""
+        self.listbox.insert(tk.END, *[f"{_ICON_FILE} {p.name}{suffix}" for p in new_paths])
+
+        # Page counts are read off the Tk thread and patched into each
+        # row once known
         if self.show_page_count:
-            try:
-                doc = fitz.open(str(path))
-                page_count = doc.page_count
-                doc.close()
-                page_info = f" ({page_count} pages)"
-            except Exception:
-                page_info = ""
-
-        # Add to listbox
-        display_name = f"{get_icon('file')} {path.name}{page_info}"
-        self.listbox.insert(tk.END, display_name)
+            for path in new_paths:
+                run_in_background(
+                    self,
+                    get_pdf_page_count,
+                    (str(path),),
+                    on_done=partial(self._page_count_done, path),
+                    on_error=partial(self._page_count_failed, path)
+                )
 
         self._update_info()
         self._notify_change()
-        return True
+        return len(new_paths)
+
+    def _set_row_text(self, path: Path, text: str) -> None:
+        """Replace the listbox text for path, keeping its selection state."""
+        index = self._row_index.get(path)
+        if index is None:
+            # Removed while its page count was being read
+            return
+
+        selected = self.listbox.selection_includes(index)
+        self.listbox.delete(index)
+        self.listbox.insert(index, text)
+        if selected:
+            self.listbox.selection_set(index)
+
+    def _page_count_done(self, path: Path, page_count: int) -> None:
+        """Show the page count read for path."""
+        self._set_row_text(path, f"{_ICON_FILE} {path.name} ({page_count} pages)")
+
+    def _page_count_failed(self, path: Path, error: Exception) -> None:
+        """Drop the pending page count for a file that could not be read."""
+        self._set_row_text(path, f"{_ICON_FILE} {path.name}")
 
     def clear(self) -> None:
         """Clear all files from list."""
         self.listbox.delete(0, tk.END)
         self.files.clear()
+        self._row_index.clear()
         self._update_info()
         self._notify_change()
 
@@ -0,0 +1,136 @@
+"""
+Source file picker shared by the single-file dialogs.
+"""
+
+import tkinter as tk
+from functools import partial
+from pathlib import Path
+from typing import Callable, Optional
+
+from gui.utils.theme import (
+    COLORS, SPACING, HINT_STYLE, SECTION_STYLE, ENTRY_STYLE, BROWSE_BUTTON_STYLE, make_widget
+)
+from gui.utils.icons import get_icon
+from gui.utils.helpers import (
+    select_pdf_file, show_error, get_pdf_page_count, run_in_background
+)
+
+
+class InputFileFrame(tk.LabelFrame):
+    """
+    "Source File" section: read-only path entry, browse button and info label.
+
+    The page count is read off the Tk thread; the owner is told through
+    on_file_loaded once it is known, and through on_cleared whenever the
+    current file is dropped (new selection pending, read failure, reset).
+    """
+
+    def __init__(
+        self,
+        parent,
+        on_file_loaded: Callable[[str, int], None],
+        on_cleared: Optional[Callable[[], None]] = None
+    ):
+        """
+        Initialize input file frame.
+
+        Args:
+            parent: Parent widget
+            on_file_loaded: Called with (path, page_count) once a file is read
+            on_cleared: Called when no usable file is selected any more
+        """
+        super().__init__(parent, text="Source File", **SECTION_STYLE)
+        self.on_file_loaded = on_file_loaded
+        self.on_cleared = on_cleared
+        self.input_file = None
+        # Parsed once per selection for the owner's default output paths
+        self.input_path: Optional[Path] = None
+        self.page_count = 0
+
+        self._setup_ui()
+
+    def _setup_ui(self) -> None:
+        """Setup frame UI."""
+        select_frame = tk.Frame(self, bg=COLORS["bg_secondary"])
+        select_frame.pack(fill=tk.X)
+
+        # Read-only entries still follow their textvariable, so updating
+        # the path never needs a state toggle
+        self._input_var = tk.StringVar(self)
+        self.input_entry = make_widget(
+            tk.Entry, select_frame, ENTRY_STYLE,
+            textvariable=self._input_var, state="readonly"
+        )
+        self.input_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, SPACING["small"]))
+
+        browse_btn = make_widget(
+            tk.Button, select_frame, BROWSE_BUTTON_STYLE,
+            text=f"{get_icon('folder')} Select File", command=self._select_input_file,
+            bg=COLORS["accent"], fg="white"
+        )
+        browse_btn.pack(side=tk.LEFT)
+
+        self.file_info_label = make_widget(
+            tk.Label, self, HINT_STYLE, text="No file selected", anchor=tk.W
+        )
+        self.file_info_label.pack(fill=tk.X, pady=(SPACING["small"], 0))
+
+    def _cleared(self) -> None:
+        """Notify the owner that no file is usable."""
+        if self.on_cleared is not None:
+            self.on_cleared()
+
+    def _select_input_file(self) -> None:
+        """Select input PDF file."""
+        filepath = select_pdf_file()
+        if not filepath:
+            return
+
+        self.input_file = filepath
+        self.input_path = Path(filepath)
+        self._input_var.set(filepath)
+
+        # Read the page count off the Tk thread
+        self.page_count = 0
+        self.file_info_label.config(text="Reading file...", fg=COLORS["text_secondary"])
+        self._cleared()
+        run_in_background(
+            self,
+            get_pdf_page_count,
+            (filepath,),
+            on_done=partial(self._probe_done, filepath),
+            on_error=partial(self._probe_failed, filepath)
+        )
+
+    def _probe_done(self, filepath: str, page_count: int) -> None:
+        """Show the probed page count."""
+        if filepath != self.input_file:
+            # A newer selection superseded this probe
+            return
+
+        self.page_count = page_count
+        self.file_info_label.config(
+            text=f"{get_icon('success')} File loaded: {page_count} pages",
+            fg=COLORS["success"]
+        )
+        self.on_file_loaded(filepath, page_count)
+
+    def _probe_failed(self, filepath: str, error: Exception) -> None:
+        """Report a file that could not be read."""
+        if filepath != self.input_file:
+            return
+
+        show_error("Error", f"Cannot read PDF file:\n{str(error)}")
+        self.input_file = None
+        self.input_path = None
+        self.page_count = 0
+        self.file_info_label.config(text="File read failed", fg=COLORS["error"])
+        self._cleared()
+
+    def reset(self) -> None:
+        """Clear the selection without notifying the owner."""
+        self.input_file = None
+        self.input_path = None
+        self.page_count = 0
+        self._input_var.set("")
+        self.file_info_label.config(text="No file selected", fg=COLORS["text_secondary"])
@@ -4,10 +4,22 @@ Progress dialog widget for PDF operations.
 
 import tkinter as tk
 from tkinter import ttk
+from typing import Optional
 from gui.utils.theme import COLORS, FONTS
 from gui.utils.helpers import center_window
 
 
+# Longer status text (e.g. exception messages) is clipped before reaching Tk
+MAX_STATUS_CHARS = 200
+
+
+def _clip(text: str) -> str:
+    """Truncate text to MAX_STATUS_CHARS with a trailing ellipsis."""
+    if len(text) <= MAX_STATUS_CHARS:
+        return text
+    return text[:MAX_STATUS_CHARS - 3] + "..."
+
+
 class ProgressDialog(tk.Toplevel):
     """
     Modal dialog showing progress for PDF operations.
@@ -96,9 +108,9 @@ class ProgressDialog(tk.Toplevel):
             text: Main status text
             detail: Optional detail text
         """
-        self.status_label.config(text=text)
+        self.status_label.config(text=_clip(text))
         if detail:
-            self.detail_label.config(text=detail)
+            self.detail_label.config(text=_clip(detail))
         self.update()
 
     def set_progress(self, percent: float) -> None:
@@ -112,6 +124,26 @@ class ProgressDialog(tk.Toplevel):
         self.progress["value"] = percent
         self.update()
 
+    def update_progress(self, percent: Optional[float], text: str, detail: str = "") -> None:
+        """
+        Set determinate progress and status text with a single redraw.
+
+        Meant for callers already running inside the Tk event loop (e.g. an
+        after() poller), so pending events are not re-entered via update().
+
+        Args:
+            percent: Progress percentage (0-100), or None to leave the bar as is
+            text: Main status text
+            detail: Optional detail text
+        """
+        if percent is not None:
+            self.progress.stop()
+            self.progress.config(mode="determinate", value=percent)
+        self.status_label.config(text=_clip(text))
+        if detail:
+            self.detail_label.config(text=_clip(detail))
+        self.update_idletasks()
+
     def cancel(self) -> None:
         """Handle cancel button click."""
         self.cancelled = True
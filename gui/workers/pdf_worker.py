@@ -3,6 +3,12 @@ Background worker thread for PDF operations.
 """
 
 import threading
+import time
+import multiprocessing
+import queue
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Callable, Optional, Dict, Any
 import sys
 import os
@@ -10,11 +16,131 @@ import os
 # Add parent directory to path to import pdf_toolkit
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from pdf_toolkit import (
-    merge_pdfs, split_pdf, delete_pages,
-    rotate_pages, add_watermark, optimize_pdf,
-    get_pdf_info, ocr_pdf_to_text
-)
+# pdf_toolkit pulls in PyMuPDF, pikepdf, Pillow and pytesseract, so it is
+# imported on first use rather than when a dialog module is loaded.
+
+
+# OCR runs in a persistent worker process so rendering and Tesseract calls
+# do not compete with the Tk thread for the GIL. One worker keeps jobs (and
+# the shared progress queue) strictly sequential.
+_OCR_POOL: Optional[ProcessPoolExecutor] = None
+_OCR_PROGRESS: Optional[Any] = None
+_OCR_POOL_LOCK = threading.Lock()
+
+# Set inside the worker process by _init_ocr_process
+_worker_progress: Optional[Any] = None
+
+# Recent OCR text in the worker process, keyed by file identity and OCR settings
+_OCR_TEXT_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_OCR_TEXT_CACHE_SIZE = 4
+
+
+def _init_ocr_process(progress_queue: Any) -> None:
+    """Keep the progress queue and warm the OCR libraries in the worker process."""
+    global _worker_progress
+    _worker_progress = progress_queue
+    import pdf_toolkit
+    if pdf_toolkit.pytesseract is not None:
+        try:
+            pdf_toolkit.pytesseract.get_tesseract_version()
+        except Exception:
+            # Reported properly by the first job
+            pass
+
+
+def _report_ocr_progress(current: int, total: int, message: str) -> None:
+    """Forward a progress event from the worker process to the GUI process."""
+    if _worker_progress is not None:
+        _worker_progress.put((current, total, message))
+
+
+def _run_ocr_job(params: Dict[str, Any]) -> int:
+    """
+    Run one OCR job inside the worker process, reusing cached text when the file is unchanged.
+
+    The text itself stays in this process (it is already on disk in the
+    requested formats); only its length is sent back to the GUI.
+    """
+    from pdf_toolkit import ocr_pdf_to_text, save_ocr_outputs
+
+    input_pdf = params["input_pdf"]
+    language = params.get("language", "eng")
+    dpi = params.get("dpi", 300)
+    stat = os.stat(input_pdf)
+    key = (os.path.abspath(input_pdf), stat.st_mtime_ns, stat.st_size, language, dpi)
+
+    text = _OCR_TEXT_CACHE.get(key)
+    if text is not None:
+        # Same file and settings: only write the (possibly new) outputs
+        _OCR_TEXT_CACHE.move_to_end(key)
+        save_ocr_outputs(
+            text,
+            output_docx=params.get("output_docx"),
+            output_odt=params.get("output_odt"),
+            output_txt=params.get("output_txt")
+        )
+        return len(text)
+
+    text = ocr_pdf_to_text(
+        input_pdf,
+        output_docx=params.get("output_docx"),
+        output_odt=params.get("output_odt"),
+        output_txt=params.get("output_txt"),
+        language=language,
+        dpi=dpi,
+        progress_callback=_report_ocr_progress,
+        jobs=params.get("jobs", 1)
+    )
+    _OCR_TEXT_CACHE[key] = text
+    if len(_OCR_TEXT_CACHE) > _OCR_TEXT_CACHE_SIZE:
+        _OCR_TEXT_CACHE.popitem(last=False)
+    return len(text)
+
+
+def _rate_limited(callback: Callable, min_interval: float = 0.1) -> Callable:
+    """
+    Wrap a progress callback(current, total, message) so it fires at most ~10 times a second.
+
+    Phase messages (total == 0) and the final step always go through.
+    """
+    last = 0.0
+
+    def report(current: int, total: int, message: str) -> None:
+        nonlocal last
+        now = time.monotonic()
+        if total and current < total and now - last < min_interval:
+            return
+        last = now
+        callback(current, total, message)
+
+    return report
+
+
+def _get_ocr_pool():
+    """Return the shared OCR process pool and its progress queue, creating them once."""
+    global _OCR_POOL, _OCR_PROGRESS
+    with _OCR_POOL_LOCK:
+        if _OCR_POOL is None:
+            # spawn: forking a process that runs Tk threads is not safe
+            ctx = multiprocessing.get_context("spawn")
+            _OCR_PROGRESS = ctx.Queue()
+            _OCR_POOL = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=ctx,
+                initializer=_init_ocr_process,
+                initargs=(_OCR_PROGRESS,)
+            )
+        return _OCR_POOL, _OCR_PROGRESS
+
+
+def _discard_ocr_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker died so the next job starts a fresh one."""
+    global _OCR_POOL, _OCR_PROGRESS
+    with _OCR_POOL_LOCK:
+        if _OCR_POOL is pool:
+            _OCR_POOL = None
+            _OCR_PROGRESS = None
+    pool.shutdown(wait=False)
 
 
 class PDFWorker(threading.Thread):
@@ -39,7 +165,7 @@ class PDFWorker(threading.Thread):
             params: Parameters for the operation
             on_complete: Callback function on successful completion
             on_error: Callback function on error
-            on_progress: Callback function for progress updates (not implemented yet)
+            on_progress: Callback function for progress updates (ocr only)
         """
         super().__init__(daemon=True)
         self.operation = operation
@@ -53,6 +179,12 @@ class PDFWorker(threading.Thread):
     def run(self) -> None:
         """Execute the PDF operation in background."""
         try:
+            from pdf_toolkit import (
+                merge_pdfs, split_pdf, delete_pages,
+                rotate_pages, add_watermark, optimize_pdf,
+                get_pdf_info
+            )
+
             if self.operation == "merge":
                 merge_pdfs(
                     self.params["input_pdfs"],
@@ -64,7 +196,9 @@ class PDFWorker(threading.Thread):
                 split_pdf(
                     self.params["input_pdf"],
                     self.params["output_dir"],
-                    self.params.get("page_spec")
+                    self.params.get("page_spec"),
+                    page_ranges=self.params.get("page_ranges"),
+                    workers=self.params.get("workers")
                 )
                 self.result = {"output_dir": self.params["output_dir"]}
 
@@ -80,7 +214,7 @@ class PDFWorker(threading.Thread):
                 rotate_pages(
                     self.params["input_pdf"],
                     self.params["output_pdf"],
-                    self.params["page_spec"],
+                    None if self.params.get("all_pages") else self.params["page_spec"],
                     self.params["angle"]
                 )
                 self.result = {"output": self.params["output_pdf"]}
@@ -93,12 +227,13 @@ class PDFWorker(threading.Thread):
                     size=self.params.get("size", 36),
                     alpha=self.params.get("alpha", 0.3),
                     angle=self.params.get("angle", 0),
-                    color=self.params.get("color", (0.5, 0.5, 0.5))
+                    color=self.params.get("color", (0.5, 0.5, 0.5)),
+                    mode=self.params.get("mode", "text")
                 )
                 self.result = {"output": self.params["output_pdf"]}
 
             elif self.operation == "optimize":
-                optimize_pdf(
+                output_size = optimize_pdf(
                     self.params["input_pdf"],
                     self.params["output_pdf"],
                     linearize=self.params.get("linearize", False),
@@ -109,25 +244,20 @@ class PDFWorker(threading.Thread):
                     compress_images=self.params.get("compress_images", True),
                     remove_duplicates=self.params.get("remove_duplicates", True),
                     target_reduction=self.params.get("target_reduction"),
+                    recompress=self.params.get("recompress"),
+                    workers=self.params.get("workers"),
+                    progress_callback=_rate_limited(self.on_progress) if self.on_progress else None,
                 )
-                self.result = {"output": self.params["output_pdf"]}
+                self.result = {"output": self.params["output_pdf"], "output_size": output_size}
 
             elif self.operation == "info":
                 info = get_pdf_info(self.params["input_pdf"])
                 self.result = info
 
             elif self.operation == "ocr":
-                text = ocr_pdf_to_text(
-                    self.params["input_pdf"],
-                    output_docx=self.params.get("output_docx"),
-                    output_odt=self.params.get("output_odt"),
-                    output_txt=self.params.get("output_txt"),
-                    language=self.params.get("language", "eng"),
-                    dpi=self.params.get("dpi", 300),
-                    progress_callback=self.on_progress
-                )
+                char_count = self._run_ocr()
                 self.result = {
-                    "text": text,
+                    "chars": char_count,
                     "outputs": {
                         "docx": self.params.get("output_docx"),
                         "odt": self.params.get("output_odt"),
@@ -146,3 +276,26 @@ class PDFWorker(threading.Thread):
             self.error = str(e)
             if self.on_error:
                 self.on_error(self.error)
+
+    def _run_ocr(self) -> int:
+        """Submit OCR to the shared process pool and relay its progress events."""
+        pool, progress_queue = _get_ocr_pool()
+        try:
+            future = pool.submit(_run_ocr_job, self.params)
+
+            while True:
+                try:
+                    event = progress_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if future.done():
+                        break
+                    continue
+                if self.on_progress:
+                    self.on_progress(*event)
+
+            return future.result()
+        except BrokenProcessPool:
+            _discard_ocr_pool(pool)
+            raise RuntimeError(
+                "The OCR worker process stopped unexpectedly. Please try again."
+            ) from None
@@ -9,7 +9,10 @@ from __future__ import annotations
 import argparse
 import io
 import json
+import os
 import sys
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import ExitStack
 from pathlib import Path
 from typing import Any, Dict, List, Sequence
@@ -60,6 +63,16 @@ except ImportError:  # pragma: no cover - handled at runtime
     TextProperties = None
     ParagraphProperties = None
 
+try:
+    import deflate as libdeflate  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional, used for maximum compression
+    libdeflate = None
+
+try:
+    from zopfli import zlib as zopfli_zlib  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional, used for maximum compression
+    zopfli_zlib = None
+
 try:
     import subprocess
 except ImportError:  # pragma: no cover - subprocess is standard library
@@ -520,7 +533,17 @@ def merge_pdfs(input_pdfs: Sequence[str], output_pdf: str) -> None:
     print(f"✓ 成功合併 {len(input_pdfs)} 個檔案，總共 {total_pages} 頁")
 
 
-def split_pdf(input_pdf: str, output_dir: str, page_spec: str | None = None) -> None:
+# Below this many output files the process start-up costs more than it saves
+_SPLIT_PARALLEL_MIN_RANGES = 8
+
+
+def split_pdf(
+    input_pdf: str,
+    output_dir: str,
+    page_spec: str | None = None,
+    page_ranges: Sequence[tuple[int, int]] | None = None,
+    workers: int | None = None,
+) -> None:
     """
     Split a PDF into separate documents by single pages or ranges.
 
@@ -528,12 +551,15 @@ def split_pdf(input_pdf: str, output_dir: str, page_spec: str | None = None) ->
         input_pdf: Source PDF path.
         output_dir: Directory where split files will be created.
         page_spec: Optional page specification string for selective splitting.
+        page_ranges: Optional already parsed 0-based inclusive (start, end)
+            ranges, one output file each; takes precedence over page_spec.
+        workers: Processes used to write the output files (default 1).
 
     Raises:
         ImportError: If PyMuPDF is not installed.
         FileNotFoundError: If the input PDF does not exist.
         PermissionError: If the input PDF is encrypted.
-        ValueError: If the page specification is invalid or empty.
+        ValueError: If the page specification or ranges are invalid or empty.
         OSError: If the output directory cannot be created or written.
     """
     if fitz is None:
@@ -556,48 +582,133 @@ def split_pdf(input_pdf: str, output_dir: str, page_spec: str | None = None) ->
     print(f"拆分 PDF（總共 {total_pages} 頁）...")
 
     try:
-        if page_spec is None:
-            groups = [[page_index] for page_index in range(total_pages)]
+        if page_ranges is not None:
+            groups = [(start, end) for start, end in page_ranges]
+            if not groups:
+                raise ValueError("頁碼範圍解析結果為空，請確認輸入。")
+            for start, end in groups:
+                if not 0 <= start <= end < total_pages:
+                    raise ValueError(f"頁碼範圍超出範圍：{start + 1}-{end + 1}.")
+        elif page_spec is None:
+            groups = [(page_index, page_index) for page_index in range(total_pages)]
         else:
             indexes = parse_page_spec(page_spec, total_pages)
             if not indexes:
                 raise ValueError("頁碼範圍解析結果為空，請確認輸入。")
-            groups = _group_consecutive(indexes)
-
-        created_files = 0
-        for group in tqdm(groups, desc="拆分 PDF", unit="檔"):
-            start_index = group[0]
-            end_index = group[-1]
-            new_document = fitz.open()
-            for page_index in group:
-                new_document.insert_pdf(
-                    document,
-                    from_page=page_index,
-                    to_page=page_index,
-                )
+            groups = [(group[0], group[-1]) for group in _group_consecutive(indexes)]
+
+        workers = min(max(1, workers or 1), len(groups))
+        if workers > 1 and len(groups) >= _SPLIT_PARALLEL_MIN_RANGES:
+            # Each process opens its own copy of the source; MuPDF serialises
+            # threads, but separate processes scale with the core count
+            document.close()
+            document = None
+            created_files = _split_in_processes(
+                input_pdf, output_path, base_name, groups, workers
+            )
+        else:
+            created_files = 0
+            for start_index, end_index in tqdm(groups, desc="拆分 PDF", unit="檔"):
+                _save_page_range(document, output_path, base_name, start_index, end_index)
+                created_files += 1
 
-            if len(group) == 1:
-                filename = f"{base_name}_page_{start_index + 1:03d}.pdf"
-            else:
-                filename = (
-                    f"{base_name}_pages_{start_index + 1:03d}-{end_index + 1:03d}.pdf"
-                )
+    finally:
+        if document is not None:
+            document.close()
 
-            output_file = output_path / filename
-            try:
-                new_document.save(output_file.as_posix())
-            except OSError as exc:
-                new_document.close()
-                raise OSError(f"無法寫入輸出檔案：{output_file}") from exc
-            finally:
-                new_document.close()
+    print(f"✓ 成功拆分為 {created_files} 個檔案")
 
-            created_files += 1
 
+def _save_page_range(
+    document, output_path: Path, base_name: str, start_index: int, end_index: int
+) -> None:
+    """
+    Copy one consecutive page range of an open document into its own file.
+
+    Args:
+        document: Open source fitz.Document.
+        output_path: Existing output directory.
+        base_name: Stem used for the output file names.
+        start_index: First 0-based page of the range.
+        end_index: Last 0-based page of the range (inclusive).
+
+    Raises:
+        OSError: If the output file cannot be written.
+    """
+    new_document = fitz.open()
+    # Groups are consecutive, so one call copies the whole range and
+    # resources shared between its pages are copied once
+    new_document.insert_pdf(
+        document,
+        from_page=start_index,
+        to_page=end_index,
+    )
+
+    if start_index == end_index:
+        filename = f"{base_name}_page_{start_index + 1:03d}.pdf"
+    else:
+        filename = (
+            f"{base_name}_pages_{start_index + 1:03d}-{end_index + 1:03d}.pdf"
+        )
+
+    output_file = output_path / filename
+    try:
+        new_document.save(output_file.as_posix())
+    except OSError as exc:
+        raise OSError(f"無法寫入輸出檔案：{output_file}") from exc
+    finally:
+        new_document.close()
+
+
+def _split_chunk(
+    input_pdf: str, output_dir: str, base_name: str, ranges: Sequence[tuple[int, int]]
+) -> int:
+    """
+    Worker-process entry point: write one file per range from its own document.
+
+    Returns:
+        Number of files written.
+    """
+    document = safe_open_pdf(input_pdf)
+    try:
+        for start_index, end_index in ranges:
+            _save_page_range(document, Path(output_dir), base_name, start_index, end_index)
     finally:
         document.close()
+    return len(ranges)
 
-    print(f"✓ 成功拆分為 {created_files} 個檔案")
+
+def _split_in_processes(
+    input_pdf: str,
+    output_path: Path,
+    base_name: str,
+    groups: Sequence[tuple[int, int]],
+    workers: int,
+) -> int:
+    """
+    Write the split ranges from a pool of processes.
+
+    Ranges are dealt round-robin so every process gets a similar share of
+    early and late pages.
+
+    Returns:
+        Number of files written.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    chunks = [list(groups[offset::workers]) for offset in range(workers)]
+    created_files = 0
+    # spawn: the GUI calls this from a thread, where forking is not safe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(_split_chunk, input_pdf, output_path.as_posix(), base_name, chunk)
+            for chunk in chunks
+        ]
+        for future in tqdm(as_completed(futures), total=len(futures), desc="拆分 PDF", unit="批"):
+            created_files += future.result()
+    return created_files
 
 
 def _group_consecutive(indexes: Sequence[int]) -> List[List[int]]:
@@ -690,14 +801,15 @@ def delete_pages(input_pdf: str, output_pdf: str, page_spec: str) -> None:
     )
 
 
-def rotate_pages(input_pdf: str, output_pdf: str, page_spec: str, angle: int) -> None:
+def rotate_pages(input_pdf: str, output_pdf: str, page_spec: str | None, angle: int) -> None:
     """
     Rotate selected pages in a PDF document.
 
     Args:
         input_pdf: Source PDF path.
         output_pdf: Destination PDF path.
-        page_spec: Page specification containing pages to rotate.
+        page_spec: Page specification containing pages to rotate, or None
+            to rotate every page.
         angle: Rotation angle (must be 90, 180, or 270).
 
     Raises:
@@ -719,15 +831,23 @@ def rotate_pages(input_pdf: str, output_pdf: str, page_spec: str, angle: int) ->
 
     try:
         total_pages = document.page_count
-        page_indexes = parse_page_spec(page_spec, total_pages)
-        if not page_indexes:
-            raise ValueError("請提供至少一個要旋轉的頁碼。")
+        if page_spec is None:
+            # Every page: walk the document directly, no index list needed
+            print(f"旋轉全部 {total_pages} 個頁面 {angle} 度...")
+            for page in tqdm(document, total=total_pages, desc="旋轉頁面", unit="頁"):
+                page.set_rotation((page.rotation + angle) % 360)
+            rotated_count = total_pages
+        else:
+            page_indexes = parse_page_spec(page_spec, total_pages)
+            if not page_indexes:
+                raise ValueError("請提供至少一個要旋轉的頁碼。")
 
-        print(f"旋轉 {len(page_indexes)} 個頁面 {angle} 度...")
-        for page_index in tqdm(page_indexes, desc="旋轉頁面", unit="頁"):
-            page = document[page_index]
-            new_rotation = (page.rotation + angle) % 360
-            page.set_rotation(new_rotation)
+            print(f"旋轉 {len(page_indexes)} 個頁面 {angle} 度...")
+            for page_index in tqdm(page_indexes, desc="旋轉頁面", unit="頁"):
+                page = document[page_index]
+                new_rotation = (page.rotation + angle) % 360
+                page.set_rotation(new_rotation)
+            rotated_count = len(page_indexes)
 
         try:
             document.save(output_pdf)
@@ -736,7 +856,7 @@ def rotate_pages(input_pdf: str, output_pdf: str, page_spec: str, angle: int) ->
     finally:
         document.close()
 
-    print(f"✓ 成功旋轉 {len(page_indexes)} 個頁面")
+    print(f"✓ 成功旋轉 {rotated_count} 個頁面")
 
 
 # ============= 內容編輯區 =============
@@ -749,6 +869,7 @@ def add_watermark(
     alpha: float = 0.3,
     angle: int = 0,
     color: tuple[float, float, float] = (0.5, 0.5, 0.5),
+    mode: str = "text",
 ) -> None:
     """
     Add a text watermark across every page of the PDF.
@@ -761,6 +882,8 @@ def add_watermark(
         alpha: Opacity between 0 and 1 (default 0.3).
         angle: Rotation angle applied to the watermark - must be 0, 90, 180, or 270 (default 0).
         color: Text color expressed as an RGB tuple with values in [0, 1].
+        mode: "text" lays the text out on every page; "xobject" lays it out
+            once per page size and stamps the result with show_pdf_page.
 
     Raises:
         ImportError: If PyMuPDF is not installed.
@@ -779,6 +902,8 @@ def add_watermark(
         raise ValueError("水印旋轉角度僅支援 0、90、180、270 度。")
     if len(color) != 3 or any(component < 0 or component > 1 for component in color):
         raise ValueError("顏色需為三個 0-1 之間的浮點值，例如 (0.5, 0.5, 0.5)。")
+    if mode not in {"text", "xobject"}:
+        raise ValueError("水印模式僅支援 text 或 xobject。")
 
     try:
         document = safe_open_pdf(input_pdf)
@@ -788,8 +913,8 @@ def add_watermark(
     try:
         total_pages = document.page_count
         print(f"添加水印 \"{text}\" 到 {total_pages} 頁...")
-        for page_index in tqdm(range(total_pages), desc="添加水印", unit="頁"):
-            page = document[page_index]
+
+        def draw_text(page) -> None:
             text_rect = fitz.Rect(0, 0, page.rect.width, page.rect.height)
             page.insert_textbox(
                 text_rect,
@@ -801,6 +926,29 @@ def add_watermark(
                 overlay=True,
                 fill_opacity=alpha,
             )
+
+        # One stamp page per distinct page size, shown on every page of that size
+        stamps = fitz.open() if mode == "xobject" else None
+        stamp_pages: dict[tuple[float, float], int] = {}
+        try:
+            for page_index in tqdm(range(total_pages), desc="添加水印", unit="頁"):
+                page = document[page_index]
+                if stamps is None or page.rotation:
+                    # Rotated pages keep the direct path so the text lands
+                    # exactly where insert_textbox would put it
+                    draw_text(page)
+                    continue
+
+                key = (round(page.rect.width, 2), round(page.rect.height, 2))
+                stamp_number = stamp_pages.get(key)
+                if stamp_number is None:
+                    stamp_number = stamp_pages[key] = stamps.page_count
+                    draw_text(stamps.new_page(width=key[0], height=key[1]))
+                page.show_pdf_page(page.rect, stamps, stamp_number, overlay=True)
+        finally:
+            if stamps is not None:
+                stamps.close()
+
         try:
             document.save(output_pdf)
         except OSError as exc:
@@ -1144,15 +1292,101 @@ def convert_docx_to_pdf(docx_path: str, pdf_path: str) -> None:
 
 # ============= 壓縮優化區 =============
 
+# PyMuPDF save options used when rewriting a PDF after image downsampling.
+# Already-deflated streams are detected by MuPDF and not re-encoded.
+# garbage=4, deflate and clean are what this save always used; deflate_images
+# and deflate_fonts were added so image and font streams are compressed too.
+FITZ_SAVE_FLAGS: dict[str, Any] = {
+    "garbage": 4,
+    "deflate": True,
+    "deflate_images": True,
+    "deflate_fonts": True,
+    "clean": True,
+}
+
+
+def _encode_downsampled_jpeg(
+    mode: str,
+    size: tuple[int, int],
+    samples: bytes,
+    new_size: tuple[int, int],
+    jpeg_quality: int,
+) -> bytes:
+    """Resize raw pixel samples (if needed) and encode them as an RGB JPEG."""
+    image = Image.frombytes(mode, size, samples)
+    if new_size != size:
+        image = image.resize(new_size, Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    # Always save as RGB JPEG to maximize compression
+    image.convert("RGB").save(buffer, format="JPEG", quality=jpeg_quality, **JPEG_SAVE_OPTIONS)
+    return buffer.getvalue()
+
+
+# Pillow JPEG options for re-encoded images: optimized Huffman tables and
+# progressive scans are typically several percent smaller than baseline.
+JPEG_SAVE_OPTIONS: dict[str, Any] = {"optimize": True, "progressive": True}
+
+_jpeg_backend_checked = False
+
+
+def _warn_if_slow_jpeg_encoder() -> None:
+    """Print a one-time hint when Pillow is not built with libjpeg-turbo."""
+    global _jpeg_backend_checked
+    if _jpeg_backend_checked or Image is None:
+        return
+    _jpeg_backend_checked = True
+    try:
+        from PIL import features  # type: ignore[import-not-found]
+        has_turbo = features.check_feature("libjpeg_turbo")
+    except Exception:
+        return
+    if not has_turbo:
+        print("⚠ Pillow 未使用 libjpeg-turbo，圖片壓縮會較慢；建議安裝官方 Pillow wheel。")
+
 
-def _downsample_images_once(pdf_path: Path, scale_factor: float, jpeg_quality: int) -> bool:
+def _image_display_dpi(page, xref: int, pixel_width: int) -> float:
+    """
+    Return the lowest effective DPI at which image *xref* is drawn on *page*.
+
+    Uses the largest placement rectangle; returns ``inf`` when the image is
+    not placed directly on the page (e.g. only inside a form XObject).
+    """
+    try:
+        rects = page.get_image_rects(xref)
+    except Exception:
+        return float("inf")
+    widest = max((rect.width for rect in rects), default=0)
+    if widest <= 0:
+        return float("inf")
+    return pixel_width / (widest / 72)
+
+
+def _downsample_images_once(
+    pdf_path: Path,
+    scale_factor: float,
+    jpeg_quality: int,
+    save_flags: dict[str, Any] | None = None,
+    workers: int | None = None,
+    progress_callback=None,
+    target_dpi: int | None = None,
+) -> bool:
     """
     Perform a single pass of image downsampling on the given PDF.
 
+    Pixmaps are extracted on the calling thread (PyMuPDF is not thread-safe);
+    resizing and JPEG encoding run on a thread pool, since Pillow releases
+    the GIL for both. Images shared by several pages are processed once.
+
     Args:
         pdf_path: Path to the PDF file to process (overwritten in place).
         scale_factor: Factor (0-1] used to resize image dimensions.
         jpeg_quality: JPEG quality (1-95) for recompressed images.
+        save_flags: PyMuPDF ``Document.save`` options (default FITZ_SAVE_FLAGS).
+        workers: Encoder threads (default os.cpu_count()).
+        progress_callback: Optional callback function(current, total, message) called per page.
+        target_dpi: Images already displayed at or below this resolution are left
+            untouched. Re-encoded images are only written back when smaller.
 
     Returns:
         True if any images were downsampled, False otherwise.
@@ -1160,50 +1394,78 @@ def _downsample_images_once(pdf_path: Path, scale_factor: float, jpeg_quality: i
     if fitz is None or Image is None:
         return False
 
+    workers = max(1, workers or os.cpu_count() or 1)
     doc = fitz.open(pdf_path.as_posix())
     updated = False
 
     try:
-        for page_index in range(len(doc)):
-            image_entries = doc.get_page_images(page_index, full=True)
-            if not image_entries:
-                continue
-
-            page = doc.load_page(page_index)
-            for entry in image_entries:
-                xref = entry[0]
-                pix = fitz.Pixmap(doc, xref)
-
-                # Skip extremely small images or masks
-                if pix.width < 32 or pix.height < 32 or pix.n == 0:
-                    continue
-
-                if pix.n >= 5:  # Convert CMYK/others to RGB
-                    pix = fitz.Pixmap(fitz.csRGB, pix)
-
-                mode = "RGB" if pix.n >= 3 else "L"
-                image = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
-
-                new_width = max(1, int(pix.width * scale_factor))
-                new_height = max(1, int(pix.height * scale_factor))
-                if new_width == pix.width and new_height == pix.height and jpeg_quality >= 80:
-                    continue  # Nothing to change
-
-                if scale_factor < 0.99:
-                    image = image.resize((new_width, new_height), Image.LANCZOS)
-
-                buffer = io.BytesIO()
-                # Always save as RGB JPEG to maximize compression
-                jpeg_image = image.convert("RGB")
-                jpeg_image.save(buffer, format="JPEG", quality=jpeg_quality, optimize=True)
-                buffer.seek(0)
-
-                page.replace_image(xref, stream=buffer.getvalue())
-                updated = True
+        seen_xrefs: set[int] = set()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: Dict[Any, tuple[int, int, int]] = {}
+
+            def _apply(futures) -> None:
+                nonlocal updated
+                for future in futures:
+                    page_index, xref, old_length = pending.pop(future)
+                    new_bytes = future.result()
+                    if len(new_bytes) >= old_length:
+                        continue  # Re-encoding would not save anything
+                    doc[page_index].replace_image(xref, stream=new_bytes)
+                    updated = True
+
+            total_pages = len(doc)
+            for page_index in range(total_pages):
+                if progress_callback:
+                    progress_callback(
+                        page_index + 1, total_pages,
+                        f"Compressing images: page {page_index + 1} of {total_pages}"
+                    )
+                image_entries = doc.get_page_images(page_index, full=True)
+                page = doc[page_index] if image_entries and target_dpi else None
+                for entry in image_entries:
+                    xref = entry[0]
+                    if xref in seen_xrefs:
+                        continue
+                    seen_xrefs.add(xref)
+
+                    if page is not None and _image_display_dpi(page, xref, entry[2]) <= target_dpi:
+                        continue  # Already at or below the target resolution
+
+                    pix = fitz.Pixmap(doc, xref)
+
+                    # Skip extremely small images or masks
+                    if pix.width < 32 or pix.height < 32 or pix.n == 0:
+                        continue
+
+                    if pix.n >= 5:  # Convert CMYK/others to RGB
+                        pix = fitz.Pixmap(fitz.csRGB, pix)
+
+                    mode = "RGB" if pix.n >= 3 else "L"
+                    size = (pix.width, pix.height)
+
+                    new_width = max(1, int(pix.width * scale_factor))
+                    new_height = max(1, int(pix.height * scale_factor))
+                    if new_width == pix.width and new_height == pix.height and jpeg_quality >= 80:
+                        continue  # Nothing to change
+
+                    new_size = (new_width, new_height) if scale_factor < 0.99 else size
+                    future = executor.submit(
+                        _encode_downsampled_jpeg, mode, size, pix.samples, new_size, jpeg_quality
+                    )
+                    pending[future] = (page_index, xref, len(doc.xref_stream_raw(xref) or b""))
+
+                    # Bound the raw pixel data held in memory
+                    if len(pending) >= workers * 2:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        _apply(done)
+
+            _apply(list(pending))
     finally:
         if updated:
+            if progress_callback:
+                progress_callback(0, 0, "Writing optimized file...")
             temp_path = pdf_path.with_suffix(".tmp_optim.pdf")
-            doc.save(temp_path.as_posix(), garbage=4, deflate=True, clean=True)
+            doc.save(temp_path.as_posix(), **(save_flags or FITZ_SAVE_FLAGS))
             doc.close()
             temp_path.replace(pdf_path)
         else:
@@ -1212,18 +1474,31 @@ def _downsample_images_once(pdf_path: Path, scale_factor: float, jpeg_quality: i
     return updated
 
 
-def _apply_low_quality_downsampling(pdf_path: Path, target_ratio: float) -> None:
+def _apply_low_quality_downsampling(
+    pdf_path: Path,
+    target_ratio: float,
+    save_flags: dict[str, Any] | None = None,
+    workers: int | None = None,
+    progress_callback=None,
+    target_dpi: int | None = None,
+) -> None:
     """
     Aggressively downsample images to approach a desired size reduction.
 
     Args:
         pdf_path: Path to the PDF file to optimize.
         target_ratio: Target fraction of the original file size (e.g., 0.5 for 50%).
+        save_flags: PyMuPDF ``Document.save`` options (default FITZ_SAVE_FLAGS).
+        workers: Image encoder threads (default os.cpu_count()).
+        progress_callback: Optional callback function(current, total, message) for progress updates.
+        target_dpi: Skip images already displayed at or below this DPI.
     """
     if fitz is None or Image is None:
         print("⚠ 低品質壓縮需要 PyMuPDF 與 Pillow，已改為保留基礎壓縮。")
         return
 
+    _warn_if_slow_jpeg_encoder()
+
     if target_ratio <= 0 or target_ratio >= 1:
         target_ratio = 0.5
 
@@ -1239,13 +1514,115 @@ def _apply_low_quality_downsampling(pdf_path: Path, target_ratio: float) -> None
 
     while current_size > target_size and passes < 3:
         passes += 1
-        updated = _downsample_images_once(pdf_path, scale_factor, jpeg_quality)
+        updated = _downsample_images_once(
+            pdf_path,
+            scale_factor,
+            jpeg_quality,
+            save_flags=save_flags,
+            workers=workers,
+            progress_callback=progress_callback,
+            target_dpi=target_dpi,
+        )
         if not updated:
             break
         current_size = pdf_path.stat().st_size
         scale_factor = max(0.55, scale_factor * 0.85)
         jpeg_quality = max(38, jpeg_quality - 8)
 
+
+def _dedupe_identical_streams(source_path: Path, work_path: Path) -> Path | None:
+    """
+    Merge byte-identical objects and streams (PyMuPDF garbage=4) into *work_path*.
+
+    Returns:
+        *work_path* when the deduplicated copy is smaller than *source_path*,
+        otherwise None (and no file is left behind).
+    """
+    if fitz is None:
+        return None
+
+    try:
+        with fitz.open(source_path.as_posix()) as doc:
+            if doc.needs_pass:
+                return None
+            doc.save(work_path.as_posix(), garbage=4, deflate=True)
+    except Exception:
+        work_path.unlink(missing_ok=True)
+        return None
+
+    if work_path.stat().st_size < source_path.stat().st_size:
+        return work_path
+    work_path.unlink(missing_ok=True)
+    return None
+
+
+def available_flate_recompressors() -> list[str]:
+    """Return the optional high-ratio Flate encoders installed ("libdeflate12", "zopfli")."""
+    methods = []
+    if libdeflate is not None:
+        methods.append("libdeflate12")
+    if zopfli_zlib is not None:
+        methods.append("zopfli")
+    return methods
+
+
+def _recompress_flate_streams(pdf_path: Path, method: str, linearize: bool = False) -> int:
+    """
+    Re-encode every plain FlateDecode stream with a stronger (slower) encoder.
+
+    The decoded data is unchanged, so readers see identical content; only
+    streams that end up smaller are replaced.
+
+    Args:
+        pdf_path: PDF to rewrite in place.
+        method: "libdeflate12" or "zopfli".
+        linearize: Linearize the rewritten file, so an earlier linearizing
+            save is not undone.
+
+    Returns:
+        Number of bytes saved across all replaced streams.
+    """
+    if method == "libdeflate12" and libdeflate is not None:
+        def compress(data: bytes) -> bytes:
+            return libdeflate.zlib_compress(data, 12)
+    elif method == "zopfli" and zopfli_zlib is not None:
+        compress = zopfli_zlib.compress
+    else:
+        print(f"⚠ 無法使用 {method} 重新壓縮（未安裝對應套件），已略過。")
+        return 0
+
+    saved = 0
+    temp_path = pdf_path.with_suffix(".tmp_flate.pdf")
+    with pikepdf.open(pdf_path.as_posix()) as pdf:
+        for obj in pdf.objects:
+            if not isinstance(obj, pikepdf.Stream):
+                continue
+            # Only single-filter Flate streams; chained filters are left alone
+            if obj.get("/Filter") != pikepdf.Name.FlateDecode:
+                continue
+            raw = obj.read_raw_bytes()
+            try:
+                data = zlib.decompress(raw)
+            except zlib.error:
+                continue
+            packed = compress(data)
+            if len(packed) < len(raw):
+                obj.write(packed, filter=pikepdf.Name.FlateDecode, decode_parms=obj.get("/DecodeParms"))
+                saved += len(raw) - len(packed)
+
+        if saved:
+            pdf.save(
+                temp_path.as_posix(),
+                linearize=linearize,
+                object_stream_mode=pikepdf.ObjectStreamMode.preserve,
+                stream_decode_level=pikepdf.StreamDecodeLevel.none,
+            )
+
+    if saved:
+        temp_path.replace(pdf_path)
+    return saved
+
+
 def optimize_pdf(
     input_pdf: str,
     output_pdf: str,
@@ -1257,7 +1634,11 @@ def optimize_pdf(
     compress_images: bool = True,
     remove_duplicates: bool = True,
     target_reduction: float | None = None,
-) -> None:
+    save_flags: dict[str, Any] | None = None,
+    recompress: str | None = None,
+    workers: int | None = None,
+    progress_callback=None,
+) -> int:
     """
     Optimize a PDF file using pikepdf, optionally enabling linearization or aggressive image handling.
 
@@ -1266,7 +1647,18 @@ def optimize_pdf(
         output_pdf: Destination PDF path.
         linearize: Enable Fast-Web-View linearization when True.
         aggressive: Placeholder flag for advanced image resampling (not fully implemented).
-        dpi: Target DPI for aggressive mode (validated but not applied in simplified workflow).
+        dpi: Target DPI for image downsampling; images already displayed at or
+            below it are not re-encoded.
+        save_flags: PyMuPDF ``Document.save`` options used when images are rewritten
+            (default FITZ_SAVE_FLAGS); passed through verbatim.
+        recompress: Optional final lossless pass re-encoding FlateDecode streams
+            ("libdeflate12" or "zopfli"); see available_flate_recompressors().
+        workers: Threads used to re-encode images (default os.cpu_count()).
+        progress_callback: Optional callback function(current, total, message) for progress
+            updates; total is 0 for phase changes without a page count.
+
+    Returns:
+        Size of the written output file in bytes.
 
     Raises:
         ImportError: If required libraries are not installed.
@@ -1291,20 +1683,29 @@ def optimize_pdf(
     mode_label = "進階" if aggressive else "基礎"
     print(f"優化 PDF（{mode_label}模式）...")
 
+    def report(current: int, total: int, message: str) -> None:
+        if progress_callback:
+            progress_callback(current, total, message)
+
+    report(0, 0, "Cleaning document structure...")
+
+    # Identical streams (repeated logos, fonts, images) are merged before the
+    # pikepdf pass so linearization still sees the final object layout.
+    dedup_path = None
+    if remove_duplicates:
+        report(0, 0, "Merging duplicate streams...")
+        dedup_path = _dedupe_identical_streams(source_path, Path(output_pdf).with_suffix(".tmp_dedup.pdf"))
+    structure_source = dedup_path.as_posix() if dedup_path else input_pdf
+
     try:
-        with pikepdf.open(input_pdf) as pdf:
+        with pikepdf.open(structure_source) as pdf:
             if remove_unused and hasattr(pdf, "remove_unreferenced_resources"):
                 try:
                     pdf.remove_unreferenced_resources()
                 except Exception:
                     pass
 
-            if remove_duplicates and hasattr(pdf, "remove_duplicate_font_dicts"):
-                try:
-                    pdf.remove_duplicate_font_dicts()
-                except Exception:
-                    pass
-
+            report(0, 0, "Linearizing and writing..." if linearize else "Writing compressed file...")
             for _ in tqdm(["結構清理"], desc="壓縮 PDF", unit="步驟"):
                 pdf.save(
                     output_pdf,
@@ -1321,6 +1722,9 @@ def optimize_pdf(
         raise ValueError(f"無法讀取 PDF 檔案：{input_pdf}") from exc
     except OSError as exc:
         raise OSError(f"無法寫入輸出檔案：{output_pdf}") from exc
+    finally:
+        if dedup_path:
+            dedup_path.unlink(missing_ok=True)
 
     output_path = Path(output_pdf)
 
@@ -1331,9 +1735,27 @@ def optimize_pdf(
         desired_ratio = max(0.05, min(0.95, desired_ratio))
 
     if quality == "low" and compress_images:
-        _apply_low_quality_downsampling(output_path, desired_ratio or 0.5)
+        _apply_low_quality_downsampling(
+            output_path,
+            desired_ratio or 0.5,
+            save_flags=save_flags,
+            workers=workers,
+            progress_callback=progress_callback,
+            target_dpi=dpi,
+        )
     elif aggressive and compress_images:
-        _apply_low_quality_downsampling(output_path, desired_ratio or 0.6)
+        _apply_low_quality_downsampling(
+            output_path,
+            desired_ratio or 0.6,
+            save_flags=save_flags,
+            workers=workers,
+            progress_callback=progress_callback,
+            target_dpi=dpi,
+        )
+
+    if recompress:
+        report(0, 0, "Recompressing streams...")
+        _recompress_flate_streams(output_path, recompress, linearize=linearize)
 
     new_size = output_path.stat().st_size
 
@@ -1345,16 +1767,24 @@ def optimize_pdf(
         f"✓ 壓縮完成：{format_file_size(original_size)} → {format_file_size(new_size)}"
         f"（節省 {saved_ratio:.1f}%）"
     )
+    return new_size
 
 
 # ============= OCR Functions =============
 
 
+def _ocr_png_page(png_data: bytes, language: str) -> str:
+    """Run Tesseract on one rendered page (PNG bytes)."""
+    img = Image.open(io.BytesIO(png_data))
+    return pytesseract.image_to_string(img, lang=language)
+
+
 def extract_text_from_pdf_ocr(
     input_pdf: str,
     language: str = "eng",
     dpi: int = 300,
     progress_callback=None,
+    jobs: int = 1,
 ) -> str:
     """
     Extract text from a PDF using OCR (Optical Character Recognition).
@@ -1369,6 +1799,9 @@ def extract_text_from_pdf_ocr(
                   Common codes: eng, chi_sim, chi_tra, fra, deu, spa, jpn, etc.
         dpi: DPI resolution for rendering pages (default 300).
         progress_callback: Optional callback function(current, total, message) for progress updates.
+        jobs: Number of pages recognised concurrently (default 1). Pages are
+              still rendered one at a time; at most 2 × jobs rendered pages
+              are held in memory.
 
     Returns:
         Extracted text content from all pages.
@@ -1386,6 +1819,8 @@ def extract_text_from_pdf_ocr(
     if pytesseract is None:
         raise ImportError("pytesseract 尚未安裝，請先執行 'pip install pytesseract>=0.3.10'。")
 
+    jobs = max(1, int(jobs))
+
     try:
         document = safe_open_pdf(input_pdf)
     except PermissionError as exc:
@@ -1395,45 +1830,56 @@ def extract_text_from_pdf_ocr(
         total_pages = document.page_count
         print(f"正在進行 OCR 文字識別（共 {total_pages} 頁，語言：{language}）...")
 
-        extracted_text = []
+        page_texts: List[str] = [""] * total_pages
 
         # Use tqdm only if no progress callback is provided (for CLI mode)
         page_iterator = range(total_pages)
         if progress_callback is None:
             page_iterator = tqdm(page_iterator, desc="OCR 識別", unit="頁")
 
-        for page_index in page_iterator:
-            # Call progress callback if provided (for GUI mode)
-            if progress_callback:
-                progress_callback(page_index + 1, total_pages, f"Processing page {page_index + 1} of {total_pages}")
-
-            page = document[page_index]
-
-            # Render page as image with specified DPI
-            matrix = fitz.Matrix(dpi / 72, dpi / 72)
-            pix = page.get_pixmap(matrix=matrix)
-
-            # Convert PyMuPDF pixmap to PIL Image
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
-
-            # Perform OCR on the image
-            try:
-                page_text = pytesseract.image_to_string(img, lang=language)
-                if page_text.strip():
-                    extracted_text.append(f"--- 第 {page_index + 1} 頁 ---\n")
-                    extracted_text.append(page_text)
-                    extracted_text.append("\n")
-            except pytesseract.TesseractNotFoundError as exc:
-                raise FileNotFoundError(
-                    "Tesseract OCR 引擎未安裝。請先安裝 Tesseract：\n"
-                    "  - Ubuntu/Debian: sudo apt-get install tesseract-ocr\n"
-                    "  - macOS: brew install tesseract\n"
-                    "  - Windows: 從 https://github.com/UB-Mannheim/tesseract/wiki 下載安裝"
-                ) from exc
+        # Render page as image with specified DPI
+        matrix = fitz.Matrix(dpi / 72, dpi / 72)
+
+        # Tesseract runs as a subprocess, so threads give real parallelism;
+        # PyMuPDF rendering stays on this thread.
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            pending: Dict[Any, int] = {}
+
+            def _collect(futures) -> None:
+                for future in futures:
+                    page_texts[pending.pop(future)] = future.result()
+
+            for page_index in page_iterator:
+                # Call progress callback if provided (for GUI mode)
+                if progress_callback:
+                    progress_callback(page_index + 1, total_pages, f"Processing page {page_index + 1} of {total_pages}")
+
+                pix = document[page_index].get_pixmap(matrix=matrix)
+                future = executor.submit(_ocr_png_page, pix.tobytes("png"), language)
+                pending[future] = page_index
+
+                if len(pending) >= jobs * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect(done)
+
+            _collect(list(pending))
+    except pytesseract.TesseractNotFoundError as exc:
+        raise FileNotFoundError(
+            "Tesseract OCR 引擎未安裝。請先安裝 Tesseract：\n"
+            "  - Ubuntu/Debian: sudo apt-get install tesseract-ocr\n"
+            "  - macOS: brew install tesseract\n"
+            "  - Windows: 從 https://github.com/UB-Mannheim/tesseract/wiki 下載安裝"
+        ) from exc
     finally:
         document.close()
 
+    extracted_text = []
+    for page_index, page_text in enumerate(page_texts):
+        if page_text.strip():
+            extracted_text.append(f"--- 第 {page_index + 1} 頁 ---\n")
+            extracted_text.append(page_text)
+            extracted_text.append("\n")
+
     result = "".join(extracted_text)
     print(f"✓ OCR 識別完成，共擷取 {len(result)} 個字元")
     return result
@@ -1531,6 +1977,7 @@ def ocr_pdf_to_text(
     language: str = "eng",
     dpi: int = 300,
     progress_callback=None,
+    jobs: int = 1,
 ) -> str:
     """
     Perform OCR on a PDF and save the extracted text to various formats.
@@ -1543,6 +1990,7 @@ def ocr_pdf_to_text(
         language: OCR language code (default "eng").
         dpi: DPI resolution for rendering pages (default 300).
         progress_callback: Optional callback function(current, total, message) for progress updates.
+        jobs: Number of pages recognised concurrently (default 1).
 
     Returns:
         Extracted text content.
@@ -1555,9 +2003,32 @@ def ocr_pdf_to_text(
         raise ValueError("請至少指定一個輸出格式（--docx、--odt 或 --txt）。")
 
     # Extract text using OCR
-    text = extract_text_from_pdf_ocr(input_pdf, language=language, dpi=dpi, progress_callback=progress_callback)
+    text = extract_text_from_pdf_ocr(
+        input_pdf, language=language, dpi=dpi, progress_callback=progress_callback, jobs=jobs
+    )
+
+    save_ocr_outputs(text, output_docx=output_docx, output_odt=output_odt, output_txt=output_txt)
+    return text
+
 
-    # Save to requested formats
+def save_ocr_outputs(
+    text: str,
+    output_docx: str | None = None,
+    output_odt: str | None = None,
+    output_txt: str | None = None,
+) -> None:
+    """
+    Save already extracted OCR text to the requested formats.
+
+    Args:
+        text: Text content to save.
+        output_docx: Optional path to save as Microsoft Word (.docx).
+        output_odt: Optional path to save as LibreOffice Writer (.odt).
+        output_txt: Optional path to save as plain text (.txt).
+
+    Raises:
+        Same exceptions as save_text_to_docx and save_text_to_odt.
+    """
     if output_docx:
         save_text_to_docx(text, output_docx)
 
@@ -1575,8 +2046,6 @@ def ocr_pdf_to_text(
         except OSError as exc:
             raise OSError(f"無法寫入輸出檔案：{output_txt}") from exc
 
-    return text
-
 
 def build_parser() -> "argparse.ArgumentParser":
     """Construct the CLI argument parser."""
@@ -1623,6 +2092,7 @@ def build_parser() -> "argparse.ArgumentParser":
     watermark_parser.add_argument("--size", type=int, default=36, help="字體大小（預設 36）")
     watermark_parser.add_argument("--alpha", type=float, default=0.3, help="透明度 0-1（預設 0.3）")
     watermark_parser.add_argument("--angle", type=int, default=0, choices=[0, 90, 180, 270], help="旋轉角度，僅支援 0/90/180/270（預設 0）")
+    watermark_parser.add_argument("--mode", default="text", choices=["text", "xobject"], help="text 逐頁排版；xobject 每種頁面尺寸排版一次後套用（預設 text）")
 
     optimize_parser = subparsers.add_parser("optimize", help="壓縮優化 PDF 檔案")
     optimize_parser.add_argument("input", help="輸入 PDF 檔案")
@@ -1682,6 +2152,13 @@ def build_parser() -> "argparse.ArgumentParser":
         default=300,
         help="頁面渲染 DPI 解析度（預設 300）",
     )
+    ocr_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="同時進行 OCR 的頁數（預設 1，數值越大越快但佔用記憶體越多）",
+    )
 
     diff_parser = subparsers.add_parser("diff", help="比較兩個 PDF 檔案的差異")
     diff_parser.add_argument("pdf1", help="第一個 PDF 檔案")
@@ -1750,6 +2227,7 @@ def main(argv: Sequence[str] | None = None) -> None:
                 size=args.size,
                 alpha=args.alpha,
                 angle=args.angle,
+                mode=args.mode,
             )
         elif args.command == "optimize":
             optimize_pdf(
@@ -1802,6 +2280,7 @@ def main(argv: Sequence[str] | None = None) -> None:
                 output_txt=args.txt,
                 language=args.language,
                 dpi=args.dpi,
+                jobs=args.jobs,
             )
         elif args.command == "diff":
             compare_pdfs(
@@ -58,18 +58,28 @@ def main():
     # Test 3: Check main window integration
     print_test("Test 3: Main Window Integration")
     try:
-        from gui.main_window import MainWindow
-        import inspect
-
-        method = getattr(MainWindow, '_update_workspace')
-        source = inspect.getsource(method)
+        from gui.main_window import MainWindow, _DIALOG_SPECS
+
+        features = {
+            'merge': 'MergeDialog',
+            'split': 'SplitDialog',
+            'info': 'InfoDialog',
+            'delete': 'DeleteDialog',
+            'rotate': 'RotateDialog',
+            'watermark': 'WatermarkDialog',
+            'optimize': 'OptimizeDialog'
+        }
+        for feature, class_name in features.items():
+            if feature not in _DIALOG_SPECS:
+                print(f"  [FAIL] {feature.capitalize()} handler NOT found")
+                all_tests_pass = False
+                continue
 
-        features = ['merge', 'split', 'info', 'delete', 'rotate', 'watermark', 'optimize']
-        for feature in features:
-            if f'feature == "{feature}"' in source:
+            cls = MainWindow._resolve_dialog(feature)
+            if cls is not None and cls.__name__ == class_name:
                 print(f"  [PASS] {feature.capitalize()} handler found")
             else:
-                print(f"  [FAIL] {feature.capitalize()} handler NOT found")
+                print(f"  [FAIL] {feature.capitalize()} handler resolves to {cls!r}")
                 all_tests_pass = False
 
     except Exception as e:
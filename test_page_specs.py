@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Behaviour tests for the pure page helpers used by the GUI.
+
+Covers the split dialog's range parser, the page spec syntax check and
+the header-only page count scan. No display or PDF library is needed.
+Runs under pytest or directly: python test_page_specs.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from gui.dialogs.split_dialog import _parse_page_ranges
+from gui.utils.helpers import _scan_page_count, is_page_spec
+
+
+def _raises_value_error(spec: str, page_count: int) -> bool:
+    """Return True if _parse_page_ranges rejects spec."""
+    try:
+        _parse_page_ranges(spec, page_count)
+    except ValueError:
+        return True
+    return False
+
+
+def _write_pdf(directory: Path, name: str, page_count: int) -> Path:
+    """Write a minimal PDF with a classic xref table and page_count pages."""
+    first_page = 3
+    kids = " ".join(f"{first_page + i} 0 R" for i in range(page_count))
+    bodies = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode(),
+    ]
+    bodies += [b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>"] * page_count
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(bodies, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+
+    xref_pos = len(out)
+    out += b"xref\n0 %d\n" % (len(bodies) + 1)
+    out += b"0000000000 65535 f\r\n"
+    for offset in offsets:
+        out += b"%010d 00000 n\r\n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(bodies) + 1)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref_pos
+
+    path = directory / name
+    path.write_bytes(bytes(out))
+    return path
+
+
+def test_parse_single_pages_and_ranges():
+    assert _parse_page_ranges("1", 10) == [(0, 0)]
+    assert _parse_page_ranges("2-4", 10) == [(1, 3)]
+    assert _parse_page_ranges("1-3, 5 ,7-8", 10) == [(0, 2), (4, 4), (6, 7)]
+
+
+def test_parse_open_ended_ranges():
+    assert _parse_page_ranges("-2", 10) == [(0, 1)]
+    assert _parse_page_ranges("10-", 12) == [(9, 11)]
+    assert _parse_page_ranges("3-3", 3) == [(2, 2)]
+
+
+def test_parse_merges_overlapping_and_adjacent_ranges():
+    assert _parse_page_ranges("1-2,3", 10) == [(0, 2)]
+    assert _parse_page_ranges("5-8,1-6", 10) == [(0, 7)]
+    assert _parse_page_ranges("7,1", 10) == [(0, 0), (6, 6)]
+    assert _parse_page_ranges("2,2", 10) == [(1, 1)]
+
+
+def test_parse_rejects_empty_items():
+    for spec in ("", ",", "1-3,", ",1", "1,,3", "-", " , "):
+        assert _raises_value_error(spec, 10), spec
+
+
+def test_parse_rejects_malformed_items():
+    for spec in ("a", "1-a", "1--3", "1 -3", "1-3-5", "1.5"):
+        assert _raises_value_error(spec, 10), spec
+
+
+def test_parse_rejects_out_of_bounds_ranges():
+    for spec in ("0", "11", "3-1", "9-11", "0-2"):
+        assert _raises_value_error(spec, 10), spec
+
+
+def test_is_page_spec_accepts_valid_specs():
+    for spec in ("1", "1,3,5-7,10-", "-3", "1-", " 2 , 4-6 "):
+        assert is_page_spec(spec), spec
+
+
+def test_is_page_spec_rejects_invalid_specs():
+    for spec in ("", "-", "1-3,", ",1", "1,,3", "1--3", "a", "1-a"):
+        assert not is_page_spec(spec), spec
+
+
+def test_scan_page_count_reads_classic_xref():
+    with tempfile.TemporaryDirectory() as tmp:
+        assert _scan_page_count(str(_write_pdf(Path(tmp), "one.pdf", 1))) == 1
+        assert _scan_page_count(str(_write_pdf(Path(tmp), "many.pdf", 7))) == 7
+
+
+def test_scan_page_count_gives_up_without_classic_xref():
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = _write_pdf(Path(tmp), "stream.pdf", 3)
+        # Point startxref somewhere that is not an "xref" table, as an
+        # xref stream would
+        data = pdf.read_bytes()
+        start = data.rindex(b"startxref\n") + len(b"startxref\n")
+        pdf.write_bytes(data[:start] + b"9\n%%EOF\n")
+        assert _scan_page_count(str(pdf)) is None
+
+        garbage = Path(tmp) / "garbage.pdf"
+        garbage.write_bytes(b"not a pdf at all")
+        assert _scan_page_count(str(garbage)) is None
+
+
+def main() -> int:
+    tests = [
+        (name, func) for name, func in sorted(globals().items())
+        if name.startswith("test_") and callable(func)
+    ]
+    failed = 0
+    for name, func in tests:
+        try:
+            func()
+            print(f"  [PASS] {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAIL] {name}: {e}")
+
+    print()
+    print(f"  {len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())